@@ -0,0 +1 @@
+"""Benchmarks of the application, run with ``python -m benchmarks.<name>``."""
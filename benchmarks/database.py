@@ -0,0 +1,30 @@
+"""Throwaway databases for the benchmarks."""
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from interview_tracker.db.meta import meta
+from interview_tracker.db.models import load_all_models
+from interview_tracker.db.utils import create_database, drop_database
+from interview_tracker.settings import settings
+
+
+@asynccontextmanager
+async def bench_database(db_base: str) -> AsyncIterator[AsyncEngine]:
+    """
+    Create a database with the tables of the application, dropped on exit.
+
+    :param db_base: name of the database.
+    :yield: engine connected to the database.
+    """
+    load_all_models()
+    await create_database(db_base)
+    engine = create_async_engine(str(settings.db_url.with_path(f"/{db_base}")))
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(meta.create_all)
+        yield engine
+    finally:
+        await engine.dispose()
+        await drop_database(db_base)
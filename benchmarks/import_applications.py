@@ -0,0 +1,156 @@
+"""
+Benchmark of the bulk import endpoint.
+
+Posts the same batch of applications to ``POST /api/applications/import``
+in every supported format and reports the time and throughput of each.
+Authorization is stubbed out, everything else runs as in production.
+
+Needs a running database configured like the application::
+
+    python -m benchmarks.import_applications --rows 10000
+"""
+import argparse
+import asyncio
+import csv
+import io
+import json
+from typing import Any, Dict, List, Tuple
+
+from benchmarks.database import bench_database
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from interview_tracker.db.dependencies import get_db_session
+from interview_tracker.services.cache.applications import ApplicationsCache
+from interview_tracker.services.cache.backends import MemoryCacheBackend
+from interview_tracker.services.cache.dependency import get_applications_cache
+from interview_tracker.settings import settings
+from interview_tracker.web.application import get_app
+from interview_tracker.web.authorization.dependencies import authorization
+from interview_tracker.web.authorization.json_web_token import JsonWebToken
+
+BENCH_DB_BASE = f"{settings.db_base}_bench"
+DEFAULT_ROWS = 10000
+MIB = 1024 * 1024
+REPORT_LINE = (
+    "{name:>6}: {elapsed_ms:8.1f} ms {rows_per_s:10.0f} rows/s "
+    "{body_mib:6.1f} MiB body"
+)
+
+ImportBody = Tuple[str, str, bytes]
+
+
+def make_rows(rows: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "company_name": f"Company {index}",
+            "job_title": "Backend engineer",
+            "status": "Applied",
+            "attractiveness_scale": index % 5 + 1,
+            "status_category": "blue",
+            "on_site_remote": "remote",
+            "notes": "Imported from a spreadsheet",
+            "timelines": [
+                {"name": "Applied", "value": "2023-07-01"},
+                {"name": "Phone screen", "value": "2023-07-08"},
+            ],
+        }
+        for index in range(rows)
+    ]
+
+
+def make_csv_body(rows: List[Dict[str, Any]]) -> bytes:
+    csv_body = io.StringIO()
+    writer = csv.DictWriter(csv_body, fieldnames=list(rows[0]))
+    writer.writeheader()
+    for row in rows:
+        timelines = json.dumps(row["timelines"])
+        writer.writerow({**row, "timelines": timelines})
+    return csv_body.getvalue().encode()
+
+
+def make_bodies(rows: List[Dict[str, Any]]) -> List[ImportBody]:
+    """
+    Encode the applications in every import format.
+
+    :param rows: applications to import.
+    :return: name, content type and body of each format.
+    """
+    ndjson_body = "\n".join(json.dumps(row) for row in rows)
+    return [
+        ("json", "application/json", json.dumps(rows).encode()),
+        ("ndjson", "application/x-ndjson", ndjson_body.encode()),
+        ("csv", "text/csv", make_csv_body(rows)),
+    ]
+
+
+def fake_authorization() -> JsonWebToken:
+    jwt_token = JsonWebToken("bench")
+    jwt_token.payload = {"sub": "auth0|bench"}
+    jwt_token.is_valid = True
+    return jwt_token
+
+
+def make_app(session: AsyncSession) -> FastAPI:
+    """
+    Application using the benchmark database, without authorization.
+
+    :param session: session of the benchmark database.
+    :return: fastAPI application.
+    """
+    app = get_app()
+    cache = ApplicationsCache(MemoryCacheBackend(max_size=1), ttl=1)
+    app.dependency_overrides[get_db_session] = lambda: session
+    app.dependency_overrides[get_applications_cache] = lambda: cache
+    app.dependency_overrides[authorization] = fake_authorization
+    return app
+
+
+async def measure(client: AsyncClient, body: ImportBody, rows: int) -> Dict[str, Any]:
+    """
+    Time one import.
+
+    :param client: client of the application.
+    :param body: name, content type and body of the import.
+    :param rows: number of applications in the body.
+    :return: figures of the report line.
+    :raises RuntimeError: if not every application was imported.
+    """
+    name, content_type, content = body
+    response = await client.post(
+        "/api/applications/import",
+        content=content,
+        headers={"Authorization": "Bearer bench", "Content-Type": content_type},
+        timeout=None,
+    )
+    elapsed = response.elapsed.total_seconds()
+    if response.json().get("imported") != rows:
+        raise RuntimeError(response.text)
+    return {
+        "name": name,
+        "elapsed_ms": elapsed * 1000,
+        "rows_per_s": rows / elapsed,
+        "body_mib": len(content) / MIB,
+    }
+
+
+async def compare(session: AsyncSession, rows: int) -> None:
+    print(f"{rows} rows")  # noqa: WPS421
+    async with AsyncClient(app=make_app(session), base_url="http://bench") as client:
+        for body in make_bodies(make_rows(rows)):
+            stats = await measure(client, body, rows)
+            print(REPORT_LINE.format(**stats))  # noqa: WPS421
+
+
+async def main(rows: int) -> None:
+    async with bench_database(BENCH_DB_BASE) as engine:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await compare(session, rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows))
@@ -0,0 +1,182 @@
+"""
+Benchmark of the applications list query and serialization.
+
+Compares loading full ORM entities and serializing them through pydantic
+and ``JSONResponse`` with the projected rows + ujson fast path used by
+``GET /api/applications``.
+
+Needs a running database configured like the application::
+
+    python -m benchmarks.list_applications --rows 10000
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from benchmarks.database import bench_database
+from fastapi.responses import JSONResponse
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from interview_tracker.db.data_access_layer.application import get_applications_page
+from interview_tracker.db.models.main_model import Application, User
+from interview_tracker.settings import settings
+from interview_tracker.web.api.applications.get.schemas.application import (
+    ApplicationBase,
+    ApplicationsResponse,
+    render_applications,
+)
+
+BENCH_DB_BASE = f"{settings.db_base}_bench"
+DEFAULT_ROWS = 10000
+NOTES_LENGTH = 2000
+KIB = 1024
+MIB = KIB * KIB
+REPORT_LINE = (
+    "{name:>6}: {best_ms:8.1f} ms {rows_per_s:10.0f} rows/s "
+    "{peak_mib:7.1f} MiB peak {body_kib:7.0f} KiB body"
+)
+
+ListApplications = Callable[[AsyncSession, int, int], Awaitable[bytes]]
+
+
+async def legacy_list(session: AsyncSession, user_id: int, rows: int) -> bytes:
+    """
+    Full entities, pydantic models and stdlib JSON.
+
+    :param session: current session.
+    :param user_id: owner of the applications.
+    :param rows: number of applications to list.
+    :return: JSON document.
+    """
+    query = select(Application).filter(Application.user_id == user_id).limit(rows)
+    result = await session.execute(query)
+    applications = [
+        ApplicationBase(
+            id=app.id,
+            company_name=app.company_name,
+            job_title=app.job_title,
+            status=app.status,
+            attractiveness_scale=app.attractiveness_scale,
+            status_category=app.status_category,
+        )
+        for app in result.scalars().all()
+    ]
+    content = ApplicationsResponse(applications=applications).dict(exclude_none=True)
+    return JSONResponse(content=content).body
+
+
+async def fast_list(session: AsyncSession, user_id: int, rows: int) -> bytes:
+    """
+    Projected rows dumped with ujson.
+
+    :param session: current session.
+    :param user_id: owner of the applications.
+    :param rows: number of applications to list.
+    :return: JSON document.
+    """
+    applications = await get_applications_page(user_id, session, limit=rows)
+    return render_applications(applications, next_cursor=None)
+
+
+async def seed(session_maker: async_sessionmaker[AsyncSession], rows: int) -> int:
+    async with session_maker() as session:
+        return await seed_user(session, rows)
+
+
+async def seed_user(session: AsyncSession, rows: int) -> int:
+    user_id = await session.scalar(
+        insert(User).values(sub="bench").returning(User.id),
+    )
+    await session.execute(
+        insert(Application),
+        [
+            {
+                "user_id": user_id,
+                "company_name": f"Company {index}",
+                "job_title": "Backend engineer",
+                "status": "Applied",
+                "attractiveness_scale": index % 5 + 1,
+                "status_category": "blue",
+                "notes": "n" * NOTES_LENGTH,
+                "archived": False,
+            }
+            for index in range(rows)
+        ],
+    )
+    await session.commit()
+    return user_id  # type: ignore
+
+
+async def measure_once(
+    session_maker: async_sessionmaker[AsyncSession],
+    list_applications: ListApplications,
+    user_id: int,
+    rows: int,
+) -> Tuple[float, int, int]:
+    """
+    Time one listing.
+
+    :param session_maker: sessions of the benchmark database.
+    :param list_applications: implementation of the listing.
+    :param user_id: owner of the applications.
+    :param rows: number of applications to list.
+    :return: seconds, peak of the allocated memory and size of the body.
+    """
+    async with session_maker() as session:
+        tracemalloc.start()
+        started_at = time.perf_counter()
+        body = await list_applications(session, user_id, rows)
+        elapsed = time.perf_counter() - started_at
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak, len(body)
+
+
+async def measure(
+    session_maker: async_sessionmaker[AsyncSession],
+    list_applications: ListApplications,
+    user_id: int,
+    rows: int,
+    repeats: int,
+) -> Dict[str, Any]:
+    runs: List[Tuple[float, int, int]] = [
+        await measure_once(session_maker, list_applications, user_id, rows)
+        for _ in range(repeats)
+    ]
+    best, peak, body_size = min(runs)
+    return {
+        "best_ms": best * 1000,
+        "rows_per_s": rows / best,
+        "peak_mib": peak / MIB,
+        "body_kib": body_size / KIB,
+    }
+
+
+async def compare(
+    session_maker: async_sessionmaker[AsyncSession],
+    user_id: int,
+    rows: int,
+    repeats: int,
+) -> None:
+    print(f"{rows} rows, best of {repeats}")  # noqa: WPS421
+    for name, list_applications in (("legacy", legacy_list), ("fast", fast_list)):
+        stats = await measure(session_maker, list_applications, user_id, rows, repeats)
+        print(REPORT_LINE.format(name=name, **stats))  # noqa: WPS421
+
+
+async def main(rows: int, repeats: int) -> None:
+    async with bench_database(BENCH_DB_BASE) as engine:
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        user_id = await seed(session_maker, rows)
+        await compare(session_maker, user_id, rows, repeats)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeats))
@@ -0,0 +1,556 @@
+"""
+Load test of the applications API over HTTP.
+
+Starts the server with ``python -m interview_tracker`` on a fresh
+database and drives a mix of list, detail, create, update and delete
+requests from concurrent clients, every one of them a different user.
+Tokens are signed offline and the server fetches the signing key from
+a stub JWKS endpoint, no auth0 tenant is needed. Needs a running
+database configured like the application::
+
+    python -m benchmarks.load_test --concurrency 32 --duration 30
+    python -m benchmarks.load_test --output after.json --compare before.json
+
+Throughput, latency percentiles and status codes, overall and by
+endpoint, are written to a JSON baseline file. The clients run in this
+process: with many server workers, check that it isn't the bottleneck.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import socket
+import subprocess  # noqa: S404
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import (  # noqa: WPS235
+    Any,
+    DefaultDict,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+import httpx
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from interview_tracker.db.meta import meta
+from interview_tracker.db.models import load_all_models
+from interview_tracker.db.utils import create_database, drop_database
+from interview_tracker.settings import settings
+from interview_tracker.web.authorization.testing import StubJwksServer, TokenIssuer
+
+REPOSITORY = Path(__file__).parent.parent
+BENCH_DB_BASE = f"{settings.db_base}_load"
+AUTH0_DOMAIN = "load-test.invalid"
+AUTH0_AUDIENCE = "https://load-test.invalid/api"
+DEFAULT_MIX = "list=60,detail=25,create=5,update=7,delete=3"
+PERCENTILES = (50, 90, 99)
+STATUSES = ("Applied", "Phone screen", "Onsite", "Offer", "Rejected")
+COMPANIES = 10000
+MAX_NOTE_SENTENCES = 20
+# big enough for the list to return every application of a user
+LIST_LIMIT = 200
+TOKEN_TTL_SECONDS = 24 * 60 * 60
+HTTP_TIMEOUT_SECONDS = 30
+SERVER_TIMEOUT_SECONDS = 30
+READY_POLL_SECONDS = 0.2
+DEFAULT_CONCURRENCY = 16
+DEFAULT_DURATION_SECONDS = 30
+DEFAULT_APPLICATIONS = 50
+
+# results of a run, overall or for an endpoint, as saved in the JSON file
+Summary = Dict[str, Any]
+
+
+def parse_mix(mix: str) -> Dict[str, int]:
+    weights = dict(_mix_weight(item) for item in mix.split(","))
+    unknown = set(weights) - set(Client.endpoints)
+    if unknown:
+        unknown_endpoints = ", ".join(sorted(unknown))
+        raise argparse.ArgumentTypeError(f"unknown endpoints: {unknown_endpoints}")
+    return weights
+
+
+def _mix_weight(item: str) -> Tuple[str, int]:
+    endpoint, weight = item.split("=")
+    return endpoint.strip(), int(weight)
+
+
+def application_body(rng: random.Random) -> Dict[str, Any]:
+    company = rng.randrange(COMPANIES)
+    return {
+        "company_name": f"Company {company}",
+        "job_title": "Backend engineer",
+        "status": rng.choice(STATUSES),
+        "attractiveness_scale": rng.randint(1, 5),
+        "status_category": rng.choice(("red", "blue", "green")),
+        "location": "Remote",
+        "on_site_remote": "remote",
+        "notes": "Referred by a friend. " * rng.randrange(MAX_NOTE_SENTENCES),
+        "timelines": [{"name": "Applied", "value": "2023-07-21"}],
+    }
+
+
+class Recorder:
+    """Latency and status of every request, by endpoint."""
+
+    def __init__(self) -> None:
+        self.latencies: DefaultDict[str, List[float]] = defaultdict(list)
+        self.statuses: DefaultDict[str, Counter[str]] = defaultdict(Counter)
+
+    def record(self, endpoint: str, status: str, latency: float) -> None:
+        self.latencies[endpoint].append(latency)
+        self.statuses[endpoint][status] += 1
+
+
+class Workload(NamedTuple):
+    """Requests the clients send, and the applications they keep."""
+
+    mix: Dict[str, int]
+    min_applications: int
+
+
+class Client:
+    """
+    One user of the API, sending requests one after the other.
+
+    The ids of its applications are learned from the list responses,
+    like the front end does: creating an application returns no body.
+    """
+
+    endpoints = ("list", "detail", "create", "update", "delete")
+
+    def __init__(
+        self,
+        http: httpx.AsyncClient,
+        token: str,
+        workload: Workload,
+        seed: int,
+    ) -> None:
+        self.http = http
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.rng = random.Random(seed)  # noqa: S311
+        self.workload = workload
+        self.application_ids: Set[int] = set()
+
+    async def run(self, recorder: Recorder, deadline: float) -> None:
+        endpoints = list(self.workload.mix)
+        weights = list(self.workload.mix.values())
+        while time.perf_counter() < deadline:
+            endpoint = self.rng.choices(endpoints, weights)[0]
+            await self.request(recorder, self._feasible(endpoint))
+
+    async def request(self, recorder: Recorder, endpoint: str) -> None:
+        started_at = time.perf_counter()
+        try:
+            response = await self._send(endpoint)
+        except httpx.HTTPError as exc:
+            status = type(exc).__name__
+        else:
+            status = str(response.status_code)
+            if endpoint == "list" and response.status_code == httpx.codes.OK:
+                self.application_ids = {
+                    application["id"] for application in response.json()["applications"]
+                }
+        recorder.record(endpoint, status, time.perf_counter() - started_at)
+
+    def _feasible(self, endpoint: str) -> str:
+        """
+        Keep the number of applications around its initial value.
+
+        :param endpoint: endpoint drawn from the mix.
+        :return: endpoint to request instead.
+        """
+        too_few = len(self.application_ids) <= self.workload.min_applications
+        if endpoint == "delete" and too_few:
+            return "create"
+        if endpoint in {"detail", "update", "delete"} and not self.application_ids:
+            return "list"
+        return endpoint
+
+    async def _send(self, endpoint: str) -> httpx.Response:  # noqa: WPS212
+        if endpoint == "list":
+            return await self.http.get(
+                "/api/applications/",
+                params={"sort": "-id", "limit": LIST_LIMIT},
+                headers=self.headers,
+            )
+        if endpoint == "create":
+            return await self.http.post(
+                "/api/applications/",
+                json=application_body(self.rng),
+                headers=self.headers,
+            )
+
+        application_id = self.rng.choice(sorted(self.application_ids))
+        url = f"/api/applications/{application_id}"
+        if endpoint == "detail":
+            return await self.http.get(url, headers=self.headers)
+        if endpoint == "update":
+            return await self.http.put(
+                url,
+                json={
+                    "status": self.rng.choice(STATUSES),
+                    "attractiveness_scale": self.rng.randint(1, 5),
+                },
+                headers=self.headers,
+            )
+        self.application_ids.discard(application_id)
+        return await self.http.delete(url, headers=self.headers)
+
+
+def percentile(sorted_values: Sequence[float], rank: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    :param sorted_values: values in ascending order.
+    :param rank: percentile, between 0 and 100.
+    :return: value at that rank.
+    """
+    index = math.ceil(rank / 100 * len(sorted_values)) - 1
+    return sorted_values[max(index, 0)]
+
+
+def summarize(
+    latencies: List[float],
+    statuses: Counter[str],
+    duration: float,
+) -> Dict[str, Any]:
+    latencies = sorted(latencies)
+    failed = sum(
+        count for status, count in statuses.items() if not status.startswith("2")
+    )
+    summary: Dict[str, Any] = {
+        "requests": len(latencies),
+        "errors": failed,
+        "rps": round(len(latencies) / duration, 1),
+        "statuses": dict(sorted(statuses.items())),
+    }
+    if latencies:
+        summary["latency_ms"] = {
+            **{
+                f"p{rank}": round(percentile(latencies, rank) * 1000, 2)
+                for rank in PERCENTILES
+            },
+            "mean": round(sum(latencies) / len(latencies) * 1000, 2),
+            "max": round(latencies[-1] * 1000, 2),
+        }
+    return summary
+
+
+def git_revision() -> Optional[str]:
+    try:
+        revision = subprocess.run(  # noqa: S603, S607
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=REPOSITORY,
+        ).stdout.strip()
+        changes = subprocess.run(  # noqa: S603, S607
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=REPOSITORY,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{revision}-dirty" if changes else revision
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, workers: int, jwks_uri: str) -> subprocess.Popen[bytes]:
+    env = {
+        **os.environ,
+        "INTERVIEW_TRACKER_HOST": "127.0.0.1",
+        "INTERVIEW_TRACKER_PORT": str(port),
+        "INTERVIEW_TRACKER_WORKERS_COUNT": str(workers),
+        "INTERVIEW_TRACKER_RELOAD": "False",
+        "INTERVIEW_TRACKER_LOG_LEVEL": "WARNING",
+        "INTERVIEW_TRACKER_ACCESS_LOG": "False",
+        "INTERVIEW_TRACKER_DB_BASE": BENCH_DB_BASE,
+        "INTERVIEW_TRACKER_DB_CHECK_SCHEMA": "False",
+        "INTERVIEW_TRACKER_AUTH0_DOMAIN": AUTH0_DOMAIN,
+        "INTERVIEW_TRACKER_AUTH0_AUDIENCE": AUTH0_AUDIENCE,
+        "INTERVIEW_TRACKER_AUTH0_JWKS_URI": jwks_uri,
+    }
+    return subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", "interview_tracker"],
+        env=env,
+    )
+
+
+async def wait_until_ready(
+    http: httpx.AsyncClient,
+    server: "subprocess.Popen[bytes]",
+    timeout: float = SERVER_TIMEOUT_SECONDS,
+) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"server exited with code {server.returncode}")
+        try:
+            response = await http.get("/api/health/ready")
+        except httpx.TransportError:
+            response = None
+        if response is not None and response.status_code == httpx.codes.OK:
+            return
+        await asyncio.sleep(READY_POLL_SECONDS)
+    raise RuntimeError(f"server not ready after {timeout} seconds")
+
+
+async def run_load(
+    clients: List[Client],
+    duration: float,
+) -> Dict[str, Any]:
+    recorder = Recorder()
+    started_at = time.perf_counter()
+    deadline = started_at + duration
+    await asyncio.gather(*(client.run(recorder, deadline) for client in clients))
+    return summarize_recorder(recorder, time.perf_counter() - started_at)
+
+
+def summarize_recorder(recorder: Recorder, elapsed: float) -> Dict[str, Any]:
+    all_latencies: List[float] = []
+    all_statuses: Counter[str] = Counter()
+    endpoints = {}
+    for endpoint in Client.endpoints:
+        if endpoint not in recorder.latencies:
+            continue
+        all_latencies.extend(recorder.latencies[endpoint])
+        all_statuses.update(recorder.statuses[endpoint])
+        endpoints[endpoint] = summarize(
+            recorder.latencies[endpoint],
+            recorder.statuses[endpoint],
+            elapsed,
+        )
+    return {
+        "total": summarize(all_latencies, all_statuses, elapsed),
+        "endpoints": endpoints,
+    }
+
+
+async def create_bench_database() -> None:
+    load_all_models()
+    await create_database(BENCH_DB_BASE)
+    engine = create_async_engine(str(settings.db_url.with_path(f"/{BENCH_DB_BASE}")))
+    async with engine.begin() as conn:
+        await conn.run_sync(meta.create_all)
+    await engine.dispose()
+
+
+def make_clients(
+    http: httpx.AsyncClient,
+    issuer: TokenIssuer,
+    args: argparse.Namespace,
+) -> List[Client]:
+    workload = Workload(mix=args.mix, min_applications=args.applications // 2)
+    return [
+        Client(
+            http,
+            issuer.issue(f"load-{index}", ttl=TOKEN_TTL_SECONDS),
+            workload,
+            seed=args.seed + index,
+        )
+        for index in range(args.concurrency)
+    ]
+
+
+async def seed_applications(clients: List[Client], applications: int) -> None:
+    """
+    Give every user its applications, then let it learn their ids.
+
+    :param clients: users of the API.
+    :param applications: applications every user starts with.
+    """
+    seeding = Recorder()
+    await asyncio.gather(
+        *(
+            client.request(seeding, "create")
+            for client in clients
+            for _ in range(applications)
+        ),
+    )
+    await asyncio.gather(*(client.request(seeding, "list") for client in clients))
+
+
+async def drive(
+    port: int,
+    server: "subprocess.Popen[bytes]",
+    issuer: TokenIssuer,
+    args: argparse.Namespace,
+) -> Dict[str, Any]:
+    """
+    Seed the database, warm the server up, then measure it.
+
+    :param port: port the server listens on.
+    :param server: server process.
+    :param issuer: signer of the users' tokens.
+    :param args: command line arguments.
+    :return: summary of the measured run.
+    """
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{port}",
+        limits=httpx.Limits(
+            max_connections=args.concurrency,
+            max_keepalive_connections=args.concurrency,
+        ),
+        timeout=HTTP_TIMEOUT_SECONDS,
+    ) as http:
+        await wait_until_ready(http, server)
+        clients = make_clients(http, issuer, args)
+        await seed_applications(clients, args.applications)
+        await run_load(clients, args.warmup)
+        return await run_load(clients, args.duration)
+
+
+def run_metadata(args: argparse.Namespace) -> Dict[str, Any]:
+    return {
+        "revision": git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "config": {
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "warmup": args.warmup,
+            "workers": args.workers,
+            "applications": args.applications,
+            "mix": args.mix,
+            "seed": args.seed,
+        },
+    }
+
+
+async def benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    await create_bench_database()
+    issuer = TokenIssuer(issuer=f"https://{AUTH0_DOMAIN}/", audience=AUTH0_AUDIENCE)
+    jwks_server = StubJwksServer()
+    jwks_server.keys.append(issuer.jwk)
+    jwks_server.start()
+    port = free_port()
+    server = start_server(port, args.workers, jwks_server.url)
+    try:  # noqa: WPS501
+        results = await drive(port, server, issuer, args)
+    finally:
+        server.terminate()
+        server.wait(timeout=SERVER_TIMEOUT_SECONDS)
+        jwks_server.stop()
+        await drop_database(BENCH_DB_BASE)
+
+    return {**run_metadata(args), **results}
+
+
+def change(current: float, previous: Optional[float]) -> str:
+    if not previous:
+        return ""
+    ratio = (current - previous) / previous
+    return f" ({ratio:+.0%})"
+
+
+def report(results: Summary, baseline: Optional[Summary]) -> None:
+    rows = [("total", results["total"])]
+    rows.extend(results["endpoints"].items())
+    for name, summary in rows:
+        previous = _previous_summary(baseline, name)
+        print(_report_line(name, summary, previous))  # noqa: WPS421
+
+
+def _previous_summary(baseline: Optional[Summary], name: str) -> Summary:
+    if baseline is None:
+        return {}
+    if name == "total":
+        return baseline["total"]
+    endpoints = baseline["endpoints"]
+    return endpoints.get(name, {})
+
+
+def _report_line(name: str, summary: Summary, previous: Summary) -> str:
+    rps = summary["rps"]
+    rps_change = change(rps, previous.get("rps"))
+    errors = summary["errors"]
+    columns = [
+        f"{name:<7} {rps:8.1f} req/s{rps_change}",
+        *_latency_columns(summary, previous),
+        f"errors {errors}",
+    ]
+    return "  ".join(columns)
+
+
+def _latency_columns(summary: Summary, previous: Summary) -> List[str]:
+    latency: Dict[str, float] = summary.get("latency_ms", {})
+    previous_latency: Dict[str, float] = previous.get("latency_ms", {})
+    keys = {f"p{rank}" for rank in PERCENTILES}
+    return [
+        _latency_column(key, milliseconds, previous_latency.get(key))
+        for key, milliseconds in latency.items()
+        if key in keys
+    ]
+
+
+def _latency_column(key: str, milliseconds: float, previous: Optional[float]) -> str:
+    latency_change = change(milliseconds, previous)
+    return f"{key} {milliseconds:7.1f} ms{latency_change}"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    _add_load_arguments(parser)
+    parser.add_argument("--output", default="load_test.json")
+    parser.add_argument("--compare", help="baseline file to compare with")
+    return parser.parse_args()
+
+
+def _add_load_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION_SECONDS)
+    parser.add_argument("--warmup", type=float, default=5)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--applications",
+        type=int,
+        default=DEFAULT_APPLICATIONS,
+        help="applications every user starts with",
+    )
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def load_baseline(path: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not path:
+        return None
+    with open(path) as baseline_file:
+        return json.load(baseline_file)
+
+
+def main() -> None:
+    args = parse_args()
+    baseline = load_baseline(args.compare)
+    results = asyncio.run(benchmark(args))
+    with open(args.output, "w") as output_file:
+        json.dump(results, output_file, indent=2)
+        output_file.write("\n")
+    report(results, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Benchmark of the request throughput with the access log on and off.
+
+Sends requests straight to the ASGI app of a trivial route and writes
+the logs to a temporary file, in every logging mode. No server nor
+database is needed::
+
+    python -m benchmarks.logging_throughput --requests 20000
+"""
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from typing import IO, Any, Dict, NamedTuple, Optional
+
+from fastapi import FastAPI
+from loguru import logger
+from starlette.types import Message
+
+from interview_tracker.logger import JsonSink, QueuedSink, StreamSink
+from interview_tracker.web.access_log import AccessLogMiddleware
+
+SCOPE = {
+    "type": "http",
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/items/1",
+    "raw_path": b"/items/1",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [],
+    "client": ("127.0.0.1", 50000),
+    "server": ("test", 80),
+}
+DEFAULT_REQUESTS = 20000
+# a tenth of the requests are sent first to warm up
+WARM_UP_SHARE = 10
+
+REPORT_LINE = "{name:<28} {throughput:8.0f} req/s {share:6.0%}"
+
+
+class Mode(NamedTuple):
+    """Format, sink and sampling of the access log; no log if ``log_format`` is None."""
+
+    name: str
+    log_format: Optional[str]
+    enqueue: bool
+    sample_rate: float
+
+
+MODES = (
+    Mode("off", None, enqueue=False, sample_rate=1.0),
+    Mode("text", "text", enqueue=False, sample_rate=1.0),
+    Mode("json", "json", enqueue=False, sample_rate=1.0),
+    Mode("json, enqueued", "json", enqueue=True, sample_rate=1.0),
+    Mode("json, enqueued, 10% sampled", "json", enqueue=True, sample_rate=0.1),
+)
+
+
+def make_app(sample_rate: Optional[float]) -> FastAPI:
+    """
+    Build an app with a single route.
+
+    :param sample_rate: share of the requests logged, None for no access log.
+    :return: ASGI app.
+    """
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> Dict[str, int]:  # noqa: WPS430
+        return {"id": item_id}
+
+    if sample_rate is not None:
+        app.add_middleware(AccessLogMiddleware, sample_rate=sample_rate)
+    return app
+
+
+def make_sink(log_file: IO[str], log_format: str, enqueue: bool) -> Any:
+    """
+    Build the sink of a logging mode.
+
+    :param log_file: file the logs are written to.
+    :param log_format: text or json.
+    :param enqueue: whether a writer thread writes the logs.
+    :return: loguru sink.
+    """
+    if log_format == "json":
+        return QueuedSink(JsonSink(log_file)) if enqueue else JsonSink(log_file)
+    return QueuedSink(StreamSink(log_file)) if enqueue else log_file
+
+
+async def measure(app: FastAPI, requests: int) -> float:
+    """
+    Send requests straight to the app.
+
+    :param app: ASGI app.
+    :param requests: requests to send.
+    :return: requests per second, queued logs not written yet excluded.
+    """
+
+    async def receive() -> Message:  # noqa: WPS430
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:  # noqa: WPS430
+        """
+        Drop the response.
+
+        :param message: ASGI message.
+        """
+
+    started_at = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(SCOPE), receive, send)
+    return requests / (time.perf_counter() - started_at)
+
+
+async def measure_mode(log_file: IO[str], mode: Mode, requests: int) -> float:
+    """
+    Measure the throughput in a logging mode.
+
+    :param log_file: file the logs are written to.
+    :param mode: logging mode, as in MODES.
+    :param requests: requests to send.
+    :return: requests per second.
+    """
+    if mode.log_format is None:
+        return await measure(make_app(sample_rate=None), requests)
+
+    sink = make_sink(log_file, mode.log_format, mode.enqueue)
+    logger.add(sink, level="INFO")
+    app = make_app(mode.sample_rate)
+    await measure(app, requests // WARM_UP_SHARE)
+    throughput = await measure(app, requests)
+    logger.remove()
+    if mode.enqueue:
+        sink.stop()
+    return throughput
+
+
+async def main(requests: int) -> None:
+    """
+    Print the throughput of every logging mode.
+
+    :param requests: requests to send in every mode.
+    """
+    logger.remove()
+    with tempfile.NamedTemporaryFile("w") as log_file:
+        throughputs = [await measure_mode(log_file, mode, requests) for mode in MODES]
+    logger.add(sys.stderr)
+
+    baseline = throughputs[0]
+    for mode, throughput in zip(MODES, throughputs):
+        print(  # noqa: WPS421
+            REPORT_LINE.format(
+                name=mode.name,
+                throughput=throughput,
+                share=throughput / baseline,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,151 @@
+"""
+Benchmark of the cost of the request metrics.
+
+Sends requests straight to the ASGI app of a trivial route, with and
+without ``MetricsMiddleware``, and times the database hooks on an
+in-memory SQLite database. No server nor database is needed::
+
+    python -m benchmarks.metrics_overhead --requests 20000
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict
+
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message
+
+from interview_tracker.services.metrics import queries
+from interview_tracker.services.metrics.middleware import MetricsMiddleware
+from interview_tracker.services.metrics.registry import MetricsRegistry
+from interview_tracker.settings import settings
+
+DEFAULT_REQUESTS = 20000
+RUNS = 3
+# queries timed for every request sent
+QUERIES_PER_REQUEST = 10
+MICROSECONDS = 1e6
+
+
+def make_app(with_metrics: bool) -> FastAPI:
+    """
+    Build an app with a single route.
+
+    :param with_metrics: whether to add the metrics middleware.
+    :return: ASGI app.
+    """
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> Dict[str, int]:  # noqa: WPS430
+        return {"id": item_id}
+
+    if with_metrics:
+        app.add_middleware(
+            MetricsMiddleware,
+            registry=MetricsRegistry(),
+            send_server_timing=settings.server_timing,
+            n_plus_one_threshold=settings.db_n_plus_one_threshold,
+        )
+    return app
+
+
+async def measure(app: ASGIApp, requests: int) -> float:
+    """
+    Time requests sent straight to the app.
+
+    :param app: ASGI app.
+    :param requests: requests sent by every run.
+    :return: seconds per request, the best of the runs.
+    """
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/items/1",
+        "raw_path": b"/items/1",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "server": ("test", 80),
+    }
+
+    async def receive() -> Message:  # noqa: WPS430
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:  # noqa: WPS430
+        """
+        Drop the response.
+
+        :param message: ASGI message.
+        """
+
+    timings = []
+    for _ in range(RUNS):
+        started_at = time.perf_counter()
+        for _ in range(requests):  # noqa: WPS440
+            await app(dict(scope), receive, send)
+        timings.append((time.perf_counter() - started_at) / requests)
+    return min(timings)
+
+
+def time_queries(engine: Engine, calls: int) -> float:
+    """
+    Time a trivial query.
+
+    :param engine: engine to query.
+    :param calls: queries to time.
+    :return: seconds per query.
+    """
+    with engine.connect() as connection:
+        started_at = time.perf_counter()
+        for _ in range(calls):
+            connection.exec_driver_sql("SELECT 1")
+        return (time.perf_counter() - started_at) / calls
+
+
+def measure_hooks(calls: int) -> float:
+    """
+    Time the database hooks, on an in-memory SQLite database.
+
+    :param calls: queries to time.
+    :return: seconds the hooks add to one query, the best of the runs.
+    """
+    plain_engine = create_engine("sqlite://")
+    instrumented_engine = create_engine("sqlite://")
+    queries.instrument_engine(instrumented_engine)
+    token = queries.current_query_stats.set(queries.QueryStats())
+    overheads = [
+        time_queries(instrumented_engine, calls) - time_queries(plain_engine, calls)
+        for _ in range(RUNS)
+    ]
+    queries.current_query_stats.reset(token)
+    return min(overheads)
+
+
+async def main(requests: int) -> None:
+    """
+    Print the time per request with and without metrics.
+
+    :param requests: requests sent by every run.
+    """
+    plain = await measure(make_app(with_metrics=False), requests) * MICROSECONDS
+    with_metrics = await measure(make_app(with_metrics=True), requests) * MICROSECONDS
+    overhead = with_metrics - plain
+    hooks = measure_hooks(requests * QUERIES_PER_REQUEST) * MICROSECONDS
+    print(  # noqa: WPS421
+        f"request without metrics {plain:7.1f} us, "
+        f"with metrics {with_metrics:7.1f} us, "
+        f"overhead {overhead:5.1f} us",
+    )
+    print(f"database hooks {hooks:5.2f} us per query")  # noqa: WPS421
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
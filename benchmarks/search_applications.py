@@ -0,0 +1,192 @@
+"""
+Benchmark of the applications full text search.
+
+Grows the applications table step by step and times the search query
+used by ``GET /api/applications/search`` against a naive ``ILIKE`` scan
+of the same columns. The same twenty applications match the query
+whatever the size of the table.
+
+Needs a running database configured like the application::
+
+    python -m benchmarks.search_applications --rows 10000 100000
+"""
+import argparse
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, List, Sequence
+
+from benchmarks.database import bench_database
+from sqlalchemy import insert, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from interview_tracker.db.data_access_layer.application import (
+    APPLICATION_LIST_COLUMNS,
+    search_applications,
+)
+from interview_tracker.db.models.main_model import Application, User
+from interview_tracker.settings import settings
+
+BENCH_DB_BASE = f"{settings.db_base}_bench"
+DEFAULT_STEPS = (10000, 100000)
+PAGE_SIZE = 50
+MATCHES = 20
+FILLER_REPEATS = 50
+FILLER = "lorem ipsum " * FILLER_REPEATS
+REPORT_LINE = "{rows:>8} rows: ilike {ilike_ms:8.1f} ms, full text {fts_ms:8.1f} ms"
+
+Search = Callable[[AsyncSession, int], Awaitable[Sequence[Any]]]
+
+
+async def ilike_search(session: AsyncSession, user_id: int) -> Sequence[Any]:
+    """
+    Pattern matching every row of the user.
+
+    :param session: current session.
+    :param user_id: owner of the applications.
+    :return: rows of APPLICATION_LIST_COLUMNS.
+    """
+    pattern = "%kubernetes%"
+    result = await session.execute(
+        select(*APPLICATION_LIST_COLUMNS)
+        .filter(
+            Application.user_id == user_id,
+            or_(
+                Application.company_name.ilike(pattern),
+                Application.job_title.ilike(pattern),
+                Application.location.ilike(pattern),
+                Application.notes.ilike(pattern),
+            ),
+        )
+        .order_by(Application.id.desc())
+        .limit(PAGE_SIZE),
+    )
+    return result.all()
+
+
+async def fts_search(session: AsyncSession, user_id: int) -> Sequence[Any]:
+    """
+    Ranked tsvector search through the GIN index.
+
+    :param session: current session.
+    :param user_id: owner of the applications.
+    :return: rows of APPLICATION_LIST_COLUMNS with their rank.
+    """
+    return await search_applications(user_id, session, "kubernetes", PAGE_SIZE)
+
+
+def make_notes(index: int, matches: int) -> str:
+    if index < matches:
+        return "Runs everything on Kubernetes"
+    return f"Interviewed with team {index}, {FILLER}"
+
+
+async def create_user(session_maker: async_sessionmaker[AsyncSession]) -> int:
+    async with session_maker() as session:
+        user_id = await session.scalar(
+            insert(User).values(sub="bench").returning(User.id),
+        )
+        await session.commit()
+    return user_id  # type: ignore
+
+
+async def seed(
+    session_maker: async_sessionmaker[AsyncSession],
+    user_id: int,
+    rows: int,
+    matches: int,
+) -> None:
+    """
+    Add applications to the user, then refresh the planner statistics.
+
+    :param session_maker: sessions of the benchmark database.
+    :param user_id: owner of the applications.
+    :param rows: number of applications to add.
+    :param matches: number of them matching the search.
+    """
+    async with session_maker() as session:
+        await session.execute(
+            insert(Application),
+            [
+                {
+                    "user_id": user_id,
+                    "company_name": f"Company {index}",
+                    "job_title": "Backend engineer",
+                    "status": "Applied",
+                    "attractiveness_scale": index % 5 + 1,
+                    "status_category": "blue",
+                    "location": "Berlin",
+                    "notes": make_notes(index, matches),
+                    "archived": False,
+                }
+                for index in range(rows)
+            ],
+        )
+        await session.execute(text("ANALYZE applications"))
+        await session.commit()
+
+
+async def measure(
+    session_maker: async_sessionmaker[AsyncSession],
+    search: Search,
+    user_id: int,
+    repeats: int,
+) -> float:
+    """
+    Time the search.
+
+    :param session_maker: sessions of the benchmark database.
+    :param search: implementation of the search.
+    :param user_id: owner of the applications.
+    :param repeats: number of runs.
+    :return: milliseconds of the fastest run.
+    """
+    timings: List[float] = []
+    for _ in range(repeats):
+        async with session_maker() as session:
+            started_at = time.perf_counter()
+            await search(session, user_id)
+            timings.append(time.perf_counter() - started_at)
+    return min(timings) * 1000
+
+
+async def report(
+    session_maker: async_sessionmaker[AsyncSession],
+    user_id: int,
+    rows: int,
+    repeats: int,
+) -> None:
+    ilike_ms = await measure(session_maker, ilike_search, user_id, repeats)
+    fts_ms = await measure(session_maker, fts_search, user_id, repeats)
+    print(  # noqa: WPS421
+        REPORT_LINE.format(rows=rows, ilike_ms=ilike_ms, fts_ms=fts_ms),
+    )
+
+
+async def compare(
+    session_maker: async_sessionmaker[AsyncSession],
+    steps: List[int],
+    repeats: int,
+) -> None:
+    user_id = await create_user(session_maker)
+    print(f"best of {repeats}")  # noqa: WPS421
+    total = 0
+    for rows in sorted(steps):
+        # the matches are all added with the first step
+        matches = 0 if total else MATCHES
+        await seed(session_maker, user_id, rows - total, matches)
+        total = rows
+        await report(session_maker, user_id, rows, repeats)
+
+
+async def main(steps: List[int], repeats: int) -> None:
+    async with bench_database(BENCH_DB_BASE) as engine:
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        await compare(session_maker, steps, repeats)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_STEPS))
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeats))
@@ -12,6 +12,8 @@ def main() -> None:
         port=settings.port,
         reload=settings.reload,
         log_level=settings.log_level.value.lower(),
+        # replaced by AccessLogMiddleware
+        access_log=False,
         factory=True,
     )
 
@@ -1,9 +1,19 @@
 import copy
-from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+)
 
 import pytest
 from fastapi import FastAPI
 from httpx import AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -15,13 +25,25 @@ from interview_tracker.db.data_access_layer.application import (
     save_application,
     save_timeline,
 )
-from interview_tracker.db.data_access_layer.user import get_user_by_sub
-from interview_tracker.db.dependencies import get_db_session
+from interview_tracker.db.data_access_layer.user import (
+    get_user_id_by_sub,
+    user_id_cache,
+)
+from interview_tracker.db.dependencies import get_db_readonly_session, get_db_session
 from interview_tracker.db.models.main_model import Application, Timeline
 from interview_tracker.db.utils import create_database, drop_database
+from interview_tracker.services.cache.applications import ApplicationsCache
+from interview_tracker.services.cache.backends import MemoryCacheBackend
+from interview_tracker.services.cache.dependency import get_applications_cache
+from interview_tracker.services.metrics.queries import instrument_engine
 from interview_tracker.settings import settings
 from interview_tracker.web.application import get_app
-from interview_tracker.web.authorization.testing import testing_users
+from interview_tracker.web.authorization.jwks import jwks_key_store
+from interview_tracker.web.authorization.testing import (
+    StubJwksServer,
+    get_token_issuer,
+    testing_users,
+)
 
 
 @pytest.fixture(scope="session")
@@ -34,6 +56,27 @@ def anyio_backend() -> str:
     return "asyncio"
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _jwks_server() -> Generator[StubJwksServer, None, None]:
+    """
+    Publish the key of the test token issuer, instead of the auth0 tenant.
+
+    :yield: server the application fetches the JWKS from.
+    """
+    server = StubJwksServer()
+    server.keys.append(get_token_issuer().jwk)
+    server.start()
+    jwks_uri = jwks_key_store.jwks_uri
+    jwks_key_store.jwks_uri = server.url
+    jwks_key_store.clear()
+    try:
+        yield server
+    finally:
+        jwks_key_store.jwks_uri = jwks_uri
+        jwks_key_store.clear()
+        server.stop()
+
+
 @pytest.fixture(scope="session")
 async def _engine() -> AsyncGenerator[AsyncEngine, None]:
     """
@@ -49,6 +92,7 @@ async def _engine() -> AsyncGenerator[AsyncEngine, None]:
     await create_database()
 
     engine = create_async_engine(str(settings.db_url))
+    instrument_engine(engine.sync_engine)
     async with engine.begin() as conn:
         await conn.run_sync(meta.create_all)
 
@@ -89,9 +133,56 @@ async def dbsession(
         await connection.close()
 
 
+@pytest.fixture
+def executed_statements(
+    dbsession: AsyncSession,
+) -> Generator[List[str], None, None]:
+    """
+    Record SQL statements sent to the database.
+
+    :param dbsession: current session.
+    :yield: list the statements are appended to.
+    """
+    statements: List[str] = []
+
+    def _record(*args: Any) -> None:  # noqa: WPS430
+        statements.append(args[2])
+
+    connection = dbsession.bind.sync_connection  # type: ignore
+    event.listen(connection, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", _record)
+
+
+@pytest.fixture(autouse=True)
+def _clear_user_id_cache() -> Generator[None, None, None]:
+    """
+    Forget cached user ids.
+
+    Users created inside a test are rolled back with it.
+
+    :yield: nothing.
+    """
+    yield
+    user_id_cache.clear()
+
+
+@pytest.fixture
+def applications_cache() -> ApplicationsCache:
+    """
+    Empty in-memory cache of application responses.
+
+    :return: cache.
+    """
+    return ApplicationsCache(MemoryCacheBackend(max_size=1000), ttl=60)
+
+
 @pytest.fixture
 def fastapi_app(
     dbsession: AsyncSession,
+    applications_cache: ApplicationsCache,
 ) -> FastAPI:
     """
     Fixture for creating FastAPI app.
@@ -100,6 +191,10 @@ def fastapi_app(
     """
     application = get_app()
     application.dependency_overrides[get_db_session] = lambda: dbsession
+    application.dependency_overrides[get_db_readonly_session] = lambda: dbsession
+    application.dependency_overrides[get_applications_cache] = lambda: (
+        applications_cache
+    )
     return application  # noqa: WPS331
 
 
@@ -172,9 +267,9 @@ async def mock_application(  # noqa: C901, WPS231
         # split in two distinct objects: application and timelines
         timelines = request_body.pop("timelines")
 
-        user = await get_user_by_sub(dbsession, testing_users[user_test_id][2])
+        user_id = await get_user_id_by_sub(dbsession, testing_users[user_test_id][1])
         application = Application(
-            user_id=user.id,
+            user_id=user_id,
             archived=False,
             **request_body,
         )
@@ -186,7 +281,7 @@ async def mock_application(  # noqa: C901, WPS231
         )
         for timeline_data in timelines:
             timeline = Timeline(
-                user_id=user.id,
+                user_id=user_id,
                 application_id=application.id,
                 **timeline_data,
             )
@@ -1,10 +1,92 @@
-from typing import Optional, Sequence
+import math
+import time
+from enum import Enum as PythonEnum
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple, cast
 
-from sqlalchemy import select
+from sqlalchemy import (  # noqa: WPS235
+    Float,
+    Integer,
+    Row,
+    String,
+    Table,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+    tuple_,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import InstrumentedAttribute, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.selectable import CTE
 
-from interview_tracker.db.models.main_model import Application, Timeline
+from interview_tracker.db.data_access_layer.stats import (
+    STATS_DIMENSIONS,
+    stats_deltas,
+    update_application_stats,
+    upsert_stats,
+)
+from interview_tracker.db.models.main_model import (
+    SEARCH_CONFIG,
+    Application,
+    OnSiteRemoteEnum,
+    StatusCategoryEnum,
+    Timeline,
+    applications_version_seq,
+)
+from interview_tracker.db.utils import mark_data_changed
+from interview_tracker.services.metrics.queries import record_query
+
+# columns of an exported application, internal bookkeeping is left out
+APPLICATION_EXPORT_COLUMNS = tuple(
+    column
+    for column in Application.__table__.columns
+    if column.key not in {"user_id", "version", "search_vector"}
+)
+
+
+class ApplicationSortEnum(str, PythonEnum):  # noqa: WPS600
+    """Sort orders of the applications list, `-` means descending."""
+
+    id_asc = "id"
+    id_desc = "-id"
+    attractiveness_scale_asc = "attractiveness_scale"
+    attractiveness_scale_desc = "-attractiveness_scale"
+    company_name_asc = "company_name"
+    company_name_desc = "-company_name"
+
+    @property
+    def descending(self) -> bool:
+        return self.value.startswith("-")
+
+    @property
+    def keys(self) -> Tuple[InstrumentedAttribute[Any], ...]:
+        """
+        Columns the applications are ordered by.
+
+        `id` always comes last, so the order is total and stable.
+
+        :return: sort key columns.
+        """
+        sort_column = getattr(Application, self.value.lstrip("-"))
+        if sort_column is Application.id:
+            return (Application.id,)
+        return (sort_column, Application.id)
+
+    @property
+    def order_by(self) -> List[Any]:
+        """
+        ORDER BY clauses of the sort order.
+
+        :return: sort key columns, ascending or descending.
+        """
+        return [key.desc() if self.descending else key.asc() for key in self.keys]
 
 
 async def save_application(
@@ -29,13 +111,356 @@ async def save_timeline(
     return timeline
 
 
-async def get_all_applications_by_user_id(
+def _insert_timelines(
+    user_id: int,
+    new_application: CTE,
+    timelines_data: Sequence[Dict[str, Any]],
+) -> Any:
+    new_timelines = values(
+        column("position", Integer),
+        column("name", String),
+        column("value", String),
+        name="new_timelines",
+    ).data(
+        [
+            (position, timeline["name"], timeline["value"])
+            for position, timeline in enumerate(timelines_data)
+        ],
+    )
+    timelines = cast(Table, Timeline.__table__)
+    return (
+        insert(timelines)
+        .from_select(
+            ["user_id", "application_id", "name", "value"],
+            select(
+                literal(user_id, Integer),
+                new_application.c.id,
+                new_timelines.c.name,
+                new_timelines.c.value,
+            ).join_from(new_application, new_timelines, true())
+            # timeline ids follow the requested order
+            .order_by(new_timelines.c.position),
+        )
+        .returning(timelines.c.id)
+    )
+
+
+async def create_application(
+    session: AsyncSession,
+    user_id: int,
+    application_data: Dict[str, Any],
+    timelines_data: Sequence[Dict[str, Any]],
+) -> int:
+    """
+    Create an application together with its timelines in one statement.
+
+    The application is inserted in a CTE and the timelines are inserted
+    from a VALUES list joined to it, so the number of round trips doesn't
+    depend on the number of timelines. The user's stats summary is
+    updated by the same statement.
+
+    :param session: current session.
+    :param user_id: owner of the application.
+    :param application_data: application columns.
+    :param timelines_data: ``name`` and ``value`` of each timeline.
+    :return: id of the new application.
+    """
+    # built on the tables: SQLAlchemy before 2.0.20 drops the CTEs added
+    # to a SELECT of ORM-enabled DML
+    applications = cast(Table, Application.__table__)
+    new_application = (
+        insert(applications)
+        .values(user_id=user_id, archived=False, **application_data)
+        .returning(applications.c.id)
+        .cte("new_application")
+    )
+    query = select(new_application.c.id)
+    update_stats = upsert_stats(
+        user_id,
+        stats_deltas(added=[{**application_data, "archived": False}]),
+    )
+    if update_stats is not None:
+        query = query.add_cte(update_stats.cte("updated_stats"))
+    if timelines_data:
+        query = query.add_cte(
+            _insert_timelines(user_id, new_application, timelines_data).cte(
+                "inserted_timelines",
+            ),
+        )
+    # the statement is a SELECT, its writes are in the CTEs
+    mark_data_changed(session)
+    return (await session.execute(query)).scalar_one()
+
+
+async def save_timelines(
+    session: AsyncSession,
+    user_id: int,
+    application_id: int,
+    timelines_data: Sequence[Dict[str, Any]],
+) -> Sequence[Timeline]:
+    """
+    Insert the timelines of an application with one multi-row INSERT.
+
+    :param session: current session.
+    :param user_id: owner of the application.
+    :param application_id: application the timelines belong to.
+    :param timelines_data: ``name`` and ``value`` of each timeline.
+    :return: new timelines.
+    """
+    if not timelines_data:
+        return []
+    result = await session.scalars(
+        insert(Timeline).returning(Timeline, sort_by_parameter_order=True),
+        [
+            {
+                "user_id": user_id,
+                "application_id": application_id,
+                "name": timeline["name"],
+                "value": timeline["value"],
+            }
+            for timeline in timelines_data
+        ],
+    )
+    return result.all()
+
+
+async def copy_applications(
+    session: AsyncSession,
+    user_id: int,
+    applications_data: Sequence[Dict[str, Any]],
+) -> List[int]:
+    """
+    Bulk load applications with their timelines using COPY.
+
+    Ids for the applications are reserved from the sequence upfront,
+    so both tables are loaded with one COPY each, inside the session's
+    transaction.
+
+    :param session: current session.
+    :param user_id: owner of the applications.
+    :param applications_data: application columns, with the list of
+        timelines (``name`` and ``value``) under ``timelines``.
+    :return: ids of the new applications.
+    """
+    if not applications_data:
+        return []
+
+    mark_data_changed(session)
+    application_ids = await _reserve_application_ids(session, len(applications_data))
+    # columns filled by the database, like `version`, are left to their defaults
+    application_columns = [
+        column.name
+        for column in Application.__table__.columns
+        if column.server_default is None
+    ]
+    await _copy_records(
+        session,
+        Application.__tablename__,
+        application_columns,
+        [
+            _application_record(
+                application_columns,
+                application_data,
+                user_id,
+                application_id,
+            )
+            for application_id, application_data in zip(
+                application_ids,
+                applications_data,
+            )
+        ],
+    )
+    timeline_records = [
+        (user_id, application_id, timeline["name"], timeline["value"])
+        for application_id, application_data in zip(application_ids, applications_data)
+        for timeline in application_data.get("timelines") or []
+    ]
+    if timeline_records:
+        await _copy_records(
+            session,
+            Timeline.__tablename__,
+            ["user_id", "application_id", "name", "value"],
+            timeline_records,
+        )
+    await update_application_stats(
+        session,
+        user_id,
+        added=[{**row, "archived": False} for row in applications_data],
+    )
+    return application_ids
+
+
+async def _reserve_application_ids(session: AsyncSession, count: int) -> List[int]:
+    query = select(
+        func.nextval(func.pg_get_serial_sequence("applications", "id")),
+    ).select_from(func.generate_series(1, count))
+    return list((await session.scalars(query)).all())
+
+
+def _application_record(
+    columns: List[str],
+    application_data: Dict[str, Any],
+    user_id: int,
+    application_id: int,
+) -> Tuple[Any, ...]:
+    row = {
+        **application_data,
+        "id": application_id,
+        "user_id": user_id,
+        "archived": False,
+    }
+    return tuple(_copy_value(row.get(name)) for name in columns)
+
+
+async def _copy_records(
+    session: AsyncSession,
+    table_name: str,
+    columns: List[str],
+    records: Sequence[Tuple[Any, ...]],
+) -> None:
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    # the driver is called directly, the engine's query events don't see it
+    started_at = time.perf_counter()
+    await raw_connection.driver_connection.copy_records_to_table(  # type: ignore
+        table_name,
+        records=records,
+        columns=columns,
+    )
+    column_names = ", ".join(columns)
+    record_query(
+        f"COPY {table_name} ({column_names}) FROM STDIN",
+        time.perf_counter() - started_at,
+    )
+
+
+def _copy_value(value: Any) -> Any:
+    # COPY goes around SQLAlchemy types, enums are sent by their values
+    return value.value if isinstance(value, PythonEnum) else value
+
+
+# columns shown in the applications list, it includes every sort key
+APPLICATION_LIST_COLUMNS = (
+    Application.id,
+    Application.company_name,
+    Application.job_title,
+    Application.status,
+    Application.attractiveness_scale,
+    Application.status_category,
+)
+
+# value a filter is set to, None if unset, and the condition it adds
+ListFilter = Tuple[Any, ColumnElement[bool]]
+
+
+def get_sort_key(
+    application: Row[Any],
+    sort: ApplicationSortEnum,
+) -> Tuple[Any, ...]:
+    return tuple(getattr(application, key.key) for key in sort.keys)
+
+
+def _after_sort_key(sort: ApplicationSortEnum, after: Tuple[Any, ...]) -> Any:
+    keys = tuple_(*sort.keys)
+    if sort.descending:
+        return keys < tuple_(*after)
+    return keys > tuple_(*after)
+
+
+async def get_applications_page(  # noqa: WPS211
     user_id: int,
     session: AsyncSession,
-) -> Sequence[Application]:
-    query = select(Application).filter(Application.user_id == user_id)
+    limit: int,
+    sort: ApplicationSortEnum = ApplicationSortEnum.id_asc,
+    after: Optional[Tuple[Any, ...]] = None,
+    archived: Optional[bool] = None,
+    status_category: Optional[StatusCategoryEnum] = None,
+    on_site_remote: Optional[OnSiteRemoteEnum] = None,
+    attractiveness_scale: Optional[int] = None,
+) -> Sequence[Row[Any]]:
+    """
+    Get one page of the user's applications.
+
+    Pages are fetched with keyset pagination: instead of an OFFSET the
+    query continues right after the sort key of the previous page's last
+    row, so every page is a range scan of a (user_id, ..., id) index.
+    Only the listed columns are selected, as plain rows, so no ORM
+    entities are built and the unbounded ``notes`` are never loaded.
+
+    :param user_id: owner of the applications.
+    :param session: current session.
+    :param limit: max number of applications to return.
+    :param sort: sort order.
+    :param after: sort key of the last application of the previous page.
+    :param archived: only return (not) archived applications.
+    :param status_category: only return applications in this category.
+    :param on_site_remote: only return applications with this work mode.
+    :param attractiveness_scale: only return applications rated so.
+    :return: rows of APPLICATION_LIST_COLUMNS.
+    """
+    query = select(*APPLICATION_LIST_COLUMNS).filter(Application.user_id == user_id)
+    filters: Tuple[ListFilter, ...] = (
+        (archived, Application.archived == archived),
+        (status_category, Application.status_category == status_category),
+        (on_site_remote, Application.on_site_remote == on_site_remote),
+        (
+            attractiveness_scale,
+            Application.attractiveness_scale == attractiveness_scale,
+        ),
+    )
+    for value, condition in filters:
+        if value is not None:
+            query = query.filter(condition)
+
+    if after is not None:
+        query = query.filter(_after_sort_key(sort, after))
+    query = query.order_by(*sort.order_by).limit(limit)
+
     result = await session.execute(query)
-    return result.scalars().all()
+    return result.all()
+
+
+async def search_applications(
+    user_id: int,
+    session: AsyncSession,
+    search_query: str,
+    limit: int,
+    after: Optional[Tuple[float, int]] = None,
+) -> Sequence[Row[Any]]:
+    """
+    Get one page of the user's applications matching a search query.
+
+    The query uses the web search syntax: words, "quoted phrases", ``or``
+    and ``-excluded`` words. Matches are found with the GIN index on
+    ``search_vector``, so only the matching rows are ranked. Pages are
+    ordered by rank and then by id, both descending, and continue after
+    the (rank, id) of the previous page's last row.
+
+    :param user_id: owner of the applications.
+    :param session: current session.
+    :param search_query: text typed by the user.
+    :param limit: max number of applications to return.
+    :param after: rank and id of the last application of the previous page.
+    :return: rows of APPLICATION_LIST_COLUMNS with their ``rank``.
+    """
+    ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, search_query)
+    rank = func.ts_rank(Application.search_vector, ts_query, type_=Float)
+    query = select(*APPLICATION_LIST_COLUMNS, rank.label("rank")).filter(
+        Application.user_id == user_id,
+        Application.search_vector.bool_op("@@")(ts_query),
+    )
+    if after is not None:
+        query = query.filter(_after_search_key(rank, after))
+    query = query.order_by(rank.desc(), Application.id.desc())
+
+    result = await session.execute(query.limit(limit))
+    return result.all()
+
+
+def _after_search_key(rank: Any, after: Tuple[float, int]) -> Any:
+    after_rank, after_id = after
+    after_key = tuple_(literal(after_rank, Float), literal(after_id))
+    return tuple_(rank, Application.id) < after_key
 
 
 async def get_application_by_application_id(
@@ -51,6 +476,87 @@ async def get_application_by_application_id(
     return result.unique().scalars().first()
 
 
+async def stream_user_applications(
+    session: AsyncSession,
+    user_id: int,
+    batch_size: int = 1000,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Iterate over all the user's applications with their timelines.
+
+    Applications are joined with their timelines and read through a
+    server-side cursor ``batch_size`` rows at a time, so memory doesn't
+    grow with the number of applications.
+
+    :param session: current session.
+    :param user_id: owner of the applications.
+    :param batch_size: number of rows fetched from the cursor at once.
+    :yield: application columns with the list of timelines
+        (``name`` and ``value``) under ``timelines``.
+    """
+    query = (
+        select(
+            *APPLICATION_EXPORT_COLUMNS,
+            Timeline.name.label("timeline_name"),
+            Timeline.value.label("timeline_value"),
+        )
+        .outerjoin(Timeline, Timeline.application_id == Application.id)
+        .filter(Application.user_id == user_id)
+        .order_by(Application.id, Timeline.id)
+        .execution_options(yield_per=batch_size)
+    )
+    result = await session.stream(query)
+
+    application: Optional[Dict[str, Any]] = None
+    async for row in result:
+        if application is None or application["id"] != row.id:
+            if application is not None:
+                yield application
+            application = _export_application(row)
+        if row.timeline_name is not None:
+            application["timelines"].append(
+                {"name": row.timeline_name, "value": row.timeline_value},
+            )
+    if application is not None:
+        yield application
+
+
+def _export_application(row: Row[Any]) -> Dict[str, Any]:
+    application = {
+        column.key: row[index]
+        for index, column in enumerate(APPLICATION_EXPORT_COLUMNS)
+    }
+    application["timelines"] = []
+    return application
+
+
+async def get_user_application(
+    application_id: int,
+    user_id: int,
+    session: AsyncSession,
+    with_timelines: bool = False,
+) -> Optional[Application]:
+    """
+    Get an application if it belongs to the user.
+
+    Ownership is checked in the WHERE clause, so a foreign application
+    is never loaded.
+
+    :param application_id: requested application.
+    :param user_id: owner of the application.
+    :param session: current session.
+    :param with_timelines: whether to load the timelines too.
+    :return: application or None if the user has no such application.
+    """
+    query = select(Application).filter(
+        Application.id == application_id,
+        Application.user_id == user_id,
+    )
+    if with_timelines:
+        query = query.options(selectinload(Application.timelines))
+    return await session.scalar(query)
+
+
 async def get_timeline_by_id(
     timeline_id: int,
     session: AsyncSession,
@@ -60,20 +566,217 @@ async def get_timeline_by_id(
     return result.unique().scalars().first()
 
 
-async def delete_timelines(
+async def sync_timelines(  # noqa: WPS210
+    session: AsyncSession,
     application: Application,
+    timelines_data: Sequence[Dict[str, Any]],
+) -> bool:
+    """
+    Make the application's timelines match the given list.
+
+    Timelines are ordered by id, so new ones can only be appended.
+    The list is aligned to the existing rows with the fewest writes:
+    unchanged timelines keep their ids and cost nothing, removed ones
+    are deleted without touching the others, and changed ones are
+    updated in place. A timeline inserted before existing ones takes
+    the row of the next one, which moves down a row, and so on to the
+    end of the list. Every kind of change is a single bulk statement.
+
+    :param session: current session.
+    :param application: application with its timelines loaded.
+    :param timelines_data: ``name`` and ``value`` of each timeline.
+    :return: whether anything has changed.
+    """
+    existing = list(application.timelines)
+    existing_keys = [(timeline.name, timeline.value) for timeline in existing]
+    new_keys = [(data["name"], data["value"]) for data in timelines_data]
+    pairs = _align_timelines(existing_keys, new_keys)
+    kept = [existing[index] for index, _ in pairs]
+    changed = [
+        (existing[index], timelines_data[new_index])
+        for index, new_index in pairs
+        if existing_keys[index] != new_keys[new_index]
+    ]
+    kept_ids = {timeline.id for timeline in kept}
+    removed = [timeline for timeline in existing if timeline.id not in kept_ids]
+
+    if changed:
+        new_values = values(
+            column("id", Integer),
+            column("name", String),
+            column("value", String),
+            name="new_values",
+        ).data(
+            [(timeline.id, data["name"], data["value"]) for timeline, data in changed],
+        )
+        await session.execute(
+            update(Timeline)
+            .where(Timeline.id == new_values.c.id)
+            .values(name=new_values.c.name, value=new_values.c.value),
+            execution_options={"synchronize_session": False},
+        )
+        for changed_timeline, new_data in changed:
+            set_committed_value(changed_timeline, "name", new_data["name"])
+            set_committed_value(changed_timeline, "value", new_data["value"])
+
+    if removed:
+        await session.execute(
+            delete(Timeline).where(Timeline.id.in_([row.id for row in removed])),
+            execution_options={"synchronize_session": False},
+        )
+        for removed_timeline in removed:
+            session.expunge(removed_timeline)
+
+    added = await save_timelines(
+        session=session,
+        user_id=application.user_id,
+        application_id=application.id,
+        timelines_data=timelines_data[len(pairs) :],
+    )
+    set_committed_value(application, "timelines", kept + list(added))
+    return bool(changed or removed or added)
+
+
+def _align_timelines(
+    existing: Sequence[Tuple[str, str]],
+    new: Sequence[Tuple[str, str]],
+) -> List[Tuple[int, int]]:
+    """
+    Align the new timelines to the existing ones with the fewest writes.
+
+    An edit distance where existing rows are kept, updated or deleted,
+    and new rows can only be added after all of them.
+
+    :param existing: ``name`` and ``value`` of the existing timelines.
+    :param new: ``name`` and ``value`` of the new timelines.
+    :return: (existing index, new index) of the rows kept or updated,
+        in order. The existing rows left out are deleted, the new ones
+        after the last pair are added.
+    """
+    # costs[i][j]: fewest writes turning the first i existing rows into
+    # the first j new ones, without adding any
+    costs = [[0, *(math.inf for _ in new)]]
+    for existing_key in existing:
+        costs.append(_next_costs(costs[-1], existing_key, new))
+    return _paired_rows(costs, _paired_count(costs[-1]))
+
+
+def _paired_count(last_costs: List[float]) -> int:
+    # the new timelines left unpaired are added, a write each
+    totals = [cost + added for added, cost in enumerate(reversed(last_costs))]
+    return len(last_costs) - 1 - totals.index(min(totals))
+
+
+def _next_costs(
+    previous: List[float],
+    existing_key: Tuple[str, str],
+    new: Sequence[Tuple[str, str]],
+) -> List[float]:
+    # writes to turn one more existing row into each prefix of the new
+    # list, knowing them for the previous rows
+    row = [previous[0] + 1]
+    for new_index, new_key in enumerate(new):
+        deleted = previous[new_index + 1] + 1
+        paired = previous[new_index] + (existing_key != new_key)
+        row.append(min(deleted, paired))
+    return row
+
+
+def _paired_rows(
+    costs: List[List[float]],
+    paired_count: int,
+) -> List[Tuple[int, int]]:
+    # walks the costs back, deleting rather than pairing when it's as
+    # cheap, so that the earlier rows are the ones kept
+    pairs = []
+    new_index = paired_count
+    for existing_index in reversed(range(len(costs) - 1)):
+        if not new_index:
+            break
+        cost = costs[existing_index + 1][new_index]
+        deleted = costs[existing_index][new_index] + 1
+        if existing_index < new_index or cost != deleted:
+            new_index -= 1
+            pairs.append((existing_index, new_index))
+    return pairs[::-1]
+
+
+def bump_version(application: Application) -> None:
+    """
+    Give the application a new version when it's flushed.
+
+    Call it after every change of the application or its timelines.
+
+    :param application: changed application.
+    """
+    application.version = applications_version_seq.next_value()  # type: ignore
+
+
+async def get_applications_state(
     session: AsyncSession,
-) -> None:
-    for timeline in application.timelines:
-        await session.delete(timeline)
-    await session.flush()
-    await session.refresh(application, attribute_names=["timelines"])
+    user_id: int,
+) -> Tuple[Optional[int], int]:
+    """
+    Get a cheap fingerprint of all the user's applications.
+
+    Any create, update or delete changes either the greatest version
+    or the number of applications. It's an index-only scan of
+    (user_id, version), no rows are loaded.
+
+    :param session: current session.
+    :param user_id: owner of the applications.
+    :return: greatest version and number of applications.
+    """
+    query = select(func.max(Application.version), func.count()).filter(
+        Application.user_id == user_id,
+    )
+    result = await session.execute(query)
+    return result.tuples().one()
+
+
+async def get_user_application_version(
+    application_id: int,
+    user_id: int,
+    session: AsyncSession,
+) -> Optional[int]:
+    query = select(Application.version).filter(
+        Application.id == application_id,
+        Application.user_id == user_id,
+    )
+    return await session.scalar(query)
+
+
+async def application_exists(
+    application_id: int,
+    session: AsyncSession,
+) -> bool:
+    query = select(Application.id).filter(Application.id == application_id)
+    return await session.scalar(query) is not None
 
 
 async def delete_application(
-    application: Application,
+    application_id: int,
+    user_id: int,
     session: AsyncSession,
-) -> None:
-    await delete_timelines(application=application, session=session)
-    await session.delete(application)
-    await session.flush()
+) -> bool:
+    """
+    Delete the user's application, its timelines go with it.
+
+    :param application_id: application to delete.
+    :param user_id: owner of the application.
+    :param session: current session.
+    :return: whether the application was deleted.
+    """
+    result = await session.execute(
+        delete(Application)
+        .filter(
+            Application.id == application_id,
+            Application.user_id == user_id,
+        )
+        .returning(*[getattr(Application, name) for name in STATS_DIMENSIONS]),
+    )
+    deleted = result.mappings().first()
+    if deleted is None:
+        return False
+    await update_application_stats(session, user_id, removed=[dict(deleted)])
+    return True
@@ -0,0 +1,201 @@
+from collections import Counter
+from enum import Enum as PythonEnum
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import Insert, Row, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from interview_tracker.db.models.main_model import Application, ApplicationStats
+from interview_tracker.settings import settings
+
+# application columns the applications are counted by
+STATS_DIMENSIONS = (
+    "status_category",
+    "on_site_remote",
+    "attractiveness_scale",
+    "archived",
+)
+TOTAL_DIMENSION = "total"
+
+# (dimension, value) of an application_stats row
+StatsKey = Tuple[str, str]
+# GROUPING() of a grouping set: index and name of its dimension
+GroupingDimensions = Dict[int, Tuple[Optional[int], str]]
+
+
+def stats_value(value: Any) -> str:
+    """
+    Text form of a column value, the same as postgres' cast to text.
+
+    :param value: value of a STATS_DIMENSIONS column.
+    :return: value of the application_stats row.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, PythonEnum):
+        return str(value.value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def stats_keys(application_data: Mapping[str, Any]) -> List[StatsKey]:
+    """
+    Rows of the summary an application is counted in.
+
+    :param application_data: columns of the application.
+    :return: keys of the application_stats rows.
+    """
+    return [(TOTAL_DIMENSION, "")] + [
+        (dimension, stats_value(application_data.get(dimension)))
+        for dimension in STATS_DIMENSIONS
+    ]
+
+
+def stats_deltas(
+    added: Iterable[Mapping[str, Any]] = (),
+    removed: Iterable[Mapping[str, Any]] = (),
+) -> Dict[StatsKey, int]:
+    """
+    Changes of the summary made by a write.
+
+    :param added: columns of the created applications, or the new columns
+        of the updated ones.
+    :param removed: columns of the deleted applications, or the old columns
+        of the updated ones.
+    :return: non zero change of every affected row.
+    """
+    deltas: Counter[StatsKey] = Counter()
+    for application_data in added:
+        deltas.update(stats_keys(application_data))
+    for application_data in removed:  # noqa: WPS440
+        deltas.subtract(stats_keys(application_data))
+    return {key: delta for key, delta in deltas.items() if delta}
+
+
+def upsert_stats(user_id: int, deltas: Mapping[StatsKey, int]) -> Optional[Insert]:
+    """
+    Statement adding the deltas to the user's summary.
+
+    Rows are upserted in a fixed order, so concurrent writes of the same
+    user can't deadlock on them.
+
+    :param user_id: owner of the changed applications.
+    :param deltas: change of every affected row.
+    :return: statement, or None if there is nothing to change.
+    """
+    if not deltas:
+        return None
+    statement = insert(ApplicationStats).values(
+        [
+            {"user_id": user_id, "dimension": dimension, "value": value, "count": delta}
+            for (dimension, value), delta in sorted(deltas.items())
+        ],
+    )
+    return statement.on_conflict_do_update(
+        index_elements=["user_id", "dimension", "value"],
+        set_={"count": ApplicationStats.count + statement.excluded.count},
+    )
+
+
+async def update_application_stats(
+    session: AsyncSession,
+    user_id: int,
+    added: Iterable[Mapping[str, Any]] = (),
+    removed: Iterable[Mapping[str, Any]] = (),
+) -> None:
+    """
+    Keep the user's summary in step with a write.
+
+    :param session: current session.
+    :param user_id: owner of the changed applications.
+    :param added: see stats_deltas.
+    :param removed: see stats_deltas.
+    """
+    statement = upsert_stats(user_id, stats_deltas(added, removed))
+    if statement is not None:
+        await session.execute(statement)
+
+
+async def get_summary_stats(session: AsyncSession, user_id: int) -> Dict[StatsKey, int]:
+    result = await session.execute(
+        select(
+            ApplicationStats.dimension,
+            ApplicationStats.value,
+            ApplicationStats.count,
+        ).filter(ApplicationStats.user_id == user_id),
+    )
+    return {(dimension, value): count for dimension, value, count in result}
+
+
+async def get_live_stats(session: AsyncSession, user_id: int) -> Dict[StatsKey, int]:
+    """
+    Count the user's applications by every dimension in one query.
+
+    Each dimension and the total are a grouping set of the same GROUP BY,
+    told apart by GROUPING(): its bit of a column is 1 when the column
+    isn't part of the row's grouping set.
+
+    :param session: current session.
+    :param user_id: owner of the applications.
+    :return: counts, keyed like the summary rows.
+    """
+    columns = [getattr(Application, dimension) for dimension in STATS_DIMENSIONS]
+    result = await session.execute(
+        select(
+            *columns,
+            func.grouping(*columns).label("grouping"),
+            func.count().label("applications"),
+        )
+        .filter(Application.user_id == user_id)
+        .group_by(
+            func.grouping_sets(*[tuple_(column) for column in columns], tuple_()),
+        ),
+    )
+    grouping_dimensions = _grouping_dimensions()
+    return {_stats_key(row, grouping_dimensions): row.applications for row in result}
+
+
+def _grouping_dimensions() -> GroupingDimensions:
+    all_bits = (1 << len(STATS_DIMENSIONS)) - 1
+    grouping_dimensions: GroupingDimensions = {
+        all_bits ^ (1 << (len(STATS_DIMENSIONS) - 1 - index)): (index, dimension)
+        for index, dimension in enumerate(STATS_DIMENSIONS)
+    }
+    grouping_dimensions[all_bits] = (None, TOTAL_DIMENSION)
+    return grouping_dimensions
+
+
+def _stats_key(
+    row: Row[Any],
+    grouping_dimensions: GroupingDimensions,
+) -> StatsKey:
+    index, dimension = grouping_dimensions[row.grouping]
+    if index is None:
+        return (dimension, "")
+    return (dimension, stats_value(row[index]))
+
+
+async def get_application_stats(
+    session: AsyncSession,
+    user_id: int,
+) -> Dict[StatsKey, int]:
+    """
+    Count the user's applications by every dimension.
+
+    Users with at least ``applications_stats_summary_threshold``
+    applications are answered from their summary, in time independent
+    of the number of applications. The others are counted live, which is
+    just as fast for them.
+
+    :param session: current session.
+    :param user_id: owner of the applications.
+    :return: counts, keyed like the summary rows; empty groups may be
+        missing or 0.
+    """
+    summary = await get_summary_stats(session, user_id)
+    threshold = max(settings.applications_stats_summary_threshold, 1)
+    if summary.get((TOTAL_DIMENSION, ""), 0) >= threshold:
+        return summary
+    return await get_live_stats(session, user_id)
@@ -1,23 +1,114 @@
-from sqlalchemy import select
+from collections import OrderedDict
+from typing import Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from interview_tracker.db.models.main_model import User
+from interview_tracker.settings import settings
+
+
+class UserIdCache:
+    """
+    Bounded in-process LRU of ``sub`` -> ``users.id``.
+
+    Only ids of users that were already committed are put here,
+    so a rolled back first request can't leave a dangling id behind:
+    users created by a session are cached when it commits.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+
+    def get(self, sub: str) -> Optional[int]:
+        user_id = self._entries.get(sub)
+        if user_id is not None:
+            self._entries.move_to_end(sub)
+        return user_id
+
+    def set(self, sub: str, user_id: int) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[sub] = user_id
+        self._entries.move_to_end(sub)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+user_id_cache = UserIdCache(max_size=settings.user_id_cache_size)
+
+# id no user has, serial ids start at 1
+UNKNOWN_USER_ID = 0
+# `Session.info` key of the users created in the current transaction
+CREATED_USERS = "created_users"
 
 
-async def _create_new_user(session: AsyncSession, sub: str) -> User:
-    user = User(sub=sub)
-    session.add(user)
-    await session.flush()
-    await session.refresh(user)
-    return user
+@event.listens_for(Session, "after_commit")
+def _cache_created_users(session: Session) -> None:
+    for sub, user_id in session.info.pop(CREATED_USERS, {}).items():
+        user_id_cache.set(sub, user_id)
 
 
-async def get_user_by_sub(session: AsyncSession, sub: str) -> User:
-    user_result = await session.execute(
-        select(User).where(User.sub == sub),
+@event.listens_for(Session, "after_rollback")
+def _forget_created_users(session: Session) -> None:
+    session.info.pop(CREATED_USERS, None)
+
+
+async def _select_user_id(session: AsyncSession, sub: str) -> Optional[int]:
+    query = select(User.id).where(User.sub == sub)
+    return await session.scalar(query)
+
+
+async def _create_new_user(session: AsyncSession, sub: str) -> int:
+    user_id = await session.scalar(
+        insert(User)
+        .values(sub=sub)
+        .on_conflict_do_nothing(index_elements=[User.sub])
+        .returning(User.id),
     )
-    user = user_result.scalar()
-    if user:
-        return user
-    else:
-        return await _create_new_user(session, sub)  # noqa: WPS503
+    if user_id is None:
+        # a concurrent request has created the same user first
+        return await _select_user_id(session, sub)  # type: ignore
+    session.info.setdefault(CREATED_USERS, {})[sub] = user_id
+    return user_id
+
+
+async def get_reader_id_by_sub(session: AsyncSession, sub: str) -> int:
+    """
+    Get the user's id without creating the user.
+
+    For read-only sessions. A user who has never written anything owns
+    nothing, so UNKNOWN_USER_ID, which matches no rows, is as good as
+    a new id.
+
+    :param session: current session.
+    :param sub: auth0 subject of the user.
+    :return: id of the user, or UNKNOWN_USER_ID.
+    """
+    user_id = user_id_cache.get(sub)
+    if user_id is not None:
+        return user_id
+
+    user_id = await _select_user_id(session, sub)
+    if user_id is None:
+        return UNKNOWN_USER_ID
+    # a user created by this transaction is cached once it commits
+    if sub not in session.info.get(CREATED_USERS, {}):
+        user_id_cache.set(sub, user_id)
+    return user_id
+
+
+async def get_user_id_by_sub(session: AsyncSession, sub: str) -> int:
+    user_id = await get_reader_id_by_sub(session, sub)
+    if user_id != UNKNOWN_USER_ID:
+        return user_id
+    return await _create_new_user(session, sub)
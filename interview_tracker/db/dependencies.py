@@ -1,22 +1,110 @@
+from functools import partial
 from typing import AsyncGenerator
 
+from fastapi import Depends
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
 from starlette.requests import Request
 
+from interview_tracker.db.replicas import ReplicaRouter
+from interview_tracker.db.utils import CHANGED_DATA
+from interview_tracker.web.authorization.dependencies import authorization
+from interview_tracker.web.authorization.json_web_token import JsonWebToken
 
-async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+# `Session.info` key: how to pin the user of the session once it's committed
+PIN_USER = "pin_user"
+
+
+@event.listens_for(Session, "after_flush")
+def _flushed(session: Session, flush_context: UOWTransaction) -> None:
+    session.info[CHANGED_DATA] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _executed(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info[CHANGED_DATA] = True
+
+
+@event.listens_for(Session, "after_rollback")
+def _rolled_back(session: Session) -> None:
+    session.info.pop(CHANGED_DATA, None)
+
+
+async def commit(session: AsyncSession) -> None:
+    """
+    Commit the session, and pin its user to the primary if data changed.
+
+    Handlers call it instead of ``session.commit()``: the user's next
+    reads then don't hit a replica that hasn't replayed the write yet,
+    while requests that wrote nothing cost no round trip to the pins.
+
+    :param session: session from ``get_db_session``.
+    """
+    # pending ORM changes only mark the session once they're flushed
+    await session.flush()
+    changed_data = session.info.pop(CHANGED_DATA, False)
+    await session.commit()
+    pin_user = session.info.get(PIN_USER)
+    if changed_data and pin_user is not None:
+        await pin_user()
+
+
+async def get_db_session(
+    request: Request,
+    jwt_token: JsonWebToken = Depends(authorization),
+) -> AsyncGenerator[AsyncSession, None]:
     """
     Create and get database session.
 
+    Handlers commit their writes themselves with ``commit``, before
+    answering: FastAPI runs the code after the yield once the response
+    is sent, too late to report a failed commit. Whatever is left
+    uncommitted, by an error or by a handler that didn't write, is
+    rolled back when the session is closed.
+
     :param request: current request.
+    :param jwt_token: token of the user.
     :yield: database session.
     """
+    router: ReplicaRouter = request.app.state.replica_router
     session: AsyncSession = request.app.state.db_session_factory()
+    session.info[PIN_USER] = partial(router.pin, jwt_token.subject)
+
+    try:  # noqa: WPS501
+        yield session
+    finally:
+        await session.close()
+
+
+async def get_db_readonly_session(
+    request: Request,
+    jwt_token: JsonWebToken = Depends(authorization),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create and get a database session for reading.
+
+    The session runs on a read replica when there is one in step with
+    the primary, and the user hasn't just written anything.
+
+    Its transaction is started READ ONLY and is never committed: closing
+    the session rolls it back, which costs the same round trip as a
+    COMMIT and can't write anything by mistake. No connection is checked
+    out until the first query, so a handler answering from the cache
+    doesn't hold one. Handlers may close the session themselves once
+    their queries are done, to give the connection back to the pool
+    before serializing the response.
+
+    :param request: current request.
+    :param jwt_token: token of the user.
+    :yield: database session.
+    """
+    router: ReplicaRouter = request.app.state.replica_router
+    session_factory = await router.session_factory(jwt_token.subject)
+    session: AsyncSession = session_factory()
 
     try:  # noqa: WPS501
         yield session
-    except Exception:
-        await session.rollback()
     finally:
-        await session.commit()
         await session.close()
@@ -0,0 +1,86 @@
+"""Initial schema.
+
+Revision ID: ad322563a1d8
+Revises:
+Create Date: 2026-10-18 20:31:12.408361
+
+Databases that were created by ``meta.create_all`` before migrations
+were introduced already have this schema, mark them with
+``alembic stamp ad322563a1d8`` and upgrade from there.
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "ad322563a1d8"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("sub", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "applications",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("company_name", sa.String(), nullable=False),
+        sa.Column("job_title", sa.String(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attractiveness_scale", sa.Integer(), nullable=False),
+        sa.Column(
+            "status_category",
+            sa.Enum(
+                "red",
+                "blue",
+                "green",
+                "yellow",
+                "orange",
+                "purple",
+                name="statuscategoryenum",
+            ),
+            nullable=False,
+        ),
+        sa.Column("official_website", sa.String(), nullable=True),
+        sa.Column("apply_icon", sa.Boolean(), nullable=True),
+        sa.Column("icon", sa.String(), nullable=True),
+        sa.Column("job_description_link", sa.String(), nullable=True),
+        sa.Column("salary", sa.String(), nullable=True),
+        sa.Column("location", sa.String(), nullable=True),
+        sa.Column(
+            "on_site_remote",
+            sa.Enum("remote", "onsite", "hybrid", name="onsiteremoteenum"),
+            nullable=True,
+        ),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column("archived", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "timelines",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("application_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("value", sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(["application_id"], ["applications.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_table("timelines")
+    op.drop_table("applications")
+    op.drop_table("users")
+    sa.Enum(name="onsiteremoteenum").drop(op.get_bind())
+    sa.Enum(name="statuscategoryenum").drop(op.get_bind())
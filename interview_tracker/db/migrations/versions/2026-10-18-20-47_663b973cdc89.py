@@ -0,0 +1,58 @@
+"""Unique users.sub and foreign key indexes.
+
+Revision ID: 663b973cdc89
+Revises: ad322563a1d8
+Create Date: 2026-10-18 20:47:38.127906
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "663b973cdc89"
+down_revision = "ad322563a1d8"
+branch_labels = None
+depends_on = None
+
+# users created twice by concurrent first requests are merged into
+# the oldest one before the unique index is built.
+DUPLICATED_USERS = """
+    SELECT id, min(id) OVER (PARTITION BY sub) AS keep_id FROM users
+"""
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    for table in ("applications", "timelines"):
+        op.execute(
+            sa.text(
+                f"UPDATE {table} SET user_id = duplicates.keep_id "  # noqa: S608
+                f"FROM ({DUPLICATED_USERS}) AS duplicates "
+                f"WHERE {table}.user_id = duplicates.id "
+                "AND duplicates.id <> duplicates.keep_id",
+            ),
+        )
+    op.execute(
+        sa.text(
+            "DELETE FROM users USING "  # noqa: S608
+            f"({DUPLICATED_USERS}) AS duplicates "
+            "WHERE users.id = duplicates.id AND duplicates.id <> duplicates.keep_id",
+        ),
+    )
+
+    op.create_index("ix_users_sub", "users", ["sub"], unique=True)
+    op.create_index(
+        "ix_applications_user_id_archived",
+        "applications",
+        ["user_id", "archived"],
+    )
+    op.create_index("ix_timelines_application_id", "timelines", ["application_id"])
+    op.create_index("ix_timelines_user_id", "timelines", ["user_id"])
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_index("ix_timelines_user_id", table_name="timelines")
+    op.drop_index("ix_timelines_application_id", table_name="timelines")
+    op.drop_index("ix_applications_user_id_archived", table_name="applications")
+    op.drop_index("ix_users_sub", table_name="users")
@@ -0,0 +1,53 @@
+"""Composite indexes for keyset pagination of applications.
+
+Revision ID: 5d1e0c7f3a94
+Revises: 663b973cdc89
+Create Date: 2026-10-18 21:12:05.417362
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5d1e0c7f3a94"
+down_revision = "663b973cdc89"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_applications_user_id_id", ["user_id", "id"]),
+    ("ix_applications_user_id_archived_id", ["user_id", "archived", "id"]),
+    (
+        "ix_applications_user_id_status_category_id",
+        ["user_id", "status_category", "id"],
+    ),
+    (
+        "ix_applications_user_id_on_site_remote_id",
+        ["user_id", "on_site_remote", "id"],
+    ),
+    (
+        "ix_applications_user_id_attractiveness_scale_id",
+        ["user_id", "attractiveness_scale", "id"],
+    ),
+    (
+        "ix_applications_user_id_company_name_id",
+        ["user_id", "company_name", "id"],
+    ),
+)
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.drop_index("ix_applications_user_id_archived", table_name="applications")
+    for name, columns in INDEXES:
+        op.create_index(name, "applications", columns)
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name="applications")
+    op.create_index(
+        "ix_applications_user_id_archived",
+        "applications",
+        ["user_id", "archived"],
+    )
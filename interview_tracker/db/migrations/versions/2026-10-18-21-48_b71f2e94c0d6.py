@@ -0,0 +1,42 @@
+"""Delete timelines together with their application.
+
+Revision ID: b71f2e94c0d6
+Revises: 5d1e0c7f3a94
+Create Date: 2026-10-18 21:48:21.603918
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b71f2e94c0d6"
+down_revision = "5d1e0c7f3a94"
+branch_labels = None
+depends_on = None
+
+# default name given by postgres to the unnamed constraint
+FOREIGN_KEY = "timelines_application_id_fkey"
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.drop_constraint(FOREIGN_KEY, "timelines", type_="foreignkey")
+    op.create_foreign_key(
+        FOREIGN_KEY,
+        "timelines",
+        "applications",
+        ["application_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_constraint(FOREIGN_KEY, "timelines", type_="foreignkey")
+    op.create_foreign_key(
+        FOREIGN_KEY,
+        "timelines",
+        "applications",
+        ["application_id"],
+        ["id"],
+    )
@@ -0,0 +1,42 @@
+"""Version of applications.
+
+Revision ID: e4a9c3d15b82
+Revises: b71f2e94c0d6
+Create Date: 2026-10-18 22:26:44.190537
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e4a9c3d15b82"
+down_revision = "b71f2e94c0d6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.execute("CREATE SEQUENCE applications_version_seq")
+    # the default is volatile, so existing rows get distinct versions
+    op.add_column(
+        "applications",
+        sa.Column(
+            "version",
+            sa.BigInteger(),
+            server_default=sa.text("nextval('applications_version_seq')"),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_applications_user_id_version",
+        "applications",
+        ["user_id", "version"],
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_index("ix_applications_user_id_version", table_name="applications")
+    op.drop_column("applications", "version")
+    op.execute("DROP SEQUENCE applications_version_seq")
@@ -0,0 +1,48 @@
+"""Full text search over applications.
+
+Revision ID: 9c2f6b8d41e7
+Revises: e4a9c3d15b82
+Create Date: 2026-10-18 23:05:12.604219
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "9c2f6b8d41e7"
+down_revision = "e4a9c3d15b82"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    # a stored generated column rewrites the table once, under an exclusive lock
+    op.add_column(
+        "applications",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(company_name, '')), 'A') "
+                "|| setweight(to_tsvector('english', coalesce(job_title, '')), 'B') "
+                "|| setweight(to_tsvector('english', coalesce(location, '')), 'C') "
+                "|| setweight(to_tsvector('english', coalesce(notes, '')), 'D')",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_applications_search_vector",
+        "applications",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_index("ix_applications_search_vector", table_name="applications")
+    op.drop_column("applications", "search_vector")
@@ -0,0 +1,53 @@
+"""Summary of application stats.
+
+Revision ID: 3f7d2a9e6c15
+Revises: 9c2f6b8d41e7
+Create Date: 2026-10-18 23:41:37.281904
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f7d2a9e6c15"
+down_revision = "9c2f6b8d41e7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Run the upgrade migrations."""
+    op.create_table(
+        "application_stats",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("dimension", sa.String(), nullable=False),
+        sa.Column("value", sa.String(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id", "dimension", "value"),
+    )
+    # the writes only apply deltas, so the existing applications are counted here
+    op.execute(
+        """
+        INSERT INTO application_stats (user_id, dimension, value, count)
+        SELECT user_id, 'total', '', count(*)
+        FROM applications GROUP BY user_id
+        UNION ALL
+        SELECT user_id, 'status_category', status_category::text, count(*)
+        FROM applications GROUP BY user_id, status_category
+        UNION ALL
+        SELECT user_id, 'on_site_remote', coalesce(on_site_remote::text, ''), count(*)
+        FROM applications GROUP BY user_id, on_site_remote
+        UNION ALL
+        SELECT user_id, 'attractiveness_scale', attractiveness_scale::text, count(*)
+        FROM applications GROUP BY user_id, attractiveness_scale
+        UNION ALL
+        SELECT user_id, 'archived', archived::text, count(*)
+        FROM applications GROUP BY user_id, archived
+        """,
+    )
+
+
+def downgrade() -> None:
+    """Run the downgrade migrations."""
+    op.drop_table("application_stats")
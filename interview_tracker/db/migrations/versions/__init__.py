@@ -0,0 +1 @@
+"""Versions for alembic."""
@@ -1,10 +1,39 @@
 from enum import Enum as PythonEnum
 from typing import List, Optional
 
-from sqlalchemy import Boolean, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import (  # noqa: WPS235
+    BigInteger,
+    Boolean,
+    Computed,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    Sequence,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from interview_tracker.db.base import Base
+from interview_tracker.db.meta import meta
+
+# shared by all applications, so a new version is always the greatest one
+applications_version_seq = Sequence("applications_version_seq", metadata=meta)
+
+# text search configuration of `Application.search_vector` and its queries
+SEARCH_CONFIG = "english"
+# the most important fields get the highest weights in the ranking
+SEARCH_VECTOR_EXPRESSION = " || ".join(
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({field}, '')), '{weight}')"
+    for field, weight in (
+        ("company_name", "A"),
+        ("job_title", "B"),
+        ("location", "C"),
+        ("notes", "D"),
+    )
+)
 
 
 class OnSiteRemoteEnum(str, PythonEnum):  # noqa: WPS600
@@ -26,7 +55,7 @@ class User(Base):
     __tablename__ = "users"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    sub: Mapped[str] = mapped_column(String)
+    sub: Mapped[str] = mapped_column(String, unique=True, index=True)
 
     applications: Mapped[List["Application"]] = relationship(
         "Application",
@@ -36,6 +65,43 @@ class User(Base):
 
 class Application(Base):
     __tablename__ = "applications"
+    # keyset pagination indexes: every listing filter or sort order is
+    # served by one of them, with `id` as the tie breaker
+    __table_args__ = (
+        Index("ix_applications_user_id_id", "user_id", "id"),
+        Index("ix_applications_user_id_archived_id", "user_id", "archived", "id"),
+        Index(
+            "ix_applications_user_id_status_category_id",
+            "user_id",
+            "status_category",
+            "id",
+        ),
+        Index(
+            "ix_applications_user_id_on_site_remote_id",
+            "user_id",
+            "on_site_remote",
+            "id",
+        ),
+        Index(
+            "ix_applications_user_id_attractiveness_scale_id",
+            "user_id",
+            "attractiveness_scale",
+            "id",
+        ),
+        Index(
+            "ix_applications_user_id_company_name_id",
+            "user_id",
+            "company_name",
+            "id",
+        ),
+        Index("ix_applications_user_id_version", "user_id", "version"),
+        Index(
+            "ix_applications_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+    )
+
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
     company_name: Mapped[str] = mapped_column(String)
@@ -57,20 +123,59 @@ class Application(Base):
     )
     notes: Mapped[str] = mapped_column(Text, nullable=True)
     archived: Mapped[bool] = mapped_column(Boolean)
+    # bumped by every change of the application or its timelines
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=applications_version_seq.next_value(),
+    )
+    # maintained by the database, only used to filter and rank searches
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        deferred=True,
+    )
 
     user: Mapped["User"] = relationship("User", back_populates="applications")
     timelines: Mapped[List["Timeline"]] = relationship(
         "Timeline",
         back_populates="application",
+        order_by="Timeline.id",
+        # timelines are removed by the database, see ON DELETE CASCADE
+        passive_deletes=True,
     )
 
 
+class ApplicationStats(Base):
+    """Per-user counts of applications, kept up to date by every write."""
+
+    __tablename__ = "application_stats"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id"),
+        primary_key=True,
+    )
+    # an application column, or "total"
+    dimension: Mapped[str] = mapped_column(String, primary_key=True)
+    # value of the column as text, "" for NULL
+    value: Mapped[str] = mapped_column(String, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer)
+
+
 class Timeline(Base):
     __tablename__ = "timelines"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
-    application_id: Mapped[int] = mapped_column(Integer, ForeignKey("applications.id"))
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id"),
+        index=True,
+    )
+    application_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("applications.id", ondelete="CASCADE"),
+        index=True,
+    )
     name: Mapped[str] = mapped_column(String)
     value: Mapped[str] = mapped_column(String)
 
@@ -0,0 +1,67 @@
+import time
+from typing import Any, NamedTuple, Optional
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from interview_tracker.services.metrics.histogram import Histogram, HistogramSnapshot
+
+
+class PoolStats(NamedTuple):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    timeouts: int
+    wait_time: HistogramSnapshot
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    Connection pool that records how long every checkout took.
+
+    The wait time covers waiting for a free connection, opening a new
+    one and the pre-ping, i.e. everything a request spends before it can
+    send its first query. Checkouts that timed out are counted as well.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_time = Histogram()
+        self.timeouts = 0
+
+    def connect(self) -> PoolProxiedConnection:
+        started_at = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.wait_time.observe(time.perf_counter() - started_at)
+
+    def headroom(self) -> Optional[int]:
+        """
+        Connections that can still be checked out without waiting.
+
+        :return: idle connections plus the ones the pool may still open,
+            None if overflow is unlimited.
+        """
+        if self._max_overflow < 0:
+            return None
+        return self.size() + self._max_overflow - self.checkedout()
+
+    def stats(self) -> PoolStats:
+        """
+        Current state of the pool.
+
+        :return: stats.
+        """
+        return PoolStats(
+            size=self.size(),
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            overflow=max(self.overflow(), 0),
+            timeouts=self.timeouts,
+            wait_time=self.wait_time.snapshot(),
+        )
@@ -0,0 +1,159 @@
+import asyncio
+import itertools
+import math
+from typing import List, Optional, Sequence
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from interview_tracker.services.cache.backends import CacheBackend
+
+# seconds the replica is behind the primary: 0 when it has replayed all
+# the WAL it received, NULL when it has replayed nothing yet
+LAG_QUERY = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() "
+    "OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END",
+)
+PIN_PREFIX = "replica-pin:"
+
+
+def readonly_sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """
+    Make sessions whose transactions are started READ ONLY.
+
+    The option is set on every connection when it's checked out, which
+    only happens when a session runs its first query; the pool resets
+    it on checkin.
+
+    :param engine: engine of the database.
+    :return: session factory.
+    """
+    return async_sessionmaker(
+        engine.execution_options(postgresql_readonly=True),
+        expire_on_commit=False,
+    )
+
+
+class Replica:
+    """Read replica and the last lag measured on it."""
+
+    def __init__(self, engine: AsyncEngine, name: str) -> None:
+        self.engine = engine
+        # the URL would give away the user, host and database
+        self.name = name
+        self.session_factory = readonly_sessionmaker(engine)
+        # unknown until the first check
+        self.lag = math.inf
+
+    async def measure_lag(self, timeout: float) -> float:
+        """
+        Ask the replica how far behind it is.
+
+        :param timeout: seconds to wait for the answer.
+        :return: lag in seconds, infinite if the replica can't tell
+            or doesn't answer.
+        """
+        try:
+            lag = await asyncio.wait_for(self._query_lag(), timeout)
+        except Exception as exc:
+            logger.warning("Unable to check replica {0}: {1}", self.name, exc)
+            return math.inf
+        return math.inf if lag is None else float(lag)
+
+    async def _query_lag(self) -> Optional[float]:
+        async with self.engine.connect() as connection:
+            return await connection.scalar(LAG_QUERY)
+
+
+class ReplicaRouter:
+    """
+    Picks the database a read-only session runs on.
+
+    Reads go to the replicas in turn, skipping those more than
+    ``max_lag`` seconds behind, and to the primary when none is left.
+
+    Users who write are pinned to the primary until ``pin_seconds``
+    after their last commit, so they read what they wrote even from
+    a lagging replica. Pins are kept in a cache backend, use redis when
+    running several workers.
+    """
+
+    def __init__(  # noqa: WPS211
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine],
+        pins: CacheBackend,
+        pin_seconds: float,
+        max_lag: float,
+        check_timeout: float,
+    ) -> None:
+        self.primary = readonly_sessionmaker(primary)
+        self.replicas = [
+            Replica(engine, f"replica-{index}") for index, engine in enumerate(replicas)
+        ]
+        self.pins = pins
+        self.pin_seconds = pin_seconds
+        self.max_lag = max_lag
+        self.check_timeout = check_timeout
+        self._turns = itertools.count()
+
+    async def pin(self, key: str) -> None:
+        """
+        Send the user's reads to the primary for a while.
+
+        :param key: auth0 subject of the user.
+        """
+        if self.replicas:
+            await self.pins.set(PIN_PREFIX + key, b"1", self.pin_seconds)
+
+    async def session_factory(self, key: str) -> async_sessionmaker[AsyncSession]:
+        """
+        Choose where the user's next read runs.
+
+        :param key: auth0 subject of the user.
+        :return: session factory of a replica or of the primary.
+        """
+        replica = self._next_replica()
+        if replica is None:
+            return self.primary
+        pin = await self.pins.get(PIN_PREFIX + key)
+        return replica.session_factory if pin is None else self.primary
+
+    async def check_lag(self) -> None:
+        """Measure the lag of every replica."""
+        lags = await asyncio.gather(
+            *[replica.measure_lag(self.check_timeout) for replica in self.replicas],
+        )
+        for replica, lag in zip(self.replicas, lags):
+            if replica.lag <= self.max_lag < lag:
+                logger.warning("Replica {0} is skipped, lag {1}s", replica.name, lag)
+            elif lag <= self.max_lag < replica.lag:
+                logger.info("Replica {0} is in use, lag {1}s", replica.name, lag)
+            replica.lag = lag
+
+    async def run_lag_checks(self, interval: float) -> None:
+        """
+        Keep measuring the lag until cancelled.
+
+        :param interval: seconds between two checks.
+        """
+        while True:  # noqa: WPS457
+            await asyncio.sleep(interval)
+            await self.check_lag()
+
+    async def close(self) -> None:
+        """Close the replica connections and the pins backend."""
+        for replica in self.replicas:
+            await replica.engine.dispose()
+        await self.pins.close()
+
+    def _next_replica(self) -> Optional[Replica]:
+        healthy: List[Replica] = [
+            replica for replica in self.replicas if replica.lag <= self.max_lag
+        ]
+        if not healthy:
+            return None
+        return healthy[next(self._turns) % len(healthy)]
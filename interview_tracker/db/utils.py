@@ -1,44 +1,116 @@
-from sqlalchemy import text
+from pathlib import Path
+from typing import Any, Dict
+
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import Row, text
 from sqlalchemy.engine import make_url
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 
 from interview_tracker.settings import settings
 
+MIGRATIONS_DIR = Path(__file__).parent / "migrations"
+
+# `Session.info` key set when the current transaction changed data
+CHANGED_DATA = "changed_data"
+
 
-async def create_database() -> None:
-    """Create a database."""
+async def create_database(db_base: str = settings.db_base) -> None:
+    """
+    Create a database.
+
+    :param db_base: name of the database.
+    """
     db_url = make_url(str(settings.db_url.with_path("/postgres")))
     engine = create_async_engine(db_url, isolation_level="AUTOCOMMIT")
 
     async with engine.connect() as conn:
         database_existance = await conn.execute(
             text(
-                f"SELECT 1 FROM pg_database WHERE datname='{settings.db_base}'",  # noqa: E501, S608
+                f"SELECT 1 FROM pg_database WHERE datname='{db_base}'",  # noqa: E501, S608
             ),
         )
         database_exists = database_existance.scalar() == 1
 
     if database_exists:
-        await drop_database()
+        await drop_database(db_base)
 
     async with engine.connect() as conn:  # noqa: WPS440
         await conn.execute(
             text(
-                f'CREATE DATABASE "{settings.db_base}" ENCODING "utf8" TEMPLATE template1',  # noqa: E501
+                f'CREATE DATABASE "{db_base}" ENCODING "utf8" TEMPLATE template1',  # noqa: E501
             ),
         )
+    await engine.dispose()
+
 
+async def drop_database(db_base: str = settings.db_base) -> None:
+    """
+    Drop a database.
 
-async def drop_database() -> None:
-    """Drop current database."""
+    :param db_base: name of the database.
+    """
     db_url = make_url(str(settings.db_url.with_path("/postgres")))
     engine = create_async_engine(db_url, isolation_level="AUTOCOMMIT")
     async with engine.connect() as conn:
         disc_users = (
             "SELECT pg_terminate_backend(pg_stat_activity.pid) "  # noqa: S608
             "FROM pg_stat_activity "
-            f"WHERE pg_stat_activity.datname = '{settings.db_base}' "
+            f"WHERE pg_stat_activity.datname = '{db_base}' "
             "AND pid <> pg_backend_pid();"
         )
         await conn.execute(text(disc_users))
-        await conn.execute(text(f'DROP DATABASE "{settings.db_base}"'))
+        await conn.execute(text(f'DROP DATABASE "{db_base}"'))
+    await engine.dispose()
+
+
+async def check_schema_version(engine: AsyncEngine) -> None:
+    """
+    Check that the database is migrated to the latest revision.
+
+    Workers never run DDL themselves, migrations are applied
+    by a separate ``alembic upgrade head`` step.
+
+    :param engine: engine connected to the database.
+    :raises RuntimeError: if the database isn't at the head revision.
+    """
+    expected_heads = set(ScriptDirectory(str(MIGRATIONS_DIR)).get_heads())
+    async with engine.connect() as conn:
+        current_heads = set(
+            await conn.run_sync(
+                lambda sync_conn: MigrationContext.configure(
+                    sync_conn,
+                ).get_current_heads(),
+            ),
+        )
+
+    if current_heads != expected_heads:
+        current = sorted(current_heads) or "empty"
+        expected = sorted(expected_heads)
+        raise RuntimeError(
+            f"Database schema revision is {current}, "
+            f"expected {expected}. Run `alembic upgrade head`.",
+        )
+
+
+def row_to_dict(row: Row[Any]) -> Dict[str, Any]:
+    """
+    Get the columns of a result row by their labels.
+
+    :param row: result row.
+    :return: values by column label.
+    """
+    return row._asdict()  # noqa: WPS437
+
+
+def mark_data_changed(session: AsyncSession) -> None:
+    """
+    Record that the session's transaction changed data.
+
+    Flushes and ORM INSERT, UPDATE and DELETE statements are noticed on
+    their own. Writes that aren't, like a SELECT over data modifying
+    CTEs or a COPY, are marked with it.
+
+    :param session: current session.
+    """
+    session.info[CHANGED_DATA] = True
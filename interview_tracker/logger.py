@@ -1,10 +1,18 @@
+import atexit
 import logging
+import queue
 import sys
-from typing import Union
+import threading
+import traceback
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
+import ujson
 from loguru import logger
 
-from interview_tracker.settings import settings
+from interview_tracker.settings import LogFormat, settings
+
+if TYPE_CHECKING:
+    from loguru import Message, Record
 
 
 class InterceptHandler(logging.Handler):
@@ -18,10 +26,13 @@ class InterceptHandler(logging.Handler):
     https://loguru.readthedocs.io/en/stable/overview.html#entirely-compatible-with-standard-logging
     """
 
-    def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover
+    def emit(self, record: logging.LogRecord) -> None:
         """
         Propagates logs to loguru.
 
+        The caller is taken from the stdlib record, which already knows
+        it, instead of walking the stack to find it again.
+
         :param record: record to log.
         """
         try:
@@ -29,20 +40,139 @@ class InterceptHandler(logging.Handler):
         except ValueError:
             level = record.levelno
 
-        # Find caller from where originated the logged message
-        frame, depth = logging.currentframe(), 2
-        while frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back  # type: ignore
-            depth += 1
+        logger.opt(exception=record.exc_info).bind(
+            stdlib_origin=(record.name, record.funcName, record.lineno),
+        ).log(level, record.getMessage())
+
+
+def use_stdlib_origin(record: "Record") -> None:
+    """
+    Patcher giving the records of InterceptHandler their stdlib caller.
+
+    :param record: loguru record.
+    """
+    origin = record["extra"].pop("stdlib_origin", None)
+    if origin is not None:
+        name, function, line = origin
+        record["name"] = name
+        record["function"] = function
+        record["line"] = line
+
+
+class JsonSink:
+    """
+    Writes every record as one line of compact JSON.
 
-        logger.opt(depth=depth, exception=record.exc_info).log(
-            level,
-            record.getMessage(),
+    Behind a QueuedSink, the encoding and the write run in its
+    writer thread.
+    """
+
+    def __init__(self, stream: IO[str]) -> None:
+        self.stream = stream
+
+    def __call__(self, message: "Message") -> None:
+        record = message.record
+        # bound values can't overwrite the fields of the record
+        document: Dict[str, Any] = {
+            **record["extra"],
+            "time": record["time"].isoformat(),
+            "level": record["level"].name,
+            "message": record["message"],
+            "logger": record["name"],
+            "function": record["function"],
+            "line": record["line"],
+        }
+        exception = record["exception"]
+        if exception is not None:
+            document["exception"] = "".join(
+                traceback.format_exception(
+                    exception.type,
+                    exception.value,
+                    exception.traceback,
+                ),
+            )
+        self.stream.write(ujson.dumps(document, ensure_ascii=False, default=str))
+        self.stream.write("\n")
+        self.stream.flush()
+
+
+class StreamSink:
+    """Writes the formatted messages to a stream."""
+
+    def __init__(self, stream: IO[str]) -> None:
+        self.stream = stream
+
+    def __call__(self, message: "Message") -> None:
+        self.stream.write(message)
+        self.stream.flush()
+
+
+class QueuedSink:
+    """
+    Hands the messages over to a thread that passes them to the sink.
+
+    Logging only costs a put on an in-process queue, the writes to a
+    slow or full stdout block the writer thread instead of the event
+    loop. Unlike loguru's ``enqueue``, messages aren't pickled: they
+    don't leave the process.
+    """
+
+    def __init__(self, sink: Callable[["Message"], None]) -> None:
+        self.sink = sink
+        self._queue: "queue.SimpleQueue[Optional[Message]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._write,
+            name="log-writer",
+            daemon=True,
         )
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def __call__(self, message: "Message") -> None:
+        if self._thread.is_alive():
+            self._queue.put(message)
+        else:
+            # stopped on shutdown, the last messages are written directly
+            self.sink(message)
+
+    def stop(self) -> None:
+        """Write the queued messages and stop the thread."""
+        # reconfiguring logging stops the sinks it replaces, they don't
+        # pile up until the exit
+        atexit.unregister(self.stop)
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _write(self) -> None:
+        while True:  # noqa: WPS457
+            message = self._queue.get()
+            if message is None:
+                return
+            try:
+                self.sink(message)
+            except Exception as exc:
+                sys.stderr.write(f"Unable to write a log message: {exc!r}\n")
+
+
+# writer threads of the current configuration
+_queued_sinks: List[QueuedSink] = []
+
+
+def stop_log_writers() -> None:  # pragma: no cover
+    """Write the queued log messages, before the worker exits."""
+    while _queued_sinks:
+        _queued_sinks.pop().stop()
 
 
 def configure_logging() -> None:  # pragma: no cover
-    """Configures logging."""
+    """
+    Configures logging.
+
+    Records of the stdlib loggers, uvicorn's included, go to loguru.
+    Loguru writes text or JSON to stdout, from a background thread
+    with ``log_enqueue``.
+    """
     intercept_handler = InterceptHandler()
 
     logging.basicConfig(handlers=[intercept_handler], level=logging.NOTSET)
@@ -57,7 +187,17 @@ def configure_logging() -> None:  # pragma: no cover
 
     # set logs output, level and format
     logger.remove()
-    logger.add(
-        sys.stdout,
-        level=settings.log_level.value,
-    )
+    stop_log_writers()
+    logger.configure(patcher=use_stdlib_origin)
+    sink: Any = sys.stdout
+    options: Dict[str, Any] = {}
+    if settings.log_format == LogFormat.JSON:
+        sink = JsonSink(sys.stdout)
+        # the sink only needs the record, skip formatting the line
+        options["format"] = "{message}"
+    if settings.log_enqueue:
+        if sink is sys.stdout:
+            sink = StreamSink(sys.stdout)
+        sink = QueuedSink(sink)
+        _queued_sinks.append(sink)
+    logger.add(sink, level=settings.log_level.value, **options)
@@ -0,0 +1 @@
+"""Response cache for interview_tracker."""
@@ -0,0 +1,143 @@
+import hashlib
+import secrets
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+from interview_tracker.services.cache.backends import CacheBackend
+
+QUERY_DIGEST_SIZE = 16
+GENERATION_BYTES = 8
+
+
+class CachedResponse(NamedTuple):
+    etag: str
+    body: bytes
+
+
+class CacheLookup(NamedTuple):
+    """Cached response, and the key a fresh one is stored under on a miss."""
+
+    key: str
+    response: Optional[CachedResponse]
+
+
+class ApplicationsCache:
+    """
+    Serialized responses of the application read endpoints.
+
+    Lists are keyed by user and query, details by user and application.
+    Both are stored under a generation token: lists under one per user,
+    details under one per application. A write rotates the tokens, which
+    makes all the responses it changed unreachable at once. The token is
+    random, so an evicted generation can never make old entries valid
+    again.
+
+    A lookup reads the generation once and returns the key it built out
+    of it. The response rendered after a miss is stored under that key:
+    if a write commits meanwhile, it lands in the generation the write
+    has already retired, instead of being served as current.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float) -> None:
+        self.backend = backend
+        self.ttl = ttl
+
+    async def get_list(
+        self,
+        user_id: int,
+        query: Sequence[Tuple[str, str]],
+    ) -> CacheLookup:
+        generation = await self._generation(self._list_generation_key(user_id))
+        digest = hashlib.blake2b(
+            repr(sorted(query)).encode(),
+            digest_size=QUERY_DIGEST_SIZE,
+        ).hexdigest()
+        key = f"applications:{user_id}:{generation}:{digest}"
+        return await self._lookup(key)
+
+    async def get_detail(
+        self,
+        user_id: int,
+        application_id: int,
+    ) -> CacheLookup:
+        generation_key = self._detail_generation_key(user_id, application_id)
+        generation = await self._generation(generation_key)
+        return await self._lookup(
+            f"application:{user_id}:{application_id}:{generation}",
+        )
+
+    async def store(self, key: str, response: CachedResponse) -> None:
+        """
+        Cache a response rendered after a miss.
+
+        :param key: key of the lookup that missed.
+        :param response: ETag and body of the response.
+        """
+        await self.backend.set(key, self._encode(response), self.ttl)
+
+    async def invalidate(
+        self,
+        user_id: int,
+        application_id: Optional[int] = None,
+    ) -> None:
+        """
+        Forget the cached responses a write has made stale.
+
+        Call it after the write is committed, so the responses can't be
+        cached again from the old data.
+
+        :param user_id: owner of the changed applications.
+        :param application_id: changed application, if it existed before.
+        """
+        await self._rotate(self._list_generation_key(user_id))
+        if application_id is not None:
+            await self._rotate(self._detail_generation_key(user_id, application_id))
+
+    @property
+    def generation_ttl(self) -> float:
+        # when the generation expires its responses become unreachable, not stale
+        return self.ttl * 10
+
+    async def _lookup(self, key: str) -> CacheLookup:
+        cached = await self.backend.get(key)
+        return CacheLookup(key=key, response=self._decode(cached))
+
+    async def _generation(self, generation_key: str) -> str:
+        generation = await self.backend.get(generation_key)
+        if generation is None:
+            await self.backend.add(
+                generation_key,
+                self._new_generation(),
+                self.generation_ttl,
+            )
+            generation = await self.backend.get(generation_key) or b""
+        return generation.decode()
+
+    async def _rotate(self, generation_key: str) -> None:
+        await self.backend.set(
+            generation_key,
+            self._new_generation(),
+            self.generation_ttl,
+        )
+
+    @staticmethod
+    def _list_generation_key(user_id: int) -> str:
+        return f"applications:{user_id}:generation"
+
+    @staticmethod
+    def _detail_generation_key(user_id: int, application_id: int) -> str:
+        return f"application:{user_id}:{application_id}:generation"
+
+    @staticmethod
+    def _new_generation() -> bytes:
+        return secrets.token_hex(GENERATION_BYTES).encode()
+
+    @staticmethod
+    def _encode(response: CachedResponse) -> bytes:
+        return b"\n".join((response.etag.encode(), response.body))
+
+    @staticmethod
+    def _decode(cached: Optional[bytes]) -> Optional[CachedResponse]:
+        if cached is None:
+            return None
+        etag, body = cached.split(b"\n", 1)
+        return CachedResponse(etag=etag.decode(), body=body)
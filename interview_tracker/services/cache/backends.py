@@ -0,0 +1,129 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from redis.asyncio import Redis
+
+
+class CacheBackend(ABC):
+    """Key-value store with per-key expiration."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a value.
+
+        :param key: key.
+        :return: value or None if it's missing or expired.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """
+        Set a value.
+
+        :param key: key.
+        :param value: value.
+        :param ttl: seconds to keep the value for.
+        """
+
+    @abstractmethod
+    async def add(self, key: str, value: bytes, ttl: float) -> bool:
+        """
+        Set a value unless the key already has one.
+
+        :param key: key.
+        :param value: value.
+        :param ttl: seconds to keep the value for.
+        :return: whether the value was set.
+        """
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """
+        Delete values.
+
+        :param keys: keys.
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release the resources held by the backend."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process LRU with expiration.
+
+    Every worker has its own copy, so it's only coherent with one worker.
+    With ``max_size`` 0 nothing is stored.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del self._entries[key]  # noqa: WPS420
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def add(self, key: str, value: bytes, ttl: float) -> bool:
+        if await self.get(key) is not None:
+            return False
+        await self.set(key, value, ttl)
+        return True
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def close(self) -> None:
+        self._entries.clear()
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache shared by all workers, stored in Redis.
+
+    Eviction is left to Redis, configure its ``maxmemory-policy``
+    to ``allkeys-lru`` or ``volatile-lru``.
+    """
+
+    def __init__(self, redis: Redis) -> None:  # type: ignore
+        self.redis = redis
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.redis.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.redis.set(key, value, px=_milliseconds(ttl))
+
+    async def add(self, key: str, value: bytes, ttl: float) -> bool:
+        ttl_ms = _milliseconds(ttl)
+        return bool(await self.redis.set(key, value, px=ttl_ms, nx=True))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.redis.delete(*keys)
+
+    async def close(self) -> None:
+        await self.redis.close(close_connection_pool=True)
+
+
+def _milliseconds(seconds: float) -> int:
+    return int(seconds * 1000)
@@ -0,0 +1,13 @@
+from starlette.requests import Request
+
+from interview_tracker.services.cache.applications import ApplicationsCache
+
+
+def get_applications_cache(request: Request) -> ApplicationsCache:  # pragma: no cover
+    """
+    Returns the cache of application responses.
+
+    :param request: current request.
+    :returns: applications cache.
+    """
+    return request.app.state.applications_cache
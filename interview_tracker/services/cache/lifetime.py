@@ -0,0 +1,50 @@
+from fastapi import FastAPI
+from loguru import logger
+from redis.asyncio import Redis
+
+from interview_tracker.services.cache.applications import ApplicationsCache
+from interview_tracker.services.cache.backends import (
+    CacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+)
+from interview_tracker.settings import CacheBackendType, settings
+
+
+def create_backend(max_size: int) -> CacheBackend:  # pragma: no cover
+    """
+    Creates a backend of the configured type.
+
+    :param max_size: max number of values kept by a memory backend.
+    :return: redis backend, or memory backend for the other types.
+    """
+    if settings.cache_backend == CacheBackendType.REDIS:
+        return RedisCacheBackend(Redis.from_url(str(settings.redis_url)))
+    return MemoryCacheBackend(max_size=max_size)
+
+
+def init_cache(app: FastAPI) -> None:  # pragma: no cover
+    """
+    Creates the response cache.
+
+    :param app: current fastapi application.
+    """
+    max_size = 0
+    if settings.cache_backend == CacheBackendType.MEMORY:
+        if settings.workers_count > 1:
+            logger.warning(
+                "Memory cache is per worker, responses may be stale "
+                "in other workers after a change. Use the redis backend.",
+            )
+        max_size = settings.cache_max_size
+    backend = create_backend(max_size)
+    app.state.applications_cache = ApplicationsCache(backend, ttl=settings.cache_ttl)
+
+
+async def shutdown_cache(app: FastAPI) -> None:  # pragma: no cover
+    """
+    Closes the cache backend.
+
+    :param app: current FastAPI app.
+    """
+    await app.state.applications_cache.backend.close()
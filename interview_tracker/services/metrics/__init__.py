@@ -0,0 +1 @@
+"""Runtime metrics for interview_tracker."""
@@ -0,0 +1,88 @@
+import math
+from typing import List, Mapping, Optional
+
+from interview_tracker.services.metrics.histogram import HistogramSnapshot, format_bound
+
+# starlette appends the charset
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+Labels = Mapping[str, str]
+
+LABEL_VALUE_ESCAPES = str.maketrans({"\\": r"\\", "\n": r"\n", '"': r"\""})
+
+
+def _format_label(name: str, label_value: str) -> str:
+    escaped = label_value.translate(LABEL_VALUE_ESCAPES)
+    return f'{name}="{escaped}"'
+
+
+def _format_labels(labels: Optional[Labels]) -> str:
+    if not labels:
+        return ""
+    pairs = [_format_label(name, value) for name, value in labels.items()]
+    joined = ",".join(pairs)
+    return f"{{{joined}}}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+class PrometheusWriter:
+    """
+    Builds a page in the Prometheus text exposition format.
+
+    Declare every metric family once with ``family``, then write all of
+    its samples before declaring the next one.
+    """
+
+    def __init__(self) -> None:
+        self._lines: List[str] = []
+
+    def family(self, name: str, metric_type: str, description: str) -> None:
+        """
+        Start a metric family.
+
+        :param name: metric name.
+        :param metric_type: counter, gauge or histogram.
+        :param description: help text.
+        """
+        self._lines.append(f"# HELP {name} {description}")
+        self._lines.append(f"# TYPE {name} {metric_type}")
+
+    def sample(self, name: str, value: float, labels: Optional[Labels] = None) -> None:
+        """
+        Write a counter or gauge sample.
+
+        :param name: metric name.
+        :param value: value.
+        :param labels: labels of the series.
+        """
+        series = _format_labels(labels)
+        formatted_value = _format_value(value)
+        self._lines.append(f"{name}{series} {formatted_value}")
+
+    def histogram(
+        self,
+        name: str,
+        snapshot: HistogramSnapshot,
+        labels: Optional[Labels] = None,
+    ) -> None:
+        """
+        Write the samples of a histogram.
+
+        :param name: metric name.
+        :param snapshot: histogram.
+        :param labels: labels of the series.
+        """
+        labels = dict(labels or {})
+        for bound, count in snapshot.buckets:
+            bucket_labels = {**labels, "le": format_bound(bound)}
+            self.sample(f"{name}_bucket", count, bucket_labels)
+        self.sample(f"{name}_sum", snapshot.sum, labels)
+        self.sample(f"{name}_count", snapshot.observations, labels)
+
+    def render(self) -> str:
+        return "".join(f"{line}\n" for line in self._lines)
@@ -0,0 +1,70 @@
+import bisect
+import math
+from typing import List, NamedTuple, Sequence, Tuple
+
+# seconds, from a fast query to a request that is already too slow
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+
+class HistogramSnapshot(NamedTuple):
+    # (upper bound, cumulative count), the last bound is +inf
+    buckets: List[Tuple[float, int]]
+    observations: int
+    sum: float
+
+
+class Histogram:
+    """
+    Distribution of observed values in fixed buckets, Prometheus style.
+
+    Observing is O(log buckets) and never allocates, so it can be done on
+    every request. It isn't thread safe, observe from the event loop.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds = sorted(buckets)
+        self._counts = [0 for _ in range(len(self.bounds) + 1)]
+        self._sum: float = 0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect.bisect_left(self.bounds, value)] += 1
+        self._sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        upper_bounds = [*self.bounds, math.inf]
+        buckets = []
+        cumulative = 0
+        for bound, count in zip(upper_bounds, self._counts):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return HistogramSnapshot(
+            buckets=buckets,
+            observations=cumulative,
+            sum=self._sum,
+        )
+
+
+def format_bound(bound: float) -> str:
+    """
+    Format a bucket bound like the Prometheus ``le`` label.
+
+    :param bound: upper bound of a bucket.
+    :return: label value.
+    """
+    if math.isinf(bound):
+        return "+Inf"
+    return repr(float(bound))
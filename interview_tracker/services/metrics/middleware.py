@@ -0,0 +1,164 @@
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+from starlette import status
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from interview_tracker.services.metrics.queries import QueryStats, current_query_stats
+from interview_tracker.services.metrics.registry import MetricsRegistry
+from interview_tracker.services.metrics.timing import RequestTimings, current_timings
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _metric(name: str, seconds: float) -> str:
+    milliseconds = seconds * 1000
+    return f"{name};dur={milliseconds:.2f}"
+
+
+def server_timing(
+    timings: RequestTimings,
+    query_stats: QueryStats,
+    duration: float,
+) -> bytes:
+    """
+    Value of the ``Server-Timing`` header.
+
+    :param timings: phases of the request so far.
+    :param query_stats: queries of the request so far.
+    :param duration: seconds since the request started.
+    :return: header value, durations in milliseconds.
+    """
+    metrics = [
+        _metric(phase, phase_duration)
+        for phase, phase_duration in timings.phases.items()
+    ]
+    db_metric = _metric("db", query_stats.duration)
+    metrics.append(f'{db_metric};desc="{query_stats.count} queries"')
+    metrics.append(_metric("total", duration))
+    return ", ".join(metrics).encode("latin-1")
+
+
+class _RequestRecorder:
+    """
+    Stats of one request, and the ``send`` that notes its status.
+
+    The status stays 500 if the app fails before starting the response.
+    """
+
+    def __init__(self, send: Send, send_server_timing: bool) -> None:
+        self.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        self.query_stats = QueryStats()
+        self.timings = RequestTimings()
+        self.started_at = time.perf_counter()
+        self._send = send
+        self._send_server_timing = send_server_timing
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    async def send(self, message: Message) -> None:
+        """
+        Send a message of the response, noting its status.
+
+        :param message: ASGI message.
+        """
+        if message["type"] == "http.response.start":
+            self.status_code = message["status"]
+            if self._send_server_timing:
+                header = server_timing(self.timings, self.query_stats, self.elapsed())
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"server-timing", header),
+                ]
+        await self._send(message)
+
+
+class MetricsMiddleware:
+    """
+    Records the latency, status and queries of every HTTP request.
+
+    A plain ASGI middleware: it runs in the task of the request, so the
+    query stats and timings it sets are seen by the database hooks and
+    the handlers, and it doesn't buffer or copy the response.
+
+    Optionally sends the phases of the request in a ``Server-Timing``
+    header, and logs the statements a request repeated at least
+    ``n_plus_one_threshold`` times.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        registry: MetricsRegistry,
+        send_server_timing: bool = False,
+        n_plus_one_threshold: int = 0,
+    ) -> None:
+        self.app = app
+        self.registry = registry
+        self.send_server_timing = send_server_timing
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self._routes: Dict[Callable[..., Any], str] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        recorder = _RequestRecorder(send, self.send_server_timing)
+        query_stats_token = current_query_stats.set(recorder.query_stats)
+        timings_token = current_timings.set(recorder.timings)
+
+        try:  # noqa: WPS501
+            await self.app(scope, receive, recorder.send)
+        finally:
+            duration = recorder.elapsed()
+            current_query_stats.reset(query_stats_token)
+            current_timings.reset(timings_token)
+            self._observe(scope, recorder.status_code, duration, recorder.query_stats)
+
+    def _observe(
+        self,
+        scope: Scope,
+        status_code: int,
+        duration: float,
+        query_stats: QueryStats,
+    ) -> None:
+        route = self._route(scope)
+        repeated = query_stats.repeated_statements(self.n_plus_one_threshold)
+        for shape, runs in repeated:
+            logger.warning(
+                "Possible N+1 in {0} {1}: {2} runs of {3}",
+                scope["method"],
+                route,
+                runs,
+                shape,
+            )
+        self.registry.observe_request(
+            scope["method"],
+            route,
+            status_code,
+            duration,
+            query_stats,
+            n_plus_one=bool(repeated),
+        )
+
+    def _route(self, scope: Scope) -> str:
+        # the router leaves the matched endpoint in the scope
+        endpoint: Optional[Callable[..., Any]] = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        route = self._routes.get(endpoint)
+        if route is None:
+            route = _find_route(scope["router"].routes, endpoint)
+            self._routes[endpoint] = route
+        return route
+
+
+def _find_route(routes: List[BaseRoute], endpoint: Callable[..., Any]) -> str:
+    for route in routes:
+        if getattr(route, "endpoint", None) is endpoint:
+            return getattr(route, "path", UNMATCHED_ROUTE)
+    return UNMATCHED_ROUTE
@@ -0,0 +1,130 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from interview_tracker.settings import settings
+
+_WHITESPACE = re.compile(r"\s+")
+_LITERALS = re.compile(
+    "'(?:[^']|'')*'"  # strings
+    r"|\$\d+|[%]\(\w+\)s|[%]s"  # bound parameters of the drivers
+    r"|\b\d+(?:\.\d+)?\b",  # numbers
+)
+_LISTS = re.compile(r"\(\?(?:, \?)+\)")
+_ROWS = re.compile(r"(\([?, .]+\))(?:, \([?, .]+\))+")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    Shape of a statement: its values and the length of its lists removed.
+
+    :param statement: SQL statement.
+    :return: statement with every value replaced by ``?``.
+    """
+    shape = _LITERALS.sub("?", _WHITESPACE.sub(" ", statement).strip())
+    return _ROWS.sub(r"\1, ...", _LISTS.sub("(?, ...)", shape))
+
+
+class QueryStats:
+    """Queries a request ran and the seconds they took."""
+
+    __slots__ = ("count", "duration", "statements")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration: float = 0
+        self.statements: Counter[str] = Counter()
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        Statement shapes run at least ``threshold`` times, likely an N+1.
+
+        Statements are grouped by their text first, which is cheap, then
+        by their shape, only when the request ran enough queries.
+
+        :param threshold: number of runs flagged as a repeat, 0 flags none.
+        :return: shapes and how many times they ran, most frequent first.
+        """
+        if threshold <= 0 or self.count < threshold:
+            return []
+        shapes: Counter[str] = Counter()
+        for statement, runs in self.statements.items():
+            shapes[normalize_sql(statement)] += runs
+        return [
+            (shape, total)
+            for shape, total in shapes.most_common()
+            if total >= threshold
+        ]
+
+
+# stats of the current request, set by the metrics middleware
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats",
+    default=None,
+)
+
+
+def _before_cursor_execute(  # noqa: WPS211
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    if context is not None:
+        context.metrics_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(  # noqa: WPS211
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    if context is not None:
+        record_query(statement, time.perf_counter() - context.metrics_started_at)
+
+
+def record_query(statement: str, duration: float) -> None:
+    """
+    Count a query in the current request's stats, and log it if slow.
+
+    Queries run through the engine are recorded on their own, this is
+    for the ones sent to the driver directly, like COPY.
+
+    :param statement: SQL statement.
+    :param duration: seconds the query took.
+    """
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += duration
+        stats.statements[statement] += 1
+    if 0 < settings.db_slow_query_seconds <= duration:
+        logger.warning(
+            "Slow query, {0:.1f} ms: {1}",
+            duration * 1000,
+            normalize_sql(statement),
+        )
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Count the queries of the engine in the current request's stats.
+
+    Queries slower than ``db_slow_query_seconds`` are logged, without
+    their parameters. Queries that fail aren't counted.
+
+    :param engine: sync engine, ``AsyncEngine.sync_engine`` for async ones.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,61 @@
+from collections import Counter
+from typing import Dict, Tuple
+
+from interview_tracker.services.metrics.histogram import Histogram
+from interview_tracker.services.metrics.queries import QueryStats
+
+# queries run by one request
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class RouteMetrics:
+    """What the requests of one route took."""
+
+    def __init__(self) -> None:
+        self.latency = Histogram()
+        self.queries = Histogram(QUERY_COUNT_BUCKETS)
+        self.query_time = Histogram()
+        self.statuses: Counter[int] = Counter()
+        # requests that repeated a statement, see MetricsMiddleware
+        self.n_plus_one = 0
+
+
+class MetricsRegistry:
+    """
+    Request metrics of one worker, keyed by method and route template.
+
+    Routes are templates like ``/api/applications/{application_id}``,
+    so the number of series is bounded by the number of routes.
+    """
+
+    def __init__(self) -> None:
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+
+    def observe_request(  # noqa: WPS211
+        self,
+        method: str,
+        route: str,
+        status: int,
+        duration: float,
+        query_stats: QueryStats,
+        n_plus_one: bool = False,
+    ) -> None:
+        """
+        Record a finished request.
+
+        :param method: HTTP method.
+        :param route: route template.
+        :param status: status code of the response.
+        :param duration: seconds the request took.
+        :param query_stats: queries the request ran.
+        :param n_plus_one: whether the request repeated a statement.
+        """
+        route_metrics = self.routes.get((method, route))
+        if route_metrics is None:
+            route_metrics = RouteMetrics()
+            self.routes[(method, route)] = route_metrics
+        route_metrics.latency.observe(duration)
+        route_metrics.queries.observe(query_stats.count)
+        route_metrics.query_time.observe(query_stats.duration)
+        route_metrics.statuses[status] += 1
+        route_metrics.n_plus_one += n_plus_one
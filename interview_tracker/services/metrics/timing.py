@@ -0,0 +1,42 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+
+class RequestTimings:
+    """Seconds a request spent in each phase, e.g. auth or serialize."""
+
+    __slots__ = ("phases",)
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, float] = {}
+
+    def add(self, phase: str, duration: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0) + duration
+
+
+# timings of the current request, set by the metrics middleware
+current_timings: ContextVar[Optional[RequestTimings]] = ContextVar(
+    "current_timings",
+    default=None,
+)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """
+    Add the time spent in the block to a phase of the current request.
+
+    Nothing is recorded outside of a request.
+
+    :param phase: name of the phase.
+    :yield: nothing.
+    """
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = current_timings.get()
+        if timings is not None:
+            timings.add(phase, time.perf_counter() - started_at)
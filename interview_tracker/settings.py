@@ -1,6 +1,7 @@
 import enum
 from pathlib import Path
 from tempfile import gettempdir
+from typing import Dict, List, Optional
 
 from pydantic import BaseSettings, validator
 from yarl import URL
@@ -19,6 +20,21 @@ class LogLevel(str, enum.Enum):  # noqa: WPS600
     FATAL = "FATAL"
 
 
+class LogFormat(str, enum.Enum):  # noqa: WPS600
+    """Possible formats of the logs."""
+
+    TEXT = "text"
+    JSON = "json"
+
+
+class CacheBackendType(str, enum.Enum):  # noqa: WPS600
+    """Possible backends of the response cache."""
+
+    NONE = "none"
+    MEMORY = "memory"
+    REDIS = "redis"
+
+
 class Settings(BaseSettings):
     """
     Application settings.
@@ -38,14 +54,29 @@ class Settings(BaseSettings):
     environment: str = "dev"
 
     log_level: LogLevel = LogLevel.INFO
+    log_format: LogFormat = LogFormat.TEXT
+    # Write the logs from a background thread, requests only queue them
+    log_enqueue: bool = False
+    # Access log, replaces the one of uvicorn. Only a fraction
+    # `access_log_sample_rate` of the successful requests is logged,
+    # failed requests and those slower than `access_log_slow_seconds`
+    # always are.
+    access_log: bool = True
+    access_log_sample_rate: float = 1
+    access_log_slow_seconds: float = 1
 
     auth0_audience: str = ""
     auth0_domain: str = ""
     client_origin_url: str = ""
-
-    # for testing
-    client_id: str = ""
-    client_secret: str = ""
+    # JWKS is cached per worker; unknown `kid`s force a refresh at most
+    # once per `auth0_jwks_min_refresh_interval` seconds.
+    # `auth0_jwks_uri` defaults to the auth0 tenant's well-known endpoint.
+    auth0_jwks_uri: str = ""
+    auth0_jwks_cache_ttl: int = 600
+    auth0_jwks_min_refresh_interval: int = 30
+    auth0_jwks_timeout: float = 5
+    # Max number of verified access tokens kept in memory, 0 disables the cache
+    auth_token_cache_size: int = 4096
 
     @classmethod
     @validator("client_origin_url", "auth0_audience", "auth0_domain")
@@ -61,6 +92,85 @@ class Settings(BaseSettings):
     db_pass: str = "interview_tracker"
     db_base: str = "interview_tracker"
     db_echo: bool = False
+    # Connection pool of every worker: `db_pool_size` connections are kept
+    # open, up to `db_max_overflow` more are opened under load. Checkouts
+    # give up after `db_pool_timeout` seconds. Connections older than
+    # `db_pool_recycle` seconds are replaced, -1 keeps them forever.
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    db_pool_recycle: int = -1
+    # Check connections with a round trip before handing them out
+    db_pool_pre_ping: bool = False
+    # Prepared statements cached per connection, 0 behind pgbouncer
+    # in transaction mode
+    db_statement_cache_size: int = 100
+    # Session parameters, e.g. {"jit": "off", "statement_timeout": "5000"}
+    db_server_settings: Dict[str, str] = {"application_name": "interview_tracker"}
+    # Refuse to start if the database isn't migrated to the latest revision
+    db_check_schema: bool = True
+    # Read replicas as "host" or "host:port", with the credentials and
+    # database of the primary. Application reads go to them in turn.
+    db_replica_hosts: List[str] = []
+    # Users read from the primary until this many seconds after a write,
+    # keep it above `db_replica_max_lag`
+    db_replica_pin_seconds: float = 5
+    # Max number of users pinned at once by the memory cache backend
+    db_replica_pin_max_size: int = 10000
+    # Replicas further behind than this many seconds are skipped
+    db_replica_max_lag: float = 2
+    db_replica_check_interval: float = 1
+    db_replica_check_timeout: float = 1
+    # Queries slower than this many seconds are logged, 0 disables the log
+    db_slow_query_seconds: float = 0.5
+    # Requests running the same statement this many times are logged as
+    # a possible N+1, 0 disables the check
+    db_n_plus_one_threshold: int = 5
+    # Max number of auth0 `sub` -> user id pairs kept in memory, 0 disables it
+    user_id_cache_size: int = 10000
+
+    # Page size of the applications list
+    applications_page_size_default: int = 50
+    applications_page_size_max: int = 200
+    # Max number of rows accepted by one bulk import
+    applications_import_max_rows: int = 10000
+    # Valid rows are loaded with one COPY per batch of this many rows,
+    # so an import never holds more of them in memory
+    applications_import_batch_size: int = 500
+    # JSON arrays are parsed whole, unlike NDJSON and CSV which are
+    # streamed, so their size is limited
+    applications_import_max_json_bytes: int = 10 * 1024 * 1024
+    # Users with at least this many applications get their stats from the
+    # summary table instead of counting the applications
+    applications_stats_summary_threshold: int = 500
+
+    # Cache of the application read responses. The memory backend is
+    # per worker, use redis when running several workers.
+    cache_backend: CacheBackendType = CacheBackendType.MEMORY
+    cache_ttl: int = 60
+    # Max number of responses kept by the memory backend
+    cache_max_size: int = 10000
+
+    # Send the time spent in auth, db and serialize in a Server-Timing header
+    server_timing: bool = True
+
+    # Readiness checks are shared by the probes of the next
+    # `health_check_cache_seconds`, every dependency has
+    # `health_check_timeout` seconds to answer
+    health_check_cache_seconds: float = 2
+    health_check_timeout: float = 1
+    # Connections the pool must still be able to hand out to be ready
+    health_min_pool_headroom: int = 1
+    # Bearer token of the monitoring endpoints `/api/pool` and `/api/metrics`,
+    # which answer 404 while it's empty
+    monitoring_token: str = ""
+
+    # Variables for Redis
+    redis_host: str = "localhost"
+    redis_port: int = 6379
+    redis_user: Optional[str] = None
+    redis_pass: Optional[str] = None
+    redis_base: Optional[int] = None
 
     @property
     def db_url(self) -> URL:
@@ -78,6 +188,40 @@ class Settings(BaseSettings):
             path=f"/{self.db_base}",
         )
 
+    @property
+    def db_replica_urls(self) -> List[URL]:
+        """
+        Assemble the URLs of the read replicas.
+
+        :return: database URLs.
+        """
+        urls = []
+        for replica_host in self.db_replica_hosts:
+            host, _, port = replica_host.partition(":")
+            urls.append(
+                self.db_url.with_host(host).with_port(int(port or self.db_port)),
+            )
+        return urls
+
+    @property
+    def redis_url(self) -> URL:
+        """
+        Assemble REDIS URL from settings.
+
+        :return: redis URL.
+        """
+        path = ""
+        if self.redis_base is not None:
+            path = f"/{self.redis_base}"
+        return URL.build(
+            scheme="redis",
+            host=self.redis_host,
+            port=self.redis_port,
+            user=self.redis_user,
+            password=self.redis_pass,
+            path=path,
+        )
+
     class Config:
         env_file = ".env"
         env_prefix = "INTERVIEW_TRACKER_"
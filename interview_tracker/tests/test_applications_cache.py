@@ -0,0 +1,320 @@
+import asyncio
+import json
+import socketserver
+import threading
+import time
+from typing import (  # noqa: WPS235
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from interview_tracker.db.models.main_model import Application
+from interview_tracker.services.cache.applications import (
+    ApplicationsCache,
+    CachedResponse,
+)
+from interview_tracker.services.cache.backends import (
+    CacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+)
+from interview_tracker.web.authorization.testing import get_user_token_headers
+
+
+class StubRedisServer(socketserver.ThreadingTCPServer):
+    """Local server speaking just enough RESP for the cache backend."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubRedisHandler)
+        self.entries: Dict[bytes, Tuple[bytes, float]] = {}
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.server_address[1]}"
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        entry = self.entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+
+
+class StubRedisHandler(socketserver.StreamRequestHandler):
+    server: StubRedisServer
+
+    def handle(self) -> None:
+        while True:
+            command = self._read_command()
+            if command is None:
+                return
+            with self.server.lock:
+                self.wfile.write(self._execute(command))
+
+    def _read_command(self) -> Optional[List[bytes]]:
+        header = self.rfile.readline()
+        if not header:
+            return None
+        arguments = []
+        for _ in range(int(header[1:])):
+            length = int(self.rfile.readline()[1:])
+            argument = self.rfile.read(length + 2)
+            arguments.append(argument[:-2])
+        return arguments
+
+    def _execute(self, command: List[bytes]) -> bytes:
+        name, *arguments = command
+        execute = {
+            b"GET": self._get,
+            b"SET": self._set,
+            b"DEL": self._delete,
+        }.get(name.upper())
+        if execute is None:
+            return b"+OK\r\n"
+        return execute(arguments)
+
+    def _get(self, arguments: List[bytes]) -> bytes:
+        value = self.server.get(arguments[0])
+        if value is None:
+            return b"$-1\r\n"
+        length = len(value)
+        return b"".join((f"${length}\r\n".encode(), value, b"\r\n"))
+
+    def _set(self, arguments: List[bytes]) -> bytes:
+        key, value, *options = arguments
+        options = [option.upper() for option in options]
+        if b"NX" in options and self.server.get(key) is not None:
+            return b"$-1\r\n"
+        ttl = int(options[options.index(b"PX") + 1]) / 1000
+        self.server.entries[key] = (value, time.monotonic() + ttl)
+        return b"+OK\r\n"
+
+    def _delete(self, arguments: List[bytes]) -> bytes:
+        deleted = [self.server.entries.pop(key, None) for key in arguments]
+        count = sum(entry is not None for entry in deleted)
+        return f":{count}\r\n".encode()
+
+
+@pytest.fixture
+def redis_server() -> Generator[StubRedisServer, None, None]:
+    server = StubRedisServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(params=["memory", "redis"])
+async def backend(
+    request: pytest.FixtureRequest,
+    anyio_backend: Any,
+) -> AsyncGenerator[CacheBackend, None]:
+    cache_backend: CacheBackend
+    if request.param == "redis":
+        server = request.getfixturevalue("redis_server")
+        cache_backend = RedisCacheBackend(Redis.from_url(server.url))
+    else:
+        cache_backend = MemoryCacheBackend(max_size=100)
+    try:
+        yield cache_backend
+    finally:
+        await cache_backend.close()
+
+
+@pytest.mark.anyio
+async def test_backend_get_set_delete(  # noqa: WPS217
+    backend: CacheBackend,
+) -> None:
+    assert await backend.get("key") is None
+
+    await backend.set("key", b"value", ttl=60)
+    await backend.set("other", b"other value", ttl=60)
+    assert await backend.get("key") == b"value"
+    assert not await backend.add("key", b"new value", ttl=60)
+    assert await backend.get("key") == b"value"
+
+    await backend.delete("key", "other", "missing")
+    assert await backend.get("key") is None
+    assert await backend.get("other") is None
+    assert await backend.add("key", b"new value", ttl=60)
+    assert await backend.get("key") == b"new value"
+
+
+@pytest.mark.anyio
+async def test_backend_expiration(backend: CacheBackend) -> None:
+    await backend.set("key", b"value", ttl=0.05)
+    assert await backend.get("key") == b"value"
+
+    await asyncio.sleep(0.1)
+    assert await backend.get("key") is None
+    assert await backend.add("key", b"new value", ttl=60)
+
+
+@pytest.mark.anyio
+async def test_memory_backend_evicts_lru() -> None:  # noqa: WPS217
+    backend = MemoryCacheBackend(max_size=2)
+    await backend.set("first", b"1", ttl=60)
+    await backend.set("second", b"2", ttl=60)
+    await backend.get("first")
+    await backend.set("third", b"3", ttl=60)
+
+    assert await backend.get("first") == b"1"
+    assert await backend.get("second") is None
+    assert await backend.get("third") == b"3"
+
+    disabled = MemoryCacheBackend(max_size=0)
+    await disabled.set("key", b"value", ttl=60)
+    assert await disabled.get("key") is None
+
+
+@pytest.mark.anyio
+async def test_invalidate_forgets_lists_and_detail(  # noqa: WPS217
+    backend: CacheBackend,
+) -> None:
+    cache = ApplicationsCache(backend, ttl=60)
+    response = CachedResponse(etag='"etag"', body=b'{"applications": []}')
+    query = [("limit", "10")]
+    for lookup in (
+        await cache.get_list(1, query),
+        await cache.get_list(2, query),
+        await cache.get_detail(1, 10),
+        await cache.get_detail(1, 11),
+    ):
+        assert lookup.response is None
+        await cache.store(lookup.key, response)
+
+    assert (await cache.get_list(1, query)).response == response
+    assert (await cache.get_list(1, [("limit", "20")])).response is None
+    assert (await cache.get_detail(1, 10)).response == response
+
+    await cache.invalidate(1, 10)
+    assert (await cache.get_list(1, query)).response is None
+    assert (await cache.get_detail(1, 10)).response is None
+    # other applications and users are left alone
+    assert (await cache.get_detail(1, 11)).response == response
+    assert (await cache.get_list(2, query)).response == response
+
+
+@pytest.mark.anyio
+async def test_store_after_invalidate_is_unreachable(  # noqa: WPS217
+    backend: CacheBackend,
+) -> None:
+    cache = ApplicationsCache(backend, ttl=60)
+    stale = CachedResponse(etag='"stale"', body=b"[]")
+    list_lookup = await cache.get_list(1, [])
+    detail_lookup = await cache.get_detail(1, 10)
+
+    # a write commits while the responses are rendered from the old data
+    await cache.invalidate(1, 10)
+    await cache.store(list_lookup.key, stale)
+    await cache.store(detail_lookup.key, stale)
+
+    assert (await cache.get_list(1, [])).response is None
+    assert (await cache.get_detail(1, 10)).response is None
+
+
+@pytest.mark.anyio
+async def test_applications_list_served_from_cache(  # noqa: WPS217
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+    application_request_body: Dict[str, Any],
+    executed_statements: List[str],
+) -> None:
+    application = await mock_application()
+    # the new user's id is cached once committed
+    await dbsession.commit()
+    url = fastapi_app.url_path_for("get_applications")
+    headers = get_user_token_headers()
+    response = await client.get(url=url, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+
+    executed_statements.clear()
+    cached = await client.get(url=url, headers=headers)
+    assert cached.content == response.content
+    assert cached.headers["etag"] == response.headers["etag"]
+    assert not executed_statements
+
+    not_modified = await client.get(
+        url=url,
+        headers={**headers, "If-None-Match": response.headers["etag"]},
+    )
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+    await client.put(
+        url=fastapi_app.url_path_for(
+            "update_application",
+            application_id=application.id,
+        ),
+        headers=headers,
+        json={"company_name": "Renamed"},
+    )
+    response = await client.get(url=url, headers=headers)
+    applications = json.loads(response.content)["applications"]
+    assert [app["company_name"] for app in applications] == ["Renamed"]
+
+    await client.post(
+        url=fastapi_app.url_path_for("create_application"),
+        headers=headers,
+        json=application_request_body,
+    )
+    response = await client.get(url=url, headers=headers)
+    assert len(json.loads(response.content)["applications"]) == 2
+
+
+@pytest.mark.anyio
+async def test_application_detail_served_from_cache(  # noqa: WPS217
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+    executed_statements: List[str],
+) -> None:
+    application = await mock_application(user_test_id="user_1")
+    await mock_application(user_test_id="user_2")
+    await dbsession.commit()
+    url = fastapi_app.url_path_for(
+        "get_application_by_id",
+        application_id=application.id,
+    )
+    headers = get_user_token_headers()
+    response = await client.get(url=url, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+
+    executed_statements.clear()
+    cached = await client.get(url=url, headers=headers)
+    assert cached.content == response.content
+    assert not executed_statements
+
+    # the cached response is per user
+    response = await client.get(url=url, headers=get_user_token_headers("user_2"))
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    await client.delete(
+        url=fastapi_app.url_path_for(
+            "delete_application",
+            application_id=application.id,
+        ),
+        headers=headers,
+    )
+    response = await client.get(url=url, headers=headers)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,132 @@
+import json
+from typing import Any, Awaitable, Callable, Dict, List
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from interview_tracker.db.data_access_layer.stats import (
+    get_live_stats,
+    get_summary_stats,
+)
+from interview_tracker.db.data_access_layer.user import get_user_id_by_sub
+from interview_tracker.db.models.main_model import Application
+from interview_tracker.settings import settings
+from interview_tracker.web.authorization.testing import (
+    get_user_token_headers,
+    testing_users,
+)
+
+
+@pytest.mark.anyio
+async def test_get_applications_stats(  # noqa: WPS217
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+    executed_statements: List[str],
+) -> None:
+    await mock_application(status_category="red", attractiveness_scale=5)
+    await mock_application(status_category="red", attractiveness_scale=3)
+    archived = await mock_application(
+        status_category="green",
+        attractiveness_scale=3,
+        exclude=["on_site_remote"],
+    )
+    archived.archived = True
+    await dbsession.flush()
+    await mock_application(user_test_id="user_2", status_category="blue")
+    executed_statements.clear()
+    response = await client.get(
+        url=fastapi_app.url_path_for("get_applications_stats"),
+        headers=get_user_token_headers(),
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert json.loads(response.content) == {
+        "total": 3,
+        "active": 2,
+        "archived": 1,
+        "status_category": {"green": 1, "red": 2},
+        "on_site_remote": {"remote": 2, "unspecified": 1},
+        "attractiveness_scale": {"3": 2, "5": 1},
+    }
+    counts = [
+        statement
+        for statement in executed_statements
+        if "FROM applications" in statement
+    ]
+    assert len(counts) == 1
+    assert "GROUPING SETS" in counts[0]
+
+
+@pytest.mark.anyio
+async def test_stats_summary_follows_writes(  # noqa: WPS213, WPS217
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    application_request_body: Dict[str, Any],
+    executed_statements: List[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "applications_stats_summary_threshold", 1)
+    headers = get_user_token_headers()
+    await client.post(
+        url=fastapi_app.url_path_for("create_application"),
+        headers=headers,
+        json=application_request_body,
+    )
+    user_id = await get_user_id_by_sub(dbsession, testing_users["user_1"][1])
+    # a single create updates the summary in its own statement
+    assert await get_summary_stats(dbsession, user_id) == await get_live_stats(
+        dbsession,
+        user_id,
+    )
+    await client.post(
+        url=fastapi_app.url_path_for("import_applications"),
+        headers=headers,
+        json=[
+            dict(application_request_body, status_category="blue"),
+            dict(application_request_body, on_site_remote=None),
+            dict(application_request_body, attractiveness_scale=1),
+        ],
+    )
+    application_ids = (
+        await dbsession.scalars(select(Application.id).order_by(Application.id))
+    ).all()
+    await client.put(
+        url=fastapi_app.url_path_for(
+            "update_application",
+            application_id=application_ids[0],
+        ),
+        headers=headers,
+        json={"status_category": "green", "attractiveness_scale": 2},
+    )
+    await client.delete(
+        url=fastapi_app.url_path_for(
+            "delete_application",
+            application_id=application_ids[1],
+        ),
+        headers=headers,
+    )
+
+    summary = await get_summary_stats(dbsession, user_id)
+    live = await get_live_stats(dbsession, user_id)
+    assert live == {key: count for key, count in summary.items() if count}
+
+    executed_statements.clear()
+    response = await client.get(
+        url=fastapi_app.url_path_for("get_applications_stats"),
+        headers=headers,
+    )
+    assert json.loads(response.content) == {
+        "total": 3,
+        "active": 3,
+        "archived": 0,
+        "status_category": {"green": 1, "red": 2},
+        "on_site_remote": {"remote": 2, "unspecified": 1},
+        "attractiveness_scale": {"1": 1, "2": 1, "5": 1},
+    }
+    assert not any("FROM applications" in stmt for stmt in executed_statements)
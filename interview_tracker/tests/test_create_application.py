@@ -1,5 +1,5 @@
 import json
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import pytest
 from fastapi import FastAPI, status
@@ -82,6 +82,40 @@ async def test_create_application_okay(  # noqa: WPS218
         assert created_timeline.value == requested_timeline["value"]
 
 
+@pytest.mark.anyio
+async def test_timelines_created_in_one_statement(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    application_request_body: Dict[str, Any],
+    executed_statements: List[str],
+) -> None:
+    application_request_body["timelines"] = [
+        {"name": f"Interview {index}", "value": "2023-07-21"} for index in range(20)
+    ]
+    url = fastapi_app.url_path_for("create_application")
+    headers = get_user_token_headers()
+    response = await client.post(
+        url=url,
+        headers=headers,
+        json=application_request_body,
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    inserts = [
+        statement
+        for statement in executed_statements
+        if "INSERT INTO timelines" in statement
+    ]
+    assert len(inserts) == 1
+    assert "INSERT INTO applications" in inserts[0]
+
+    timelines = await dbsession.execute(select(Timeline).order_by(Timeline.id))
+    assert [timeline.name for timeline in timelines.scalars()] == [
+        timeline["name"] for timeline in application_request_body["timelines"]
+    ]
+
+
 @pytest.mark.anyio
 async def test_create_application_company_name_not_valid(  # noqa:WPS118
     client: AsyncClient,
@@ -1,8 +1,15 @@
 import pytest
 from fastapi import FastAPI, status
 from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
+from interview_tracker.db.data_access_layer.user import (
+    get_reader_id_by_sub,
+    get_user_id_by_sub,
+    user_id_cache,
+)
+from interview_tracker.db.models.main_model import User
 from interview_tracker.web.authorization.testing import get_user_token_headers
 
 
@@ -19,3 +26,32 @@ async def test_create_okay(
 
     # Assert response status code
     assert response.status_code == status.HTTP_201_CREATED
+
+
+@pytest.mark.anyio
+async def test_get_user_id_by_sub_creates_user_once(
+    dbsession: AsyncSession,
+) -> None:
+    sub = "64b71e183dd4fa545798abf5"
+
+    user_id = await get_user_id_by_sub(dbsession, sub)
+    assert await get_user_id_by_sub(dbsession, sub) == user_id
+    assert user_id_cache.get(sub) is None
+
+    await dbsession.commit()
+    assert user_id_cache.get(sub) == user_id
+
+    query = select(User.id).where(User.sub == sub)
+    assert (await dbsession.scalars(query)).all() == [user_id]
+
+
+@pytest.mark.anyio
+async def test_rolled_back_user_is_not_cached(_engine: AsyncEngine) -> None:
+    sub = "64b71e183dd4fa545798abf6"
+
+    async with AsyncSession(_engine) as session:
+        await get_user_id_by_sub(session, sub)
+        await get_reader_id_by_sub(session, sub)
+        await session.rollback()
+
+    assert user_id_cache.get(sub) is None
@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+from typing import Any, AsyncGenerator
+
+import pytest
+from sqlalchemy import delete, exc, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from interview_tracker.db.dependencies import get_db_readonly_session, get_db_session
+from interview_tracker.db.models.main_model import User
+from interview_tracker.db.replicas import ReplicaRouter
+from interview_tracker.services.cache.backends import MemoryCacheBackend
+
+SUB = "auth0|dependencies"
+TOKEN: Any = SimpleNamespace(subject=SUB)
+
+
+@pytest.fixture
+async def request_stub(_engine: AsyncEngine) -> AsyncGenerator[Any, None]:
+    session_factory = async_sessionmaker(_engine, expire_on_commit=False)
+    try:
+        yield SimpleNamespace(
+            app=SimpleNamespace(
+                state=SimpleNamespace(
+                    db_session_factory=session_factory,
+                    replica_router=ReplicaRouter(
+                        primary=_engine,
+                        replicas=[],
+                        pins=MemoryCacheBackend(max_size=10),
+                        pin_seconds=5,
+                        max_lag=1,
+                        check_timeout=1,
+                    ),
+                ),
+            ),
+        )
+    finally:
+        async with session_factory() as session:
+            await session.execute(delete(User).filter(User.sub == SUB))
+            await session.commit()
+
+
+async def _user_exists(request_stub: Any) -> bool:
+    query = select(User.id).filter(User.sub == SUB)
+    async with request_stub.app.state.db_session_factory() as session:
+        return await session.scalar(query) is not None
+
+
+@pytest.mark.anyio
+async def test_db_session_keeps_committed_writes(request_stub: Any) -> None:
+    dependency = get_db_session(request_stub, TOKEN)
+    session: AsyncSession = await dependency.asend(None)
+    session.add(User(sub=SUB))
+    await session.commit()
+    with pytest.raises(StopAsyncIteration):
+        await dependency.asend(None)
+
+    assert await _user_exists(request_stub)
+
+
+@pytest.mark.anyio
+async def test_db_session_rolls_back_uncommitted_writes(request_stub: Any) -> None:
+    dependency = get_db_session(request_stub, TOKEN)
+    session: AsyncSession = await dependency.asend(None)
+    session.add(User(sub=SUB))
+    await session.flush()
+    with pytest.raises(StopAsyncIteration):
+        await dependency.asend(None)
+
+    assert not await _user_exists(request_stub)
+
+
+@pytest.mark.anyio
+async def test_db_session_rolls_back_and_reraises(request_stub: Any) -> None:
+    dependency = get_db_session(request_stub, TOKEN)
+    session: AsyncSession = await dependency.asend(None)
+    session.add(User(sub=SUB))
+    await session.flush()
+    with pytest.raises(ValueError, match="handler failed"):
+        await dependency.athrow(ValueError("handler failed"))
+
+    assert not await _user_exists(request_stub)
+
+
+@pytest.mark.anyio
+async def test_db_readonly_session(request_stub: Any) -> None:
+    dependency = get_db_readonly_session(request_stub, TOKEN)
+    session: AsyncSession = await dependency.asend(None)
+    # no connection is checked out before the first query
+    assert not session.in_transaction()
+    assert await session.scalar(text("SHOW transaction_read_only")) == "on"
+    with pytest.raises(exc.DBAPIError, match="read-only transaction"):
+        await session.execute(
+            text("INSERT INTO users (sub) VALUES (:sub)"),
+            {"sub": SUB},
+        )
+    with pytest.raises(StopAsyncIteration):
+        await dependency.asend(None)
+
+    # the connection isn't read only anymore once it's back in the pool
+    async with request_stub.app.state.db_session_factory() as pooled_session:
+        read_only = await pooled_session.scalar(text("SHOW transaction_read_only"))
+    assert read_only == "off"
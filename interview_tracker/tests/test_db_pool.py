@@ -0,0 +1,108 @@
+import json
+import math
+from typing import AsyncGenerator
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from interview_tracker.db.pool import InstrumentedAsyncPool
+from interview_tracker.services.metrics.histogram import Histogram
+from interview_tracker.settings import settings
+from interview_tracker.web.authorization.testing import get_user_token_headers
+
+MONITORING_BEARER = "monitoring"
+POOL_TIMEOUT = 0.1
+
+
+@pytest.fixture
+async def pool_engine(_engine: AsyncEngine) -> AsyncGenerator[AsyncEngine, None]:
+    engine = create_async_engine(
+        str(settings.db_url),
+        poolclass=InstrumentedAsyncPool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=POOL_TIMEOUT,
+        connect_args={"server_settings": {"application_name": "pool_test"}},
+    )
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+def test_histogram() -> None:
+    histogram = Histogram(buckets=[0.1, 1])
+    for value in (0.05, 0.1, 0.5, 5):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    expected_buckets = [(0.1, 2), (1, 3), (math.inf, 4)]
+    assert snapshot.buckets == expected_buckets
+    assert snapshot.observations == 4
+    assert snapshot.sum == pytest.approx(5.65)
+
+
+@pytest.mark.anyio
+async def test_pool_stats(pool_engine: AsyncEngine) -> None:
+    pool = pool_engine.pool
+    assert isinstance(pool, InstrumentedAsyncPool)
+
+    async with pool_engine.connect() as first:
+        name = await first.scalar(text("SHOW application_name"))
+        async with pool_engine.connect():
+            stats = pool.stats()
+            assert (stats.size, stats.checked_out, stats.overflow) == (1, 2, 1)
+            with pytest.raises(exc.TimeoutError):
+                await pool_engine.connect()
+
+    assert name == "pool_test"
+    stats = pool.stats()
+    assert stats.checked_out == 0
+    assert stats.timeouts == 1
+    assert stats.wait_time.observations == 3
+    # the timed out checkout waited for the whole pool timeout
+    assert stats.wait_time.sum >= POOL_TIMEOUT
+
+
+@pytest.mark.anyio
+async def test_pool_stats_endpoint(
+    client: AsyncClient,
+    fastapi_app: FastAPI,
+    pool_engine: AsyncEngine,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "monitoring_token", MONITORING_BEARER)
+    fastapi_app.state.db_engine = pool_engine
+    async with pool_engine.connect():
+        response = await client.get(
+            fastapi_app.url_path_for("pool_stats"),
+            headers={"Authorization": f"Bearer {MONITORING_BEARER}"},
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    response_data = json.loads(response.content)
+    assert response_data["checked_out"] == 1
+    assert response_data["wait_time"]["count"] == 1
+    assert response_data["wait_time"]["buckets"]["+Inf"] == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("route_name", ["pool_stats", "metrics"])
+async def test_monitoring_needs_monitoring_token(
+    client: AsyncClient,
+    fastapi_app: FastAPI,
+    monkeypatch: pytest.MonkeyPatch,
+    route_name: str,
+) -> None:
+    url = fastapi_app.url_path_for(route_name)
+    response = await client.get(url, headers=get_user_token_headers())
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    monkeypatch.setattr(settings, "monitoring_token", MONITORING_BEARER)
+    response = await client.get(url, headers=get_user_token_headers())
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    response = await client.get(url)
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,252 @@
+import asyncio
+import json
+import math
+from functools import partial
+from types import SimpleNamespace
+from typing import Any, AsyncGenerator, Dict
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from interview_tracker.db.data_access_layer.user import get_user_id_by_sub
+from interview_tracker.db.dependencies import (
+    PIN_USER,
+    commit,
+    get_db_readonly_session,
+    get_db_session,
+)
+from interview_tracker.db.meta import meta
+from interview_tracker.db.models.main_model import Application, User
+from interview_tracker.db.replicas import ReplicaRouter
+from interview_tracker.db.utils import create_database, drop_database
+from interview_tracker.services.cache.backends import MemoryCacheBackend
+from interview_tracker.settings import settings
+from interview_tracker.web.authorization.testing import (
+    get_user_token_headers,
+    testing_users,
+)
+
+REPLICA_BASE = f"{settings.db_base}_replica"
+SUB = "auth0|replicas"
+
+
+@pytest.fixture(scope="session")
+async def replica_engine(_engine: AsyncEngine) -> AsyncGenerator[AsyncEngine, None]:
+    """
+    Second database standing in for a read replica.
+
+    :param _engine: engine of the primary.
+    :yield: engine of the replica.
+    """
+    await create_database(REPLICA_BASE)
+    engine = create_async_engine(str(settings.db_url.with_path(f"/{REPLICA_BASE}")))
+    async with engine.begin() as conn:
+        await conn.run_sync(meta.create_all)
+
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+        await drop_database(REPLICA_BASE)
+
+
+@pytest.fixture
+def router(_engine: AsyncEngine, replica_engine: AsyncEngine) -> ReplicaRouter:
+    return ReplicaRouter(
+        primary=_engine,
+        replicas=[replica_engine],
+        pins=MemoryCacheBackend(max_size=10),
+        pin_seconds=5,
+        max_lag=1,
+        check_timeout=1,
+    )
+
+
+async def _database(session_factory: async_sessionmaker[AsyncSession]) -> str:
+    async with session_factory() as session:
+        return await session.scalar(text("SELECT current_database()"))  # type: ignore
+
+
+@pytest.mark.anyio
+async def test_reads_go_to_checked_replicas(router: ReplicaRouter) -> None:
+    # not checked yet
+    assert await _database(await router.session_factory(SUB)) == settings.db_base
+
+    await router.check_lag()
+
+    assert router.replicas[0].lag == 0
+    assert await _database(await router.session_factory(SUB)) == REPLICA_BASE
+
+
+@pytest.mark.anyio
+async def test_lagging_replicas_are_skipped(  # noqa: WPS217
+    _engine: AsyncEngine,
+    router: ReplicaRouter,
+    replica_engine: AsyncEngine,
+) -> None:
+    unreachable = create_async_engine(
+        str(settings.db_url.with_port(1)),
+        connect_args={"timeout": 0.5},
+    )
+    lagging_router = ReplicaRouter(
+        primary=_engine,
+        replicas=[unreachable, replica_engine],
+        pins=router.pins,
+        pin_seconds=5,
+        max_lag=1,
+        check_timeout=1,
+    )
+    await lagging_router.check_lag()
+
+    assert lagging_router.replicas[0].lag == math.inf
+    for _ in range(3):
+        session_factory = await lagging_router.session_factory(SUB)
+        assert await _database(session_factory) == REPLICA_BASE
+
+    lagging_router.replicas[1].lag = 3
+    assert await _database(await lagging_router.session_factory(SUB)) == (
+        settings.db_base
+    )
+    await unreachable.dispose()
+
+
+@pytest.mark.anyio
+async def test_writers_are_pinned_to_the_primary(  # noqa: WPS217
+    router: ReplicaRouter,
+) -> None:
+    await router.check_lag()
+    router.pin_seconds = 0.1
+    await router.pin(SUB)
+
+    assert await _database(await router.session_factory(SUB)) == settings.db_base
+    assert await _database(await router.session_factory("auth0|other")) == (
+        REPLICA_BASE
+    )
+
+    await asyncio.sleep(0.2)
+    assert await _database(await router.session_factory(SUB)) == REPLICA_BASE
+
+
+async def _readonly_database(request: Any, token: Any) -> str:
+    reader = get_db_readonly_session(request, token)
+    session = await reader.asend(None)
+    database = await session.scalar(text("SELECT current_database()"))
+    await reader.aclose()
+    return database  # type: ignore
+
+
+@pytest.mark.anyio
+async def test_reads_follow_committed_writes(  # noqa: WPS217
+    _engine: AsyncEngine,
+    router: ReplicaRouter,
+) -> None:
+    await router.check_lag()
+    request: Any = SimpleNamespace(
+        app=SimpleNamespace(
+            state=SimpleNamespace(
+                db_session_factory=async_sessionmaker(_engine),
+                replica_router=router,
+            ),
+        ),
+    )
+    token: Any = SimpleNamespace(subject=SUB)
+
+    writer = get_db_session(request, token)
+    session = await writer.asend(None)
+    # nothing changed, nothing to pin
+    await commit(session)
+    assert await _readonly_database(request, token) == REPLICA_BASE
+
+    await session.execute(insert(User).values(sub=SUB))
+    assert await _readonly_database(request, token) == REPLICA_BASE
+    await commit(session)
+    assert await _readonly_database(request, token) == settings.db_base
+
+    await session.execute(delete(User).where(User.sub == SUB))
+    await commit(session)
+    with pytest.raises(StopAsyncIteration):
+        await writer.asend(None)
+
+
+@pytest.mark.anyio
+async def test_reads_follow_created_applications(  # noqa: WPS217
+    fastapi_app: FastAPI,
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    router: ReplicaRouter,
+    application_request_body: Dict[str, Any],
+) -> None:
+    await router.check_lag()
+    sub = testing_users["user_1"][1]
+    # an existing user, creating one would be a write of its own
+    await get_user_id_by_sub(dbsession, sub)
+    await commit(dbsession)
+    dbsession.info[PIN_USER] = partial(router.pin, sub)
+    assert await _database(await router.session_factory(sub)) == REPLICA_BASE
+
+    # the insert runs in the CTEs of a SELECT
+    response = await client.post(
+        fastapi_app.url_path_for("create_application"),
+        json=application_request_body,
+        headers=get_user_token_headers(),
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert await _database(await router.session_factory(sub)) == settings.db_base
+
+
+@pytest.mark.anyio
+async def test_reads_follow_updated_applications(  # noqa: WPS217
+    fastapi_app: FastAPI,
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    router: ReplicaRouter,
+    application_request_body: Dict[str, Any],
+) -> None:
+    await router.check_lag()
+    sub = testing_users["user_1"][1]
+    # created before the pins are wired in, like by an earlier request
+    await client.post(
+        fastapi_app.url_path_for("create_application"),
+        json=application_request_body,
+        headers=get_user_token_headers(),
+    )
+    application_id = await dbsession.scalar(select(Application.id))
+    dbsession.info[PIN_USER] = partial(router.pin, sub)
+
+    async def _routed_session() -> AsyncGenerator[AsyncSession, None]:  # noqa: WPS430
+        # the primary's data is in the test transaction, the replica is empty
+        session_factory = await router.session_factory(sub)
+        if session_factory is router.primary:
+            yield dbsession
+        else:
+            async with session_factory() as session:
+                yield session
+
+    fastapi_app.dependency_overrides[get_db_readonly_session] = _routed_session
+    url = fastapi_app.url_path_for(
+        "get_application_by_id",
+        application_id=application_id,
+    )
+    response = await client.get(url, headers=get_user_token_headers())
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    # only attributes of the loaded application change, flushed by the commit
+    response = await client.put(
+        fastapi_app.url_path_for("update_application", application_id=application_id),
+        json={"company_name": "Renamed"},
+        headers=get_user_token_headers(),
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await client.get(url, headers=get_user_token_headers())
+    assert response.status_code == status.HTTP_200_OK
+    assert json.loads(response.content)["application"]["company_name"] == "Renamed"
@@ -1,4 +1,4 @@
-from typing import Any, Awaitable, Callable, Dict
+from typing import Any, Awaitable, Callable, Dict, List
 
 import pytest
 from fastapi import FastAPI, status
@@ -110,3 +110,33 @@ async def test_delete_applications_no_access(
         headers=headers,
     )
     assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.anyio
+async def test_delete_applications_single_statement(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+    executed_statements: List[str],
+) -> None:
+    application = await mock_application(user_test_id="user_1")
+    url = fastapi_app.url_path_for(
+        "delete_application",
+        application_id=application.id,
+    )
+    headers = get_user_token_headers()
+    executed_statements.clear()
+    response = await client.delete(
+        url=url,
+        headers=headers,
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    statements = [
+        statement
+        for statement in executed_statements
+        if "applications" in statement or "timelines" in statement
+    ]
+    assert len(statements) == 1
+    assert statements[0].startswith("DELETE FROM applications")
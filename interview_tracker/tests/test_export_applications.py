@@ -0,0 +1,78 @@
+import csv
+import io
+import json
+from typing import Awaitable, Callable
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from interview_tracker.db.models.main_model import Application
+from interview_tracker.web.authorization.testing import get_user_token_headers
+
+
+@pytest.mark.anyio
+async def test_export_applications_ndjson(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+) -> None:
+    with_timelines = await mock_application(company_name="Company 1")
+    without_timelines = await mock_application(company_name="Company 2", timelines=[])
+    await mock_application(user_test_id="user_2")
+    url = fastapi_app.url_path_for("export_applications")
+    response = await client.get(url=url, headers=get_user_token_headers())
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [with_timelines.id, without_timelines.id]
+    assert rows[0]["company_name"] == "Company 1"
+    assert rows[0]["status_category"] == "red"
+    assert rows[0]["notes"] == with_timelines.notes
+    assert [timeline["name"] for timeline in rows[0]["timelines"]] == [
+        "Interview 1",
+        "Interview 2",
+    ]
+    assert not rows[1]["timelines"]
+    assert "user_id" not in rows[0]
+
+
+@pytest.mark.anyio
+async def test_export_applications_csv_round_trip(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+) -> None:
+    application = await mock_application(notes='quoted "notes",\nwith newline')
+    headers = get_user_token_headers()
+    response = await client.get(
+        url=fastapi_app.url_path_for("export_applications"),
+        headers=headers,
+        params={"format": "csv"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert rows[0]["id"] == str(application.id)
+    assert rows[0]["on_site_remote"] == "remote"
+    assert rows[0]["notes"] == application.notes
+    assert len(json.loads(rows[0]["timelines"])) == 2
+
+    # an export can be imported back
+    response = await client.post(
+        url=fastapi_app.url_path_for("import_applications"),
+        headers={**headers, "content-type": "text/csv"},
+        content=response.content,
+    )
+    assert json.loads(response.content) == {"imported": 1, "errors": []}
+    count = await dbsession.scalar(
+        select(func.count()).filter(Application.notes == application.notes),
+    )
+    assert count == 2
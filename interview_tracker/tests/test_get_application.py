@@ -1,5 +1,5 @@
 import json
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, List
 
 import pytest
 from fastapi import FastAPI, status
@@ -55,6 +55,7 @@ async def test_get_applications_no_access(
     dbsession: AsyncSession,
     fastapi_app: FastAPI,
     mock_application: Callable[..., Awaitable[Application]],
+    executed_statements: List[str],
 ) -> None:
     application = await mock_application(user_test_id="user_1")
     url = fastapi_app.url_path_for(
@@ -62,11 +63,20 @@ async def test_get_applications_no_access(
         application_id=application.id,
     )
     headers = get_user_token_headers(user_id="user_2")
+    executed_statements.clear()
     response = await client.get(
         url=url,
         headers=headers,
     )
     assert response.status_code == status.HTTP_403_FORBIDDEN
+    # an owner-scoped lookup and an existence probe, timelines aren't touched
+    lookups = [
+        statement
+        for statement in executed_statements
+        if "applications" in statement or "timelines" in statement
+    ]
+    assert len(lookups) == 2
+    assert not any("timelines" in statement for statement in lookups)
 
 
 @pytest.mark.anyio
@@ -87,3 +97,43 @@ async def test_get_applications_not_found(
         headers=headers,
     )
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.anyio
+async def test_get_application_conditional(  # noqa: WPS217
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+) -> None:
+    application = await mock_application()
+    url = fastapi_app.url_path_for(
+        "get_application_by_id",
+        application_id=application.id,
+    )
+    put_url = fastapi_app.url_path_for(
+        "update_application",
+        application_id=application.id,
+    )
+    headers = get_user_token_headers()
+    response = await client.get(url=url, headers=headers)
+    etag = response.headers["etag"]
+
+    response = await client.get(url=url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == etag
+    assert not response.content
+
+    # an update that doesn't change anything keeps the version
+    await client.put(url=put_url, headers=headers, json={"status": application.status})
+    response = await client.get(url=url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    await client.put(
+        url=put_url,
+        headers=headers,
+        json={"timelines": [{"name": "Offer", "value": "2023-09-01"}]},
+    )
+    response = await client.get(url=url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
@@ -1,5 +1,5 @@
 import json
-from typing import Awaitable, Callable
+from typing import Any, Awaitable, Callable, Dict, List
 
 import pytest
 from fastapi import FastAPI, status
@@ -7,6 +7,7 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from interview_tracker.db.models.main_model import Application
+from interview_tracker.settings import settings
 from interview_tracker.web.authorization.testing import get_user_token_headers
 
 
@@ -33,6 +34,7 @@ async def test_get_applications_okay(  # noqa: WPS218
     assert app["attractiveness_scale"] == application.attractiveness_scale
     assert app["status"] == application.status
     assert app["status_category"] == application.status_category
+    assert "notes" not in app
 
 
 @pytest.mark.anyio
@@ -83,3 +85,171 @@ async def test_get_applications_not_found(
         headers=headers,
     )
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.anyio
+async def test_get_applications_pages(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+) -> None:
+    created = [
+        await mock_application(company_name=f"Test Company {index}")
+        for index in range(5)
+    ]
+    url = fastapi_app.url_path_for("get_applications")
+    headers = get_user_token_headers()
+
+    ids: List[int] = []
+    params: Dict[str, Any] = {"limit": 2}
+    for _ in range(3):
+        response = await client.get(url=url, headers=headers, params=params)
+        assert response.status_code == status.HTTP_200_OK
+        response_data = json.loads(response.content)
+        ids.extend(app["id"] for app in response_data["applications"])
+        params["cursor"] = response_data.get("next_cursor")
+
+    assert ids == [app.id for app in created]
+    assert params["cursor"] is None
+
+
+@pytest.mark.anyio
+async def test_get_applications_sorted(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+) -> None:
+    for scale in (3, 5, 1, 5, 2):
+        await mock_application(attractiveness_scale=scale)
+    url = fastapi_app.url_path_for("get_applications")
+    headers = get_user_token_headers()
+
+    scales: List[int] = []
+    params: Dict[str, Any] = {"limit": 3, "sort": "-attractiveness_scale"}
+    while True:
+        response = await client.get(url=url, headers=headers, params=params)
+        response_data = json.loads(response.content)
+        scales.extend(
+            app["attractiveness_scale"] for app in response_data["applications"]
+        )
+        if "next_cursor" not in response_data:
+            break
+        params["cursor"] = response_data["next_cursor"]
+
+    assert scales == [5, 5, 3, 2, 1]
+
+
+@pytest.mark.anyio
+async def test_get_applications_filtered(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+) -> None:
+    await mock_application(status_category="red", attractiveness_scale=1)
+    green = await mock_application(status_category="green", attractiveness_scale=4)
+    await mock_application(status_category="green", attractiveness_scale=2)
+    url = fastapi_app.url_path_for("get_applications")
+    headers = get_user_token_headers()
+
+    response = await client.get(
+        url=url,
+        headers=headers,
+        params={"status_category": "green", "attractiveness_scale": 4},
+    )
+    response_data = json.loads(response.content)
+    assert [app["id"] for app in response_data["applications"]] == [green.id]
+
+    response = await client.get(url=url, headers=headers, params={"archived": True})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.anyio
+async def test_get_applications_bad_cursor(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+) -> None:
+    for _ in range(2):
+        await mock_application()
+    url = fastapi_app.url_path_for("get_applications")
+    headers = get_user_token_headers()
+    response = await client.get(url=url, headers=headers, params={"limit": 1})
+    cursor = json.loads(response.content)["next_cursor"]
+
+    for params in (
+        {"cursor": "not a cursor"},
+        {"cursor": cursor, "sort": "company_name"},
+    ):
+        response = await client.get(url=url, headers=headers, params=params)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await client.get(
+        url=url,
+        headers=headers,
+        params={"limit": settings.applications_page_size_max + 1},
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def _get_if_none_match(
+    client: AsyncClient,
+    url: str,
+    etag: str,
+    **params: Any,
+) -> Any:
+    return await client.get(
+        url=url,
+        headers={**get_user_token_headers(), "If-None-Match": etag},
+        params=params,
+    )
+
+
+@pytest.mark.anyio
+async def test_get_applications_conditional(  # noqa: WPS217
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+) -> None:
+    application = await mock_application()
+    other_application = await mock_application()
+    url = fastapi_app.url_path_for("get_applications")
+    headers = get_user_token_headers()
+
+    etag = (await client.get(url=url, headers=headers)).headers["etag"]
+    assert (
+        await _get_if_none_match(client, url, etag)
+    ).status_code == status.HTTP_304_NOT_MODIFIED
+    assert (
+        await _get_if_none_match(client, url, f"W/{etag}, ")
+    ).status_code == status.HTTP_304_NOT_MODIFIED
+    assert (
+        await _get_if_none_match(client, url, etag, limit=1)
+    ).status_code == status.HTTP_200_OK
+
+    await client.put(
+        url=fastapi_app.url_path_for(
+            "update_application",
+            application_id=application.id,
+        ),
+        headers=headers,
+        json={"company_name": "Renamed Company"},
+    )
+    response = await _get_if_none_match(client, url, etag)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["etag"]
+
+    await client.delete(
+        url=fastapi_app.url_path_for(
+            "delete_application",
+            application_id=other_application.id,
+        ),
+        headers=headers,
+    )
+    assert (
+        await _get_if_none_match(client, url, etag)
+    ).status_code == status.HTTP_200_OK
@@ -0,0 +1,204 @@
+import json
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from interview_tracker.db.models.main_model import Application, Timeline
+from interview_tracker.settings import settings
+from interview_tracker.web.authorization.testing import get_user_token_headers
+
+
+@pytest.mark.anyio
+async def test_import_applications_json(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    application_request_body: Dict[str, Any],
+) -> None:
+    invalid = dict(application_request_body, attractiveness_scale=9)
+    url = fastapi_app.url_path_for("import_applications")
+    response = await client.post(
+        url=url,
+        headers=get_user_token_headers(),
+        json=[application_request_body, invalid, application_request_body],
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    response_data = json.loads(response.content)
+    assert response_data["imported"] == 2
+    assert [error["row"] for error in response_data["errors"]] == [2]
+    row_errors = response_data["errors"][0]["errors"]
+    assert row_errors[0]["loc"] == ["attractiveness_scale"]
+
+    applications = (await dbsession.scalars(select(Application))).all()
+    assert len(applications) == 2
+    assert {app.company_name for app in applications} == {"Test Company"}
+    assert {app.status_category for app in applications} == {"red"}
+    timelines = await dbsession.scalar(select(func.count()).select_from(Timeline))
+    assert timelines == 4
+
+
+@pytest.mark.anyio
+async def test_import_applications_ndjson(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    application_request_body: Dict[str, Any],
+) -> None:
+    lines = [json.dumps(application_request_body), "", "{not json", "[]"]
+    url = fastapi_app.url_path_for("import_applications")
+    response = await client.post(
+        url=url,
+        headers={
+            **get_user_token_headers(),
+            "content-type": "application/x-ndjson",
+        },
+        content="\n".join(lines).encode(),
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    response_data = json.loads(response.content)
+    assert response_data["imported"] == 1
+    assert [error["row"] for error in response_data["errors"]] == [2, 3]
+
+
+@pytest.mark.anyio
+async def test_import_applications_all_invalid(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    application_request_body: Dict[str, Any],
+    executed_statements: List[str],
+) -> None:
+    invalid = dict(application_request_body, attractiveness_scale=9)
+    response = await client.post(
+        url=fastapi_app.url_path_for("import_applications"),
+        headers=get_user_token_headers(),
+        json=[invalid, invalid],
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    response_data = json.loads(response.content)
+    assert response_data["imported"] == 0
+    assert [error["row"] for error in response_data["errors"]] == [1, 2]
+    # nothing is loaded, so neither ids nor stats are touched
+    for statement in executed_statements:
+        assert "nextval" not in statement
+        assert "application_stats" not in statement
+    count = select(func.count()).select_from(Application)
+    assert await dbsession.scalar(count) == 0
+
+
+async def _chunks(body: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+@pytest.mark.anyio
+async def test_import_applications_csv(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+) -> None:
+    body = (
+        "company_name,job_title,status,attractiveness_scale,status_category,"
+        "on_site_remote,notes,timelines\n"
+        'Acme,Engineer,Applied,4,green,remote,"multi\nline",'
+        '"[{""name"": ""Applied"", ""value"": ""2023-07-01""}]"\n'
+        "Initech,Engineer,Applied,3,blue,,,\n"
+        ",Engineer,Applied,3,blue,,,\n"
+    )
+    url = fastapi_app.url_path_for("import_applications")
+    # records and quoted cells are split across the chunks of the stream
+    response = await client.post(
+        url=url,
+        headers={**get_user_token_headers(), "content-type": "text/csv"},
+        content=_chunks(f"\ufeff{body}".encode(), size=7),
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    response_data = json.loads(response.content)
+    assert response_data["imported"] == 2
+    assert [error["row"] for error in response_data["errors"]] == [3]
+
+    acme = await dbsession.scalar(
+        select(Application).filter_by(company_name="Acme"),
+    )
+    assert acme is not None
+    assert acme.notes == "multi\nline"
+    assert acme.on_site_remote == "remote"
+    timelines = (await dbsession.scalars(select(Timeline))).all()
+    assert [(row.application_id, row.name) for row in timelines] == [
+        (acme.id, "Applied"),
+    ]
+
+
+@pytest.mark.anyio
+async def test_import_applications_bad_requests(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    application_request_body: Dict[str, Any],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    url = fastapi_app.url_path_for("import_applications")
+    headers = get_user_token_headers()
+
+    response = await client.post(
+        url=url,
+        headers={**headers, "content-type": "text/plain"},
+        content=b"",
+    )
+    assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+    response = await client.post(url=url, headers=headers, json={"rows": []})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    monkeypatch.setattr(settings, "applications_import_max_rows", 2)
+    response = await client.post(
+        url=url,
+        headers=headers,
+        json=[application_request_body for _ in range(3)],
+    )
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    monkeypatch.setattr(settings, "applications_import_max_json_bytes", 100)
+    response = await client.post(
+        url=url,
+        headers=headers,
+        json=[application_request_body],
+    )
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+@pytest.mark.anyio
+async def test_import_applications_in_batches(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    application_request_body: Dict[str, Any],
+    executed_statements: List[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "applications_import_batch_size", 2)
+    invalid = dict(application_request_body, attractiveness_scale=9)
+    rows = [application_request_body, invalid]
+    rows.extend(application_request_body for _ in range(4))
+    response = await client.post(
+        url=fastapi_app.url_path_for("import_applications"),
+        headers=get_user_token_headers(),
+        json=rows,
+    )
+
+    assert response.status_code == status.HTTP_201_CREATED
+    response_data = json.loads(response.content)
+    assert response_data["imported"] == 5
+    assert [error["row"] for error in response_data["errors"]] == [2]
+    # ids are reserved once per batch of 2, 2 and 1 applications
+    assert sum("nextval" in statement for statement in executed_statements) == 3
+    count = select(func.count()).select_from(Application)
+    assert await dbsession.scalar(count) == 5
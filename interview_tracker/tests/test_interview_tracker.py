@@ -1,8 +1,37 @@
+import json
+from typing import AsyncGenerator, List
+
 import pytest
 from fastapi import FastAPI
 from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from starlette import status
 
+from interview_tracker.db.pool import InstrumentedAsyncPool
+from interview_tracker.settings import settings
+from interview_tracker.web.api.monitoring import health
+from interview_tracker.web.authorization.jwks import JwksKeyStore
+
+
+@pytest.fixture
+async def probed_engine(
+    fastapi_app: FastAPI,
+    _engine: AsyncEngine,
+) -> AsyncGenerator[AsyncEngine, None]:
+    engine = create_async_engine(
+        str(settings.db_url),
+        poolclass=InstrumentedAsyncPool,
+        pool_size=1,
+        max_overflow=0,
+    )
+    fastapi_app.state.db_engine = engine
+    fastapi_app.state.readiness_probe.timeout = 0.2
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
 
 @pytest.mark.anyio
 async def test_health(client: AsyncClient, fastapi_app: FastAPI) -> None:
@@ -15,3 +44,81 @@ async def test_health(client: AsyncClient, fastapi_app: FastAPI) -> None:
     url = fastapi_app.url_path_for("health_check")
     response = await client.get(url)
     assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.anyio
+async def test_liveness(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    response = await client.get(fastapi_app.url_path_for("liveness_check"))
+    assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.anyio
+async def test_readiness_is_cached(
+    client: AsyncClient,
+    fastapi_app: FastAPI,
+    probed_engine: AsyncEngine,
+) -> None:
+    statements: List[str] = []
+    event.listen(
+        probed_engine.sync_engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+    url = fastapi_app.url_path_for("readiness_check")
+
+    responses = [await client.get(url) for _ in range(3)]
+
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    report = json.loads(responses[0].content)
+    assert report["ready"] is True
+    assert report["database"]["latency"] > 0
+    assert report["pool"] == {"ok": True, "headroom": 1}
+    assert report["jwks"]["keys"] >= 1
+    assert statements.count("SELECT 1") == 1
+
+
+@pytest.mark.anyio
+async def test_not_ready_when_pool_is_exhausted(
+    client: AsyncClient,
+    fastapi_app: FastAPI,
+    probed_engine: AsyncEngine,
+) -> None:
+    async with probed_engine.connect():
+        response = await client.get(fastapi_app.url_path_for("readiness_check"))
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    report = json.loads(response.content)
+    assert report["ready"] is False
+    assert report["pool"] == {"ok": False, "headroom": 0}
+    assert report["database"] == {
+        "ok": False,
+        "latency": None,
+        "error": "TimeoutError",
+    }
+
+
+@pytest.mark.anyio
+async def test_not_ready_without_signing_keys(
+    client: AsyncClient,
+    fastapi_app: FastAPI,
+    probed_engine: AsyncEngine,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    key_store = JwksKeyStore(
+        jwks_uri="http://127.0.0.1:1/.well-known/jwks.json",
+        ttl=600,
+        min_refresh_interval=30,
+        timeout=0.1,
+    )
+    monkeypatch.setattr(health, "jwks_key_store", key_store)
+
+    response = await client.get(fastapi_app.url_path_for("readiness_check"))
+
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    report = json.loads(response.content)
+    assert report["database"]["ok"] is True
+    assert report["jwks"] == {
+        "ok": False,
+        "keys": 0,
+        "error": "PyJWKClientConnectionError",
+    }
@@ -0,0 +1,108 @@
+import asyncio
+import json
+from typing import Any, Dict, Generator
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from interview_tracker.web.authorization.jwks import JwksKeyStore
+from interview_tracker.web.authorization.testing import StubJwksServer
+
+
+def _make_jwk(kid: str) -> Dict[str, Any]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update(kid=kid, alg="RS256", use="sig")
+    return jwk
+
+
+@pytest.fixture
+def jwks_server() -> Generator[StubJwksServer, None, None]:
+    server = StubJwksServer()
+    server.keys.append(_make_jwk("kid-1"))
+    server.start()
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+def _make_store(
+    server: StubJwksServer,
+    min_refresh_interval: float = 30,
+    timeout: float = 5,
+) -> JwksKeyStore:
+    return JwksKeyStore(
+        jwks_uri=server.url,
+        ttl=600,
+        min_refresh_interval=min_refresh_interval,
+        timeout=timeout,
+    )
+
+
+@pytest.mark.anyio
+async def test_keys_are_cached(jwks_server: StubJwksServer) -> None:
+    store = _make_store(jwks_server)
+
+    for _ in range(5):
+        assert (await store.get_signing_key("kid-1")).key_id == "kid-1"
+
+    assert jwks_server.requests == 1
+
+
+@pytest.mark.anyio
+async def test_concurrent_misses_share_one_fetch(
+    jwks_server: StubJwksServer,
+) -> None:
+    jwks_server.delay = 0.2
+    store = _make_store(jwks_server)
+
+    keys = await asyncio.gather(
+        *[store.get_signing_key("kid-1") for _ in range(20)],
+    )
+
+    assert {key.key_id for key in keys} == {"kid-1"}
+    assert jwks_server.requests == 1
+
+
+@pytest.mark.anyio
+async def test_unknown_kid_forces_rate_limited_refresh(
+    jwks_server: StubJwksServer,
+) -> None:
+    store = _make_store(jwks_server)
+    await store.get_signing_key("kid-1")
+
+    # the issuer rotates its keys
+    jwks_server.keys.append(_make_jwk("kid-2"))
+    assert (await store.get_signing_key("kid-2")).key_id == "kid-2"
+    assert jwks_server.requests == 2
+
+    # unknown kids don't hit the issuer again within the refresh interval
+    for _ in range(3):
+        with pytest.raises(jwt.exceptions.PyJWKClientError):
+            await store.get_signing_key("kid-unknown")
+    assert jwks_server.requests == 2
+
+
+@pytest.mark.anyio
+async def test_stale_keys_served_while_issuer_is_down(
+    jwks_server: StubJwksServer,
+) -> None:
+    store = _make_store(jwks_server)
+    await store.get_signing_key("kid-1")
+
+    jwks_server.is_down = True
+    await store.refresh()
+
+    assert jwks_server.requests == 2
+    assert (await store.get_signing_key("kid-1")).key_id == "kid-1"
+
+
+@pytest.mark.anyio
+async def test_slow_issuer_times_out(jwks_server: StubJwksServer) -> None:
+    jwks_server.delay = 1
+    store = _make_store(jwks_server, timeout=0.1)
+
+    with pytest.raises(jwt.exceptions.PyJWKClientError):
+        await store.get_signing_key("kid-1")
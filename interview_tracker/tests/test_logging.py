@@ -0,0 +1,157 @@
+import atexit
+import io
+import json
+import logging
+import threading
+from typing import Any, Dict, Generator, List
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from httpx import AsyncClient
+from loguru import logger
+
+from interview_tracker.logger import (
+    InterceptHandler,
+    JsonSink,
+    QueuedSink,
+    StreamSink,
+    use_stdlib_origin,
+)
+from interview_tracker.web.access_log import AccessLogMiddleware
+
+
+@pytest.fixture
+def json_logs() -> Generator[io.StringIO, None, None]:
+    stream = io.StringIO()
+    logger.configure(patcher=use_stdlib_origin)
+    sink_id = logger.add(JsonSink(stream), level="INFO")
+    try:
+        yield stream
+    finally:
+        logger.remove(sink_id)
+
+
+@pytest.fixture
+def intercepted_logger() -> Generator[logging.Logger, None, None]:
+    stdlib_logger = logging.getLogger("interview_tracker.tests.stdlib")
+    stdlib_logger.addHandler(InterceptHandler())
+    stdlib_logger.propagate = False
+    yield stdlib_logger
+    stdlib_logger.handlers = []
+    stdlib_logger.propagate = True
+
+
+def _records(stream: io.StringIO) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_json_sink(json_logs: io.StringIO) -> None:
+    logger.bind(request_id=7, level="bound").info("created {0}", "application")
+    try:
+        int("boom")
+    except ValueError:
+        logger.exception("failed")
+
+    created, failed = _records(json_logs)
+    assert created["message"] == "created application"
+    # bound values don't overwrite the fields of the record
+    assert created["level"] == "INFO"
+    assert created["function"] == "test_json_sink"
+    assert created["request_id"] == 7
+    assert "\n" not in json_logs.getvalue().splitlines()[0]
+    assert failed["level"] == "ERROR"
+    assert 'int("boom")' in failed["exception"]
+
+
+def test_stdlib_records_keep_their_caller(
+    json_logs: io.StringIO,
+    intercepted_logger: logging.Logger,
+) -> None:
+    intercepted_logger.warning("from %s", "stdlib")  # noqa: WPS323
+
+    records = _records(json_logs)
+    assert len(records) == 1
+    record = records[0]
+    assert record["message"] == "from stdlib"
+    assert record["level"] == "WARNING"
+    assert record["logger"] == "interview_tracker.tests.stdlib"
+    assert record["function"] == "test_stdlib_records_keep_their_caller"
+    assert "stdlib_origin" not in record
+
+
+def test_queued_sink_writes_from_its_thread() -> None:
+    stream = io.StringIO()
+    threads = []
+
+    def sink(message: Any) -> None:  # noqa: WPS430
+        threads.append(threading.current_thread().name)
+        JsonSink(stream)(message)
+
+    queued_sink = QueuedSink(sink)
+    sink_id = logger.add(queued_sink, level="INFO")
+    for number in range(3):
+        logger.info("message {0}", number)
+    logger.remove(sink_id)
+    queued_sink.stop()
+    logger.info("after stop")
+
+    assert [record["message"] for record in _records(stream)] == [
+        "message 0",
+        "message 1",
+        "message 2",
+    ]
+    assert threads == ["log-writer", "log-writer", "log-writer"]
+
+
+def test_stopped_queued_sink_leaves_atexit(monkeypatch: pytest.MonkeyPatch) -> None:
+    exit_handlers: List[Any] = []
+    monkeypatch.setattr(atexit, "register", exit_handlers.append)
+    monkeypatch.setattr(atexit, "unregister", exit_handlers.remove)
+
+    queued_sink = QueuedSink(StreamSink(io.StringIO()))
+    assert exit_handlers == [queued_sink.stop]
+
+    queued_sink.stop()
+    assert not exit_handlers
+
+
+@pytest.mark.anyio
+async def test_access_log_sampling(json_logs: io.StringIO) -> None:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> Dict[str, int]:  # noqa: WPS430
+        if item_id == 0:
+            raise HTTPException(status_code=404)
+        return {"id": item_id}
+
+    app.add_middleware(AccessLogMiddleware, sample_rate=0, slow_seconds=60)
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        for item_id in (1, 0, 2):
+            await client.get(f"/items/{item_id}", params={"q": "secret"})
+
+    records = _records(json_logs)
+    assert [record["path"] for record in records] == ["/items/0"]
+    assert records[0]["status"] == 404
+    assert records[0]["message"].startswith(
+        '127.0.0.1:123 - "GET /items/0 HTTP/1.1" 404',
+    )
+    assert "secret" not in json_logs.getvalue()
+
+
+@pytest.mark.anyio
+async def test_access_log_keeps_slow_requests(json_logs: io.StringIO) -> None:
+    app = FastAPI()
+
+    @app.get("/")
+    async def index() -> Dict[str, int]:  # noqa: WPS430
+        return {}
+
+    app.add_middleware(AccessLogMiddleware, sample_rate=0, slow_seconds=0)
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        await client.get("/")
+
+    records = _records(json_logs)
+    assert len(records) == 1
+    assert records[0]["status"] == 200
+    assert records[0]["duration_ms"] >= 0
@@ -0,0 +1,266 @@
+import re
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Generator, List
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from interview_tracker.db.data_access_layer.application import copy_applications
+from interview_tracker.db.data_access_layer.user import get_user_id_by_sub
+from interview_tracker.db.models.main_model import Application
+from interview_tracker.db.pool import InstrumentedAsyncPool
+from interview_tracker.db.replicas import ReplicaRouter
+from interview_tracker.services.cache.backends import MemoryCacheBackend
+from interview_tracker.services.metrics.exposition import CONTENT_TYPE, PrometheusWriter
+from interview_tracker.services.metrics.histogram import Histogram
+from interview_tracker.services.metrics.middleware import MetricsMiddleware
+from interview_tracker.services.metrics.queries import (
+    QueryStats,
+    current_query_stats,
+    normalize_sql,
+)
+from interview_tracker.services.metrics.registry import MetricsRegistry
+from interview_tracker.settings import settings
+from interview_tracker.web.api.applications.post.schemas.application import (
+    ApplicationPostMessage,
+)
+from interview_tracker.web.authorization.testing import get_user_token_headers
+
+MONITORING_BEARER = "monitoring"
+
+
+@pytest.fixture
+async def metrics_app(
+    fastapi_app: FastAPI,
+    _engine: AsyncEngine,
+) -> AsyncGenerator[FastAPI, None]:
+    engine = create_async_engine(str(settings.db_url), poolclass=InstrumentedAsyncPool)
+    fastapi_app.state.db_engine = engine
+    fastapi_app.state.replica_router = ReplicaRouter(
+        primary=engine,
+        replicas=[_engine],
+        pins=MemoryCacheBackend(max_size=10),
+        pin_seconds=5,
+        max_lag=1,
+        check_timeout=1,
+    )
+    try:
+        yield fastapi_app
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+def log_messages() -> Generator[List[str], None, None]:
+    messages: List[str] = []
+    sink_id = logger.add(
+        lambda message: messages.append(message.record["message"]),
+        level="WARNING",
+    )
+    try:
+        yield messages
+    finally:
+        logger.remove(sink_id)
+
+
+def _samples(page: str) -> List[str]:
+    return [line for line in page.splitlines() if not line.startswith("#")]
+
+
+def test_prometheus_writer() -> None:
+    histogram = Histogram(buckets=[1])
+    histogram.observe(0.5)
+    writer = PrometheusWriter()
+    writer.family("lag_seconds", "gauge", "Lag.")
+    label_value = "".join(['a "b"', r"\c", "\n"])
+    writer.sample("lag_seconds", float("inf"), {"name": label_value})
+    writer.family("wait_seconds", "histogram", "Wait.")
+    writer.histogram("wait_seconds", histogram.snapshot(), {"pool": "main"})
+
+    assert writer.render().splitlines() == [
+        "# HELP lag_seconds Lag.",
+        "# TYPE lag_seconds gauge",
+        r'lag_seconds{name="a \"b\"\\c\n"} +Inf',
+        "# HELP wait_seconds Wait.",
+        "# TYPE wait_seconds histogram",
+        'wait_seconds_bucket{pool="main",le="1.0"} 1',
+        'wait_seconds_bucket{pool="main",le="+Inf"} 1',
+        'wait_seconds_sum{pool="main"} 0.5',
+        'wait_seconds_count{pool="main"} 1',
+    ]
+
+
+@pytest.mark.anyio
+async def test_metrics_endpoint(  # noqa: WPS217, WPS218
+    client: AsyncClient,
+    metrics_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+    executed_statements: List[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "monitoring_token", MONITORING_BEARER)
+    application = await mock_application()
+    executed_statements.clear()
+    await client.get(
+        metrics_app.url_path_for(
+            "get_application_by_id",
+            application_id=application.id,
+        ),
+        headers=get_user_token_headers(),
+    )
+    queries = len(executed_statements)
+    await client.get(
+        metrics_app.url_path_for("get_application_by_id", application_id=0),
+        headers=get_user_token_headers(),
+    )
+    await client.get("/api/nowhere")
+    await metrics_app.state.replica_router.check_lag()
+
+    response = await client.get(
+        metrics_app.url_path_for("metrics"),
+        headers={"Authorization": f"Bearer {MONITORING_BEARER}"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == f"{CONTENT_TYPE}; charset=utf-8"
+    samples = _samples(response.text)
+    route = 'method="GET",route="/api/applications/{application_id}"'
+    assert f'http_requests_total{{{route},status="200"}} 1' in samples
+    assert f'http_requests_total{{{route},status="404"}} 1' in samples
+    assert (
+        'http_requests_total{method="GET",route="<unmatched>",status="404"} 1'
+        in samples
+    )
+    assert f"http_request_duration_seconds_count{{{route}}} 2" in samples
+    # both requests queried the database, the first one ran `queries` queries
+    assert f'db_queries_per_request_bucket{{{route},le="0.0"}} 0' in samples
+    query_sum = next(
+        sample
+        for sample in samples
+        if sample.startswith(f"db_queries_per_request_sum{{{route}}}")
+    )
+    assert 0 < queries < float(query_sum.split()[-1])
+    assert "db_pool_size 5" in samples
+    assert "db_pool_timeouts_total 0" in samples
+    assert 'db_replica_lag_seconds{replica="replica-0"} 0.0' in samples
+    assert any(sample.startswith("auth_token_cache_entries ") for sample in samples)
+
+
+def test_normalize_sql() -> None:
+    assert normalize_sql(
+        "SELECT a, 'it''s'\n  FROM t WHERE id = $1 AND n > 42 AND b IN ($2, $3, $4)",
+    ) == ("SELECT a, ? FROM t WHERE id = ? AND n > ? AND b IN (?, ...)")
+    assert normalize_sql("INSERT INTO t (a, b) VALUES ($1, $2), ($3, $4)") == (
+        "INSERT INTO t (a, b) VALUES (?, ...), ..."
+    )
+
+
+@pytest.mark.anyio
+async def test_query_stats(
+    dbsession: AsyncSession,
+    log_messages: List[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    query_stats = QueryStats()
+    token = current_query_stats.set(query_stats)
+    try:
+        for number in range(3):
+            await dbsession.execute(text(f"SELECT {number}"))
+        monkeypatch.setattr(settings, "db_slow_query_seconds", 1e-9)
+        await dbsession.execute(text("SELECT pg_sleep(0)"))
+    finally:
+        current_query_stats.reset(token)
+
+    assert query_stats.count == 4
+    assert query_stats.duration > 0
+    assert query_stats.repeated_statements(3) == [("SELECT ?", 3)]
+    assert not query_stats.repeated_statements(4)
+    assert not query_stats.repeated_statements(0)
+    assert len(log_messages) == 1
+    assert re.fullmatch(
+        r"Slow query, [\d.]+ ms: SELECT pg_sleep\(\?\)",
+        log_messages[0],
+    )
+
+
+@pytest.mark.anyio
+async def test_copies_are_counted(
+    dbsession: AsyncSession,
+    application_request_body: Dict[str, Any],
+) -> None:
+    user_id = await get_user_id_by_sub(dbsession, "metrics")
+    application_data = ApplicationPostMessage.parse_obj(application_request_body)
+    query_stats = QueryStats()
+    token = current_query_stats.set(query_stats)
+    try:
+        await copy_applications(dbsession, user_id, [application_data.dict()])
+    finally:
+        current_query_stats.reset(token)
+
+    copied_tables = [
+        statement.split(" (")[0]
+        for statement in query_stats.statements
+        if statement.startswith("COPY")
+    ]
+    assert copied_tables == ["COPY applications", "COPY timelines"]
+    assert query_stats.duration > 0
+
+
+@pytest.mark.anyio
+async def test_n_plus_one_is_flagged(
+    dbsession: AsyncSession,
+    log_messages: List[str],
+) -> None:
+    registry = MetricsRegistry()
+    app = FastAPI()
+
+    @app.get("/timelines")
+    async def get_timelines() -> Dict[str, int]:  # noqa: WPS430
+        for timeline_id in range(3):
+            await dbsession.execute(
+                text("SELECT CAST(:timeline_id AS INTEGER)"),
+                {"timeline_id": timeline_id},
+            )
+        return {}
+
+    app.add_middleware(
+        MetricsMiddleware,
+        registry=registry,
+        send_server_timing=True,
+        n_plus_one_threshold=3,
+    )
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/timelines")
+
+    assert re.fullmatch(
+        r'db;dur=[\d.]+;desc="3 queries", total;dur=[\d.]+',
+        response.headers["server-timing"],
+    )
+    assert registry.routes[("GET", "/timelines")].n_plus_one == 1
+    assert log_messages == [
+        "Possible N+1 in GET /timelines: 3 runs of SELECT CAST(? AS INTEGER)",
+    ]
+
+
+@pytest.mark.anyio
+async def test_server_timing(
+    client: AsyncClient,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+) -> None:
+    await mock_application()
+    response = await client.get(
+        fastapi_app.url_path_for("get_applications"),
+        headers=get_user_token_headers(),
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    phases = {
+        metric.split(";")[0]: metric
+        for metric in response.headers["server-timing"].split(", ")
+    }
+    assert list(phases) == ["auth", "serialize", "db", "total"]
+    assert re.fullmatch(r'db;dur=[\d.]+;desc="[1-9]\d* queries"', phases["db"])
@@ -0,0 +1,75 @@
+from typing import Any, AsyncGenerator, List
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from interview_tracker.db.meta import meta
+from interview_tracker.db.models import load_all_models
+from interview_tracker.db.utils import (
+    MIGRATIONS_DIR,
+    check_schema_version,
+    create_database,
+    drop_database,
+)
+from interview_tracker.settings import settings
+
+MIGRATIONS_DB_BASE = f"{settings.db_base}_migrations"
+
+
+@pytest.fixture
+async def migrations_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """
+    Create an empty database for running migrations.
+
+    :yield: engine connected to the empty database.
+    """
+    await create_database(MIGRATIONS_DB_BASE)
+    engine = create_async_engine(
+        str(settings.db_url.with_path(f"/{MIGRATIONS_DB_BASE}")),
+    )
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+        await drop_database(MIGRATIONS_DB_BASE)
+
+
+def _run_alembic(connection: Connection, action: str, revision: str) -> None:
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    config.attributes["connection"] = connection
+    getattr(command, action)(config, revision)
+
+
+def _compare_with_models(connection: Connection) -> List[Any]:
+    load_all_models()
+    return compare_metadata(MigrationContext.configure(connection), meta)
+
+
+@pytest.mark.anyio
+# postgres normalizes generated column expressions, autogenerate can only
+# warn that they differ textually
+@pytest.mark.filterwarnings("ignore:Computed default on applications.search_vector")
+async def test_migrations_match_models(migrations_engine: AsyncEngine) -> None:
+    with pytest.raises(RuntimeError):
+        await check_schema_version(migrations_engine)
+
+    async with migrations_engine.begin() as conn:
+        await conn.run_sync(_run_alembic, "upgrade", "head")
+
+    await check_schema_version(migrations_engine)
+    async with migrations_engine.connect() as conn:  # noqa: WPS440
+        assert await conn.run_sync(_compare_with_models) == []
+
+
+@pytest.mark.anyio
+async def test_migrations_downgrade(migrations_engine: AsyncEngine) -> None:
+    async with migrations_engine.begin() as conn:
+        await conn.run_sync(_run_alembic, "upgrade", "head")
+        await conn.run_sync(_run_alembic, "downgrade", "base")
+        await conn.run_sync(_run_alembic, "upgrade", "head")
@@ -0,0 +1,106 @@
+import json
+from typing import Awaitable, Callable, List
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from interview_tracker.db.models.main_model import Application
+from interview_tracker.web.authorization.testing import get_user_token_headers
+
+
+@pytest.mark.anyio
+async def test_search_applications_ranked(  # noqa: WPS217
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+) -> None:
+    in_notes = await mock_application(notes="Runs everything on Kubernetes clusters")
+    in_company = await mock_application(company_name="Kubernetes Inc")
+    in_title = await mock_application(job_title="Kubernetes engineer")
+    await mock_application(notes="Nothing to see here")
+    await mock_application(user_test_id="user_2", company_name="Kubernetes Inc")
+    url = fastapi_app.url_path_for("search_user_applications")
+    response = await client.get(
+        url=url,
+        headers=get_user_token_headers(),
+        params={"q": "kubernetes"},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    response_data = json.loads(response.content)
+    applications = response_data["applications"]
+    assert [app["id"] for app in applications] == [
+        in_company.id,
+        in_title.id,
+        in_notes.id,
+    ]
+    ranks = [app["rank"] for app in applications]
+    assert ranks == sorted(ranks, reverse=True)
+    assert len(set(ranks)) == len(ranks)
+    assert "notes" not in applications[0]
+    assert "next_cursor" not in response_data
+
+    response = await client.get(
+        url=url,
+        headers=get_user_token_headers(),
+        params={"q": "kubernetes -clusters"},
+    )
+    applications = json.loads(response.content)["applications"]
+    assert in_notes.id not in {app["id"] for app in applications}
+
+    response = await client.get(
+        url=url,
+        headers=get_user_token_headers(),
+        params={"q": "terraform"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert not json.loads(response.content)["applications"]
+
+
+@pytest.mark.anyio
+async def test_search_applications_pagination(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+) -> None:
+    # same rank for all of them, pages are ordered by id then
+    created = [await mock_application(location="Berlin") for _ in range(5)]
+    url = fastapi_app.url_path_for("search_user_applications")
+    headers = get_user_token_headers()
+    params = {"q": "berlin", "limit": "2"}
+    ids: List[int] = []
+    while True:
+        response = await client.get(url=url, headers=headers, params=params)
+        response_data = json.loads(response.content)
+        ids.extend(app["id"] for app in response_data["applications"])
+        if "next_cursor" not in response_data:
+            break
+        params["cursor"] = response_data["next_cursor"]
+
+    assert ids == sorted((app.id for app in created), reverse=True)
+
+    for cursor in ("not a cursor", "WyJpZCIsMV0"):  # the latter is a list cursor
+        response = await client.get(
+            url=url,
+            headers=headers,
+            params={"q": "berlin", "cursor": cursor},
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.anyio
+async def test_search_applications_uses_gin_index(dbsession: AsyncSession) -> None:
+    await dbsession.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = await dbsession.scalars(
+        text(
+            "EXPLAIN SELECT id FROM applications "
+            "WHERE search_vector @@ websearch_to_tsquery('english', 'kubernetes')",
+        ),
+    )
+
+    assert "ix_applications_search_vector" in "\n".join(plan)
@@ -1,14 +1,15 @@
-from typing import Any, Awaitable, Callable, Dict
+from typing import Any, Awaitable, Callable, Dict, List
 
 import pytest
 from fastapi import FastAPI, status
 from httpx import AsyncClient
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from interview_tracker.db.data_access_layer.application import (
     get_application_by_application_id,
 )
-from interview_tracker.db.models.main_model import Application
+from interview_tracker.db.models.main_model import Application, Timeline
 from interview_tracker.web.authorization.testing import get_user_token_headers
 
 
@@ -274,3 +275,106 @@ async def test_update_application_validation_error2(
     )
 
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def _put_timelines(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    url: str,
+    application_id: int,
+    new_timelines: List[Dict[str, str]],
+) -> List[int]:
+    response = await client.put(
+        url=url,
+        json={"timelines": new_timelines},
+        headers=get_user_token_headers(),
+    )
+    assert response.status_code == status.HTTP_200_OK
+    result = await dbsession.execute(
+        select(Timeline)
+        .filter_by(application_id=application_id)
+        .order_by(Timeline.id)
+        .execution_options(populate_existing=True),
+    )
+    rows = result.scalars().all()
+    assert [(row.name, row.value) for row in rows] == [
+        (timeline["name"], timeline["value"]) for timeline in new_timelines
+    ]
+    return [row.id for row in rows]
+
+
+def _timeline_statements(executed_statements: List[str]) -> List[str]:
+    timeline_statements = [
+        statement.split()[0]
+        for statement in executed_statements
+        if "timelines" in statement and not statement.startswith("SELECT")
+    ]
+    executed_statements.clear()
+    return timeline_statements
+
+
+@pytest.mark.anyio
+async def test_update_application_timelines_diff(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+    executed_statements: List[str],
+) -> None:
+    timelines = [
+        {"name": f"Step {index}", "value": "2023-07-01"} for index in range(30)
+    ]
+    application = await mock_application(timelines=timelines)
+    url = fastapi_app.url_path_for(
+        "update_application",
+        application_id=application.id,
+    )
+    put_args = (client, dbsession, url, application.id)
+    executed_statements.clear()
+
+    original_ids = await _put_timelines(*put_args, timelines)
+    assert not _timeline_statements(executed_statements)
+
+    timelines[7] = {"name": "Step 7", "value": "2023-08-01"}
+    assert await _put_timelines(*put_args, timelines) == original_ids
+    assert _timeline_statements(executed_statements) == ["UPDATE"]
+
+    timelines = [*timelines[:2], {"name": "Offer", "value": "2023-09-01"}]
+    assert await _put_timelines(*put_args, timelines) == original_ids[:3]
+    assert _timeline_statements(executed_statements) == ["UPDATE", "DELETE"]
+
+    timelines.extend({"name": "Start", "value": "2023-10-01"} for _ in range(3))
+    new_ids = await _put_timelines(*put_args, timelines)
+    assert new_ids[:3] == original_ids[:3]
+    assert _timeline_statements(executed_statements) == ["INSERT"]
+
+
+@pytest.mark.anyio
+async def test_update_application_timelines_aligned(
+    client: AsyncClient,
+    dbsession: AsyncSession,
+    fastapi_app: FastAPI,
+    mock_application: Callable[..., Awaitable[Application]],
+    executed_statements: List[str],
+) -> None:
+    timelines = [{"name": name, "value": "2023-07-01"} for name in "ABCDE"]
+    application = await mock_application(timelines=timelines)
+    url = fastapi_app.url_path_for(
+        "update_application",
+        application_id=application.id,
+    )
+    put_args = (client, dbsession, url, application.id)
+    original_ids = await _put_timelines(*put_args, timelines)
+    executed_statements.clear()
+
+    # the rows after a removed timeline are left alone
+    timelines.pop(1)
+    new_ids = await _put_timelines(*put_args, timelines)
+    assert new_ids == [original_ids[0], *original_ids[2:]]
+    assert _timeline_statements(executed_statements) == ["DELETE"]
+
+    # an inserted one moves the following timelines down a row
+    timelines.insert(2, {"name": "Offer", "value": "2023-09-01"})
+    inserted_ids = await _put_timelines(*put_args, timelines)
+    assert inserted_ids[:4] == new_ids
+    assert _timeline_statements(executed_statements) == ["UPDATE", "INSERT"]
@@ -0,0 +1,78 @@
+import time
+from typing import Any
+
+import jwt
+import pytest
+
+from interview_tracker.web.authorization import json_web_token
+from interview_tracker.web.authorization.testing import get_token_issuer
+from interview_tracker.web.authorization.token_cache import (
+    VerifiedTokenCache,
+    verified_token_cache,
+)
+
+
+def test_verified_token_is_cached() -> None:
+    cache = VerifiedTokenCache(max_size=10)
+    payload = {"sub": "auth0|user", "exp": time.time() + 60}
+
+    assert cache.get("token") is None
+    cache.set("token", payload)
+
+    assert cache.get("token") == payload
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+    assert cache.stats["hit_rate"] == pytest.approx(0.5)
+
+
+def test_expired_token_is_evicted() -> None:
+    cache = VerifiedTokenCache(max_size=10)
+    cache.set("token", {"sub": "auth0|user", "exp": time.time() - 1})
+
+    assert cache.get("token") is None
+    assert cache.stats["size"] == 0
+
+
+def test_token_without_exp_is_not_cached() -> None:
+    cache = VerifiedTokenCache(max_size=10)
+    cache.set("token", {"sub": "auth0|user"})
+
+    assert cache.get("token") is None
+
+
+def test_least_recently_used_token_is_evicted() -> None:
+    cache = VerifiedTokenCache(max_size=2)
+    expires_at = time.time() + 60
+    cache.set("token_1", {"exp": expires_at})
+    cache.set("token_2", {"exp": expires_at})
+    cache.get("token_1")
+    cache.set("token_3", {"exp": expires_at})
+
+    assert cache.get("token_1") is not None
+    assert cache.get("token_2") is None
+    assert cache.get("token_3") is not None
+
+
+@pytest.mark.anyio
+async def test_cached_token_skips_verification(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    decoded = []
+    decode = jwt.decode
+
+    def counting_decode(*args: Any, **kwargs: Any) -> Any:  # noqa: WPS430
+        decoded.append(args[0])
+        return decode(*args, **kwargs)
+
+    monkeypatch.setattr(json_web_token.jwt, "decode", counting_decode)
+    verified_token_cache.clear()
+    token = get_token_issuer().issue("64b71e183dd4fa545798abf4")
+
+    first = json_web_token.JsonWebToken(token)
+    second = json_web_token.JsonWebToken(token)
+    assert await first.validate()
+    assert await second.validate()
+
+    assert decoded == [token]
+    assert second.payload == first.payload
+    assert second.subject == "64b71e183dd4fa545798abf4"
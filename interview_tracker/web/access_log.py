@@ -0,0 +1,96 @@
+import random
+import time
+
+from loguru import logger
+from starlette import status
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class _ResponseStatus:
+    """``send`` of a request, noting the status; 500 until the response starts."""
+
+    def __init__(self, send: Send) -> None:
+        self.status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        self._send = send
+
+    async def send(self, message: Message) -> None:
+        """
+        Send a message of the response, noting its status.
+
+        :param message: ASGI message.
+        """
+        if message["type"] == "http.response.start":
+            self.status_code = message["status"]
+        await self._send(message)
+
+
+class AccessLogMiddleware:
+    """
+    Logs one line per HTTP request, with its status and duration.
+
+    Successful requests are sampled: only ``sample_rate`` of them are
+    logged. Failed requests, 4xx included, and requests slower than
+    ``slow_seconds`` are always logged. Query strings are left out,
+    they may carry what users search for.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 1,
+        slow_seconds: float = 1,
+    ) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_seconds = slow_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_status = _ResponseStatus(send)
+        started_at = time.perf_counter()
+
+        try:  # noqa: WPS501
+            await self.app(scope, receive, response_status.send)
+        finally:
+            duration = time.perf_counter() - started_at
+            if self._is_logged(response_status.status_code, duration):
+                self._log(scope, response_status.status_code, duration)
+
+    def _is_logged(self, status_code: int, duration: float) -> bool:
+        if status_code >= status.HTTP_400_BAD_REQUEST:
+            return True
+        if duration >= self.slow_seconds:
+            return True
+        return random.random() < self.sample_rate  # noqa: S311
+
+    def _log(self, scope: Scope, status_code: int, duration: float) -> None:
+        client_address = _client_address(scope)
+        duration_ms = round(duration * 1000, 2)
+        is_error = status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR
+        logger.bind(
+            client=client_address,
+            method=scope["method"],
+            path=scope["path"],
+            status=status_code,
+            duration_ms=duration_ms,
+        ).log(
+            "WARNING" if is_error else "INFO",
+            '{0} - "{1} {2} HTTP/{3}" {4} {5} ms',
+            client_address,
+            scope["method"],
+            scope["path"],
+            scope["http_version"],
+            status_code,
+            duration_ms,
+        )
+
+
+def _client_address(scope: Scope) -> str:
+    client = scope.get("client")
+    if not client:
+        return "-"
+    host, port = client
+    return f"{host}:{port}"
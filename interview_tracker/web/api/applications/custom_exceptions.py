@@ -0,0 +1,36 @@
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from interview_tracker.db.data_access_layer.application import application_exists
+
+
+class ApplicationNotFoundException(HTTPException):
+    def __init__(self):  # type: ignore
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found",
+        )
+
+
+class NoAccessToApplicationException(HTTPException):
+    def __init__(self):  # type: ignore
+        super().__init__(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="No access to the application",
+        )
+
+
+async def application_not_accessible(
+    application_id: int,
+    session: AsyncSession,
+) -> HTTPException:
+    """
+    Explain why an owner-scoped lookup of the application found nothing.
+
+    :param application_id: requested application.
+    :param session: current session.
+    :return: 404 if the application doesn't exist, 403 otherwise.
+    """
+    if await application_exists(application_id=application_id, session=session):
+        return NoAccessToApplicationException()
+    return ApplicationNotFoundException()
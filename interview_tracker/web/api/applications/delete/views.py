@@ -1,15 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from interview_tracker.db.data_access_layer.application import (
     delete_application as dal_delete_application,
 )
-from interview_tracker.db.data_access_layer.application import (
-    get_application_by_application_id,
+from interview_tracker.db.data_access_layer.user import get_user_id_by_sub
+from interview_tracker.db.dependencies import commit, get_db_session
+from interview_tracker.services.cache.applications import ApplicationsCache
+from interview_tracker.services.cache.dependency import get_applications_cache
+from interview_tracker.web.api.applications.custom_exceptions import (
+    application_not_accessible,
 )
-from interview_tracker.db.data_access_layer.user import get_user_by_sub
-from interview_tracker.db.dependencies import get_db_session
 from interview_tracker.web.authorization.dependencies import authorization
 from interview_tracker.web.authorization.json_web_token import JsonWebToken
 
@@ -23,25 +25,19 @@ async def delete_application(
     token: HTTPAuthorizationCredentials = Depends(auth_scheme),
     jwt_token: JsonWebToken = Depends(authorization),
     session: AsyncSession = Depends(get_db_session),
+    cache: ApplicationsCache = Depends(get_applications_cache),
 ) -> Response:
 
-    user = await get_user_by_sub(session, jwt_token.subject)
-    application = await get_application_by_application_id(
+    user_id = await get_user_id_by_sub(session, jwt_token.subject)
+    is_deleted = await dal_delete_application(
         application_id=application_id,
+        user_id=user_id,
         session=session,
     )
-    if not application:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Application not found",
-        )
-
-    if application.user_id != user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="No access to the application",
-        )
+    if not is_deleted:
+        raise await application_not_accessible(application_id, session)
 
-    await dal_delete_application(application=application, session=session)
+    await commit(session)
+    await cache.invalidate(user_id, application_id)
 
     return Response(status_code=status.HTTP_200_OK)
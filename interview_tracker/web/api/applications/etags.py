@@ -0,0 +1,68 @@
+import hashlib
+from typing import Any, Dict
+
+from fastapi import Response, status
+from starlette.requests import Request
+
+ETAG_DIGEST_SIZE = 16
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Make a strong ETag out of everything the representation depends on.
+
+    :param parts: values identifying the representation.
+    :return: quoted entity tag.
+    """
+    fingerprint = ":".join(str(part) for part in parts).encode()
+    digest = hashlib.blake2b(fingerprint, digest_size=ETAG_DIGEST_SIZE).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    # responses are per user and must be revalidated before being reused
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Check the request's If-None-Match against the current ETag.
+
+    :param request: current request.
+    :param etag: ETag of the current representation.
+    :return: whether the client already has it.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison
+    client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in client_etags
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=etag_headers(etag),
+    )
+
+
+def conditional_response(request: Request, etag: str, body: bytes) -> Response:
+    """
+    Answer with the JSON body, or with 304 if the client already has it.
+
+    :param request: current request.
+    :param etag: ETag of the body.
+    :param body: serialized JSON.
+    :return: response.
+    """
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    return Response(
+        content=body,
+        status_code=status.HTTP_200_OK,
+        media_type="application/json",
+        headers=etag_headers(etag),
+    )
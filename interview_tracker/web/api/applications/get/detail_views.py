@@ -0,0 +1,104 @@
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+
+from interview_tracker.db.data_access_layer.application import (
+    get_user_application,
+    get_user_application_version,
+)
+from interview_tracker.db.data_access_layer.user import get_reader_id_by_sub
+from interview_tracker.db.dependencies import get_db_readonly_session
+from interview_tracker.services.cache.applications import (
+    ApplicationsCache,
+    CachedResponse,
+)
+from interview_tracker.services.cache.dependency import get_applications_cache
+from interview_tracker.services.metrics.timing import timed
+from interview_tracker.web.api.applications.custom_exceptions import (
+    application_not_accessible,
+)
+from interview_tracker.web.api.applications.etags import (
+    conditional_response,
+    is_not_modified,
+    make_etag,
+    not_modified,
+)
+from interview_tracker.web.api.applications.get.schemas.application import (
+    ApplicationResponse,
+    make_full_info_application,
+)
+from interview_tracker.web.authorization.dependencies import authorization
+from interview_tracker.web.authorization.json_web_token import JsonWebToken
+
+auth_scheme = HTTPBearer()
+router = APIRouter()
+
+
+async def _revalidate(
+    request: Request,
+    session: AsyncSession,
+    user_id: int,
+    application_id: int,
+) -> Optional[Response]:
+    # only the version is read, the client may still have the application
+    version = await get_user_application_version(
+        application_id=application_id,
+        user_id=user_id,
+        session=session,
+    )
+    etag = make_etag("application", application_id, version)
+    if version is not None and is_not_modified(request, etag):
+        return not_modified(etag)
+    return None
+
+
+async def _render_application(
+    session: AsyncSession,
+    user_id: int,
+    application_id: int,
+) -> Tuple[str, bytes]:
+    row_application = await get_user_application(
+        application_id=application_id,
+        user_id=user_id,
+        session=session,
+        with_timelines=True,
+    )
+    if not row_application:
+        raise await application_not_accessible(application_id, session)
+    # timelines are loaded already, the connection can go back
+    await session.close()
+
+    with timed("serialize"):
+        application = make_full_info_application(row_application)
+        body = ApplicationResponse(application=application).json(exclude_none=True)
+    etag = make_etag("application", application_id, row_application.version)
+    return etag, body.encode()
+
+
+@router.get("/{application_id}", response_model=ApplicationResponse)
+async def get_application_by_id(  # noqa: WPS211
+    application_id: int,
+    request: Request,
+    token: HTTPAuthorizationCredentials = Depends(auth_scheme),
+    jwt_token: JsonWebToken = Depends(authorization),
+    session: AsyncSession = Depends(get_db_readonly_session),
+    cache: ApplicationsCache = Depends(get_applications_cache),
+) -> Response:
+
+    user_id = await get_reader_id_by_sub(session, jwt_token.subject)
+    lookup = await cache.get_detail(user_id, application_id)
+    if lookup.response is not None:
+        return conditional_response(request, *lookup.response)
+
+    if "if-none-match" in request.headers:
+        revalidated = await _revalidate(request, session, user_id, application_id)
+        if revalidated is not None:
+            return revalidated
+
+    etag, body = await _render_application(session, user_id, application_id)
+    await cache.store(lookup.key, CachedResponse(etag=etag, body=body))
+    return conditional_response(request, etag, body)
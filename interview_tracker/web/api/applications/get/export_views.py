@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from interview_tracker.db.data_access_layer.application import stream_user_applications
+from interview_tracker.db.data_access_layer.user import get_reader_id_by_sub
+from interview_tracker.db.dependencies import get_db_readonly_session
+from interview_tracker.web.api.applications.get.exporters import (
+    EXPORT_MEDIA_TYPES,
+    ExportFormatEnum,
+    export_chunks,
+)
+from interview_tracker.web.authorization.dependencies import authorization
+from interview_tracker.web.authorization.json_web_token import JsonWebToken
+
+auth_scheme = HTTPBearer()
+router = APIRouter()
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_applications(
+    export_format: ExportFormatEnum = Query(ExportFormatEnum.ndjson, alias="format"),
+    token: HTTPAuthorizationCredentials = Depends(auth_scheme),
+    jwt_token: JsonWebToken = Depends(authorization),
+    session: AsyncSession = Depends(get_db_readonly_session),
+) -> StreamingResponse:
+    user_id = await get_reader_id_by_sub(session, jwt_token.subject)
+    applications = stream_user_applications(session=session, user_id=user_id)
+
+    return StreamingResponse(
+        export_chunks(applications, export_format),
+        status_code=status.HTTP_200_OK,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="applications.{export_format.value}"'
+            ),
+        },
+    )
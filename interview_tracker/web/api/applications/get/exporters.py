@@ -0,0 +1,78 @@
+import csv
+import enum
+import io
+from typing import Any, AsyncIterator, Dict, List
+
+import ujson
+
+from interview_tracker.db.data_access_layer.application import (
+    APPLICATION_EXPORT_COLUMNS,
+)
+
+
+class ExportFormatEnum(str, enum.Enum):  # noqa: WPS600
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormatEnum.ndjson: "application/x-ndjson",
+    ExportFormatEnum.csv: "text/csv",
+}
+
+# same layout as accepted by the bulk import
+CSV_COLUMNS = [*(column.key for column in APPLICATION_EXPORT_COLUMNS), "timelines"]
+
+
+async def export_chunks(
+    applications: AsyncIterator[Dict[str, Any]],
+    export_format: ExportFormatEnum,
+    chunk_size: int = 100,
+) -> AsyncIterator[bytes]:
+    """
+    Encode applications to NDJSON or CSV, ``chunk_size`` at a time.
+
+    :param applications: applications with their timelines.
+    :param export_format: output format.
+    :param chunk_size: number of applications per chunk.
+    :yield: encoded chunks.
+    """
+    encode = _encode_csv if export_format == ExportFormatEnum.csv else _encode_ndjson
+    if export_format == ExportFormatEnum.csv:
+        yield _encode_csv_row(CSV_COLUMNS)
+
+    chunk: List[Dict[str, Any]] = []
+    async for application in applications:
+        chunk.append(application)
+        if len(chunk) >= chunk_size:
+            yield encode(chunk)
+            chunk = []
+    if chunk:
+        yield encode(chunk)
+
+
+def _encode_ndjson(applications: List[Dict[str, Any]]) -> bytes:
+    lines = (
+        ujson.dumps(application, ensure_ascii=False) for application in applications
+    )
+    return "".join(f"{line}\n" for line in lines).encode("utf-8")
+
+
+def _encode_csv(applications: List[Dict[str, Any]]) -> bytes:
+    rows = []
+    for application in applications:
+        row = [_csv_value(application[key]) for key in CSV_COLUMNS[:-1]]
+        row.append(ujson.dumps(application["timelines"], ensure_ascii=False))
+        rows.append(row)
+    return _encode_csv_row(*rows)
+
+
+def _encode_csv_row(*rows: List[Any]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _csv_value(value: Any) -> Any:
+    # str() of our str enums is "Enum.member", the value is what's wanted
+    return value.value if isinstance(value, enum.Enum) else value
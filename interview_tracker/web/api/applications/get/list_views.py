@@ -0,0 +1,146 @@
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+
+from interview_tracker.db.data_access_layer.application import (
+    ApplicationSortEnum,
+    get_applications_page,
+    get_applications_state,
+    get_sort_key,
+)
+from interview_tracker.db.data_access_layer.user import get_reader_id_by_sub
+from interview_tracker.db.dependencies import get_db_readonly_session
+from interview_tracker.db.models.main_model import OnSiteRemoteEnum, StatusCategoryEnum
+from interview_tracker.services.cache.applications import (
+    ApplicationsCache,
+    CachedResponse,
+)
+from interview_tracker.services.cache.dependency import get_applications_cache
+from interview_tracker.settings import settings
+from interview_tracker.web.api.applications.etags import (
+    conditional_response,
+    is_not_modified,
+    make_etag,
+    not_modified,
+)
+from interview_tracker.web.api.applications.get.schemas.application import (
+    ApplicationsResponse,
+    decode_cursor,
+    encode_cursor,
+    render_applications,
+)
+from interview_tracker.web.authorization.dependencies import authorization
+from interview_tracker.web.authorization.json_web_token import JsonWebToken
+
+auth_scheme = HTTPBearer()
+router = APIRouter()
+
+
+def _get_sort_key_after(
+    cursor: Optional[str],
+    sort: ApplicationSortEnum,
+) -> Optional[Tuple[Any, ...]]:
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor, sort)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+
+
+class ApplicationsPageParams:
+    """Query parameters selecting one page of the applications list."""
+
+    def __init__(  # noqa: WPS211
+        self,
+        limit: int = Query(
+            settings.applications_page_size_default,
+            ge=1,
+            le=settings.applications_page_size_max,
+        ),
+        cursor: Optional[str] = None,
+        sort: ApplicationSortEnum = ApplicationSortEnum.id_asc,
+        archived: Optional[bool] = None,
+        status_category: Optional[StatusCategoryEnum] = None,
+        on_site_remote: Optional[OnSiteRemoteEnum] = None,
+        attractiveness_scale: Optional[int] = Query(None, ge=1, le=5),
+    ) -> None:
+        self.limit = limit
+        self.sort = sort
+        self.after = _get_sort_key_after(cursor, sort)
+        self.filters: Dict[str, Any] = {
+            "archived": archived,
+            "status_category": status_category,
+            "on_site_remote": on_site_remote,
+            "attractiveness_scale": attractiveness_scale,
+        }
+
+
+async def _get_list_etag(
+    session: AsyncSession,
+    user_id: int,
+    query: Any,
+) -> str:
+    max_version, count = await get_applications_state(session, user_id)
+    return make_etag("applications", user_id, max_version, count, query)
+
+
+async def _render_page(
+    session: AsyncSession,
+    user_id: int,
+    params: ApplicationsPageParams,
+) -> bytes:
+    # one extra row tells whether there is a next page
+    row_applications = await get_applications_page(
+        user_id=user_id,
+        session=session,
+        limit=params.limit + 1,
+        sort=params.sort,
+        after=params.after,
+        **params.filters,
+    )
+    if not row_applications:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Applications not found",
+        )
+    # the queries are done, the connection can go back before rendering
+    await session.close()
+
+    next_cursor = None
+    if len(row_applications) > params.limit:
+        row_applications = row_applications[: params.limit]
+        last_key = get_sort_key(row_applications[-1], params.sort)
+        next_cursor = encode_cursor(params.sort, last_key)
+    return render_applications(row_applications, next_cursor)
+
+
+@router.get("/", response_model=ApplicationsResponse)
+async def get_applications(  # noqa: WPS211
+    request: Request,
+    params: ApplicationsPageParams = Depends(),
+    token: HTTPAuthorizationCredentials = Depends(auth_scheme),
+    jwt_token: JsonWebToken = Depends(authorization),
+    session: AsyncSession = Depends(get_db_readonly_session),
+    cache: ApplicationsCache = Depends(get_applications_cache),
+) -> Response:
+    user_id = await get_reader_id_by_sub(session, jwt_token.subject)
+    query = sorted(request.query_params.multi_items())
+    lookup = await cache.get_list(user_id, query)
+    if lookup.response is not None:
+        return conditional_response(request, *lookup.response)
+
+    etag = await _get_list_etag(session, user_id, query)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    body = await _render_page(session, user_id, params)
+    await cache.store(lookup.key, CachedResponse(etag=etag, body=body))
+    return conditional_response(request, etag, body)
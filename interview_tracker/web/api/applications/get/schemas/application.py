@@ -1,12 +1,19 @@
-from typing import List, Optional
+import base64
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import ujson
 from pydantic import BaseModel
+from sqlalchemy import Row
 
+from interview_tracker.db.data_access_layer.application import ApplicationSortEnum
 from interview_tracker.db.models.main_model import (
     Application,
     OnSiteRemoteEnum,
     StatusCategoryEnum,
 )
+from interview_tracker.db.utils import row_to_dict
+from interview_tracker.services.metrics.timing import timed
 
 
 class TimelineBase(BaseModel):
@@ -35,6 +42,22 @@ class ApplicationBase(BaseModel):
 
 class ApplicationsResponse(BaseModel):
     applications: List[ApplicationBase]
+    next_cursor: Optional[str]
+
+
+class ApplicationSearchResult(BaseModel):
+    id: int
+    company_name: str
+    job_title: str
+    status: str
+    attractiveness_scale: int
+    status_category: StatusCategoryEnum
+    rank: float
+
+
+class ApplicationsSearchResponse(BaseModel):
+    applications: List[ApplicationSearchResult]
+    next_cursor: Optional[str]
 
 
 class ApplicationResponse(BaseModel):
@@ -65,12 +88,120 @@ def make_full_info_application(application: Application) -> ApplicationBase:
     )
 
 
-def make_base_info_application(application: Application) -> ApplicationBase:
-    return ApplicationBase(
-        id=application.id,
-        company_name=application.company_name,
-        job_title=application.job_title,
-        status=application.status,
-        attractiveness_scale=application.attractiveness_scale,
-        status_category=application.status_category,
+def render_applications(
+    applications: Sequence[Row[Any]],
+    next_cursor: Optional[str],
+) -> bytes:
+    """
+    Encode a page of the applications list to ApplicationsResponse JSON.
+
+    The list can be long, so its rows are dumped as they are instead of
+    being validated by ApplicationBase first.
+
+    :param applications: rows of APPLICATION_LIST_COLUMNS.
+    :param next_cursor: cursor of the next page, if any.
+    :return: JSON document.
+    """
+    with timed("serialize"):
+        content: Dict[str, Any] = {
+            "applications": [row_to_dict(application) for application in applications],
+        }
+        if next_cursor is not None:
+            content["next_cursor"] = next_cursor
+        return ujson.dumps(content, ensure_ascii=False).encode("utf-8")
+
+
+def encode_cursor(sort: ApplicationSortEnum, sort_key: Tuple[Any, ...]) -> str:
+    """
+    Make an opaque cursor pointing right after the given sort key.
+
+    :param sort: sort order of the list.
+    :param sort_key: sort key of the last returned application.
+    :return: url-safe cursor.
+    """
+    return _encode_payload([sort.value, *sort_key])
+
+
+def _matches_sort_keys(sort_key: Tuple[Any, ...], sort: ApplicationSortEnum) -> bool:
+    if len(sort_key) != len(sort.keys):
+        return False
+    return all(
+        isinstance(value, key.type.python_type) and not isinstance(value, bool)
+        for value, key in zip(sort_key, sort.keys)
     )
+
+
+def decode_cursor(cursor: str, sort: ApplicationSortEnum) -> Tuple[Any, ...]:
+    """
+    Get the sort key back from a cursor.
+
+    :param cursor: cursor returned with the previous page.
+    :param sort: sort order of the requested page.
+    :raises ValueError: if the cursor is malformed or made for another sort.
+    :return: sort key.
+    """
+    payload = _decode_payload(cursor)
+    if payload[:1] != [sort.value]:
+        raise ValueError("Cursor doesn't match the sort order")
+    sort_key = tuple(payload[1:])
+    if not _matches_sort_keys(sort_key, sort):
+        raise ValueError("Malformed cursor")
+    return sort_key
+
+
+# first element of a search cursor, can't clash with a sort order
+SEARCH_CURSOR_TAG = "@rank"
+
+
+def encode_search_cursor(rank: float, application_id: int) -> str:
+    """
+    Make an opaque cursor pointing right after a search result.
+
+    :param rank: rank of the last returned application.
+    :param application_id: id of the last returned application.
+    :return: url-safe cursor.
+    """
+    return _encode_payload([SEARCH_CURSOR_TAG, rank, application_id])
+
+
+def decode_search_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    Get the rank and id back from a search cursor.
+
+    :param cursor: cursor returned with the previous page.
+    :raises ValueError: if the cursor is malformed or not a search cursor.
+    :return: rank and id.
+    """
+    payload = _decode_payload(cursor)
+    if payload[:1] != [SEARCH_CURSOR_TAG]:
+        raise ValueError("Cursor doesn't match the search")
+    search_key = payload[1:]
+    if len(search_key) != 2 or not _is_search_key(*search_key):
+        raise ValueError("Malformed cursor")
+    rank, application_id = search_key
+    return float(rank), application_id
+
+
+def _is_search_key(rank: Any, application_id: Any) -> bool:
+    # bool is an int too, it can't be a rank nor an id
+    if isinstance(rank, bool) or isinstance(application_id, bool):
+        return False
+    return isinstance(rank, (int, float)) and isinstance(application_id, int)
+
+
+def _encode_payload(payload: List[Any]) -> str:
+    # floats are dumped with repr, so ranks round trip exactly
+    dumped = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(dumped.encode()).decode().rstrip("=")
+
+
+def _decode_payload(cursor: str) -> List[Any]:
+    padding = "=" * (-len(cursor) % 4)
+    # binascii.Error and UnicodeDecodeError are ValueErrors too
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(f"{cursor}{padding}"))
+    except ValueError:
+        raise ValueError("Malformed cursor")
+    if not isinstance(payload, list):
+        raise ValueError("Malformed cursor")
+    return payload
@@ -0,0 +1,42 @@
+from typing import Dict, Mapping
+
+from pydantic import BaseModel
+
+from interview_tracker.db.data_access_layer.stats import TOTAL_DIMENSION, StatsKey
+
+# key of the applications without a value, like a NULL on_site_remote
+UNSPECIFIED = "unspecified"
+
+
+class ApplicationStatsResponse(BaseModel):
+    total: int
+    active: int
+    archived: int
+    status_category: Dict[str, int]
+    on_site_remote: Dict[str, int]
+    attractiveness_scale: Dict[str, int]
+
+
+def make_stats_response(stats: Mapping[StatsKey, int]) -> ApplicationStatsResponse:
+    """
+    Arrange counts by dimension, leaving out the empty groups.
+
+    :param stats: counts, keyed like the summary rows.
+    :return: response.
+    """
+    breakdowns: Dict[str, Dict[str, int]] = {
+        "status_category": {},
+        "on_site_remote": {},
+        "attractiveness_scale": {},
+        "archived": {},
+    }
+    for (dimension, value), count in sorted(stats.items()):
+        if count and dimension in breakdowns:
+            breakdowns[dimension][value or UNSPECIFIED] = count
+    archived = breakdowns.pop("archived")
+    return ApplicationStatsResponse(
+        total=stats.get((TOTAL_DIMENSION, ""), 0),
+        active=archived.get("false", 0),
+        archived=archived.get("true", 0),
+        **breakdowns,
+    )
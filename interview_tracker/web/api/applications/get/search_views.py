@@ -0,0 +1,78 @@
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from interview_tracker.db.data_access_layer.application import search_applications
+from interview_tracker.db.data_access_layer.user import get_reader_id_by_sub
+from interview_tracker.db.dependencies import get_db_readonly_session
+from interview_tracker.settings import settings
+from interview_tracker.web.api.applications.get.schemas.application import (
+    ApplicationsSearchResponse,
+    decode_search_cursor,
+    encode_search_cursor,
+    render_applications,
+)
+from interview_tracker.web.authorization.dependencies import authorization
+from interview_tracker.web.authorization.json_web_token import JsonWebToken
+
+SEARCH_QUERY_MAX_LENGTH = 256
+
+auth_scheme = HTTPBearer()
+router = APIRouter()
+
+
+def _get_search_key_after(cursor: Optional[str]) -> Optional[Tuple[float, int]]:
+    if cursor is None:
+        return None
+    try:
+        return decode_search_cursor(cursor)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        )
+
+
+@router.get("/search", response_model=ApplicationsSearchResponse)
+async def search_user_applications(  # noqa: WPS211
+    q: str = Query(  # noqa: WPS111
+        ...,
+        min_length=1,
+        max_length=SEARCH_QUERY_MAX_LENGTH,
+    ),
+    limit: int = Query(
+        settings.applications_page_size_default,
+        ge=1,
+        le=settings.applications_page_size_max,
+    ),
+    cursor: Optional[str] = None,
+    token: HTTPAuthorizationCredentials = Depends(auth_scheme),
+    jwt_token: JsonWebToken = Depends(authorization),
+    session: AsyncSession = Depends(get_db_readonly_session),
+) -> Response:
+    after = _get_search_key_after(cursor)
+    user_id = await get_reader_id_by_sub(session, jwt_token.subject)
+    # one extra row tells whether there is a next page
+    row_applications = await search_applications(
+        user_id=user_id,
+        session=session,
+        search_query=q,
+        limit=limit + 1,
+        after=after,
+    )
+    await session.close()
+
+    next_cursor = None
+    if len(row_applications) > limit:
+        row_applications = row_applications[:limit]
+        last = row_applications[-1]
+        next_cursor = encode_search_cursor(last.rank, last.id)
+
+    return Response(
+        content=render_applications(row_applications, next_cursor),
+        status_code=status.HTTP_200_OK,
+        media_type="application/json",
+    )
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from interview_tracker.db.data_access_layer.stats import get_application_stats
+from interview_tracker.db.data_access_layer.user import get_reader_id_by_sub
+from interview_tracker.db.dependencies import get_db_readonly_session
+from interview_tracker.web.api.applications.get.schemas.stats import (
+    ApplicationStatsResponse,
+    make_stats_response,
+)
+from interview_tracker.web.authorization.dependencies import authorization
+from interview_tracker.web.authorization.json_web_token import JsonWebToken
+
+auth_scheme = HTTPBearer()
+router = APIRouter()
+
+
+@router.get("/stats", response_model=ApplicationStatsResponse)
+async def get_applications_stats(
+    token: HTTPAuthorizationCredentials = Depends(auth_scheme),
+    jwt_token: JsonWebToken = Depends(authorization),
+    session: AsyncSession = Depends(get_db_readonly_session),
+) -> ApplicationStatsResponse:
+    user_id = await get_reader_id_by_sub(session, jwt_token.subject)
+    return make_stats_response(await get_application_stats(session, user_id))
@@ -0,0 +1,192 @@
+import codecs
+import csv
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import ujson
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from starlette.requests import Request
+
+from interview_tracker.web.api.applications.post.schemas.application import (
+    ApplicationPostMessage,
+    ImportRowError,
+)
+
+JSON_CONTENT_TYPE = "application/json"
+NDJSON_CONTENT_TYPES = frozenset(("application/x-ndjson", "application/ndjson"))
+CSV_CONTENT_TYPE = "text/csv"
+
+# columns of a valid application, with its list of timelines
+ApplicationData = Dict[str, Any]
+
+
+async def read_rows(request: Request, max_json_bytes: int) -> AsyncIterator[Any]:
+    """
+    Read the raw rows of an import, one at a time.
+
+    JSON arrays, NDJSON (one object per line) and CSV with a header are
+    accepted. In CSV, ``timelines`` holds a JSON array and empty cells
+    are treated as missing values.
+
+    NDJSON and CSV are parsed as the body streams in. A JSON array is
+    parsed whole, so its size is limited.
+
+    :param request: import request.
+    :param max_json_bytes: max size of a JSON array body.
+    :raises HTTPException: if the body can't be parsed at all.
+    :yield: rows to validate.
+    """
+    content_type = request.headers.get("content-type", "").partition(";")[0]
+    content_type = content_type.strip()
+    if content_type in NDJSON_CONTENT_TYPES:
+        rows = _read_ndjson(request)
+    elif content_type == JSON_CONTENT_TYPE:
+        rows = _read_json(request, max_json_bytes)
+    elif content_type == CSV_CONTENT_TYPE:
+        rows = _read_csv(request)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Expected application/json, application/x-ndjson or text/csv",
+        )
+    async for row in rows:
+        yield row
+
+
+async def read_applications(
+    request: Request,
+    errors: List[ImportRowError],
+    max_rows: int,
+    batch_size: int,
+    max_json_bytes: int,
+) -> AsyncIterator[List[ApplicationData]]:
+    """
+    Validate the rows of an import and group the valid ones in batches.
+
+    Rows are validated like in ``create_application``. Invalid rows are
+    skipped and reported in ``errors`` by their 1-based position.
+
+    :param request: import request.
+    :param errors: list the errors of the invalid rows are appended to.
+    :param max_rows: max number of rows of an import.
+    :param batch_size: max number of applications in a batch.
+    :param max_json_bytes: max size of a JSON array body.
+    :yield: batches of application data.
+    """
+    batch: List[ApplicationData] = []
+    rows = read_rows(request, max_json_bytes)
+    async for application_data in _validate_rows(rows, errors, max_rows):
+        batch.append(application_data)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _validate_rows(
+    rows: AsyncIterator[Any],
+    errors: List[ImportRowError],
+    max_rows: int,
+) -> AsyncIterator[ApplicationData]:
+    row_number = 0
+    async for row in rows:
+        row_number += 1
+        if row_number > max_rows:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Can't import more than {max_rows} applications at once",
+            )
+        try:
+            application_data = ApplicationPostMessage.parse_obj(row).dict()
+        except ValidationError as exc:
+            errors.append(ImportRowError(row=row_number, errors=exc.errors()))
+            continue
+        yield application_data
+
+
+async def _read_ndjson(request: Request) -> AsyncIterator[Any]:
+    async for line in _read_lines(request):
+        if line.strip():
+            yield _loads_or_raw(line)
+
+
+async def _read_json(request: Request, max_json_bytes: int) -> AsyncIterator[Any]:
+    rows = _loads_or_raw(await _read_body(request, max_json_bytes))
+    if not isinstance(rows, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Expected a JSON array of applications",
+        )
+    for row in rows:
+        yield row
+
+
+async def _read_body(request: Request, max_bytes: int) -> bytes:
+    chunks: List[bytes] = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=(
+                    f"JSON imports are limited to {max_bytes} bytes, "
+                    "send larger ones as NDJSON or CSV"
+                ),
+            )
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def _read_csv(request: Request) -> AsyncIterator[Any]:
+    header: Optional[List[str]] = None
+    async for record in _read_csv_records(request):
+        if header is None:
+            header = record
+        elif record:
+            yield _from_csv_row(dict(zip(header, record)))
+
+
+async def _read_csv_records(request: Request) -> AsyncIterator[List[str]]:
+    # a quoted cell may span lines: a record ends on a line that leaves
+    # an even number of quotes, escaped quotes are doubled
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    record_lines: List[str] = []
+    quotes = 0
+    async for line in _read_lines(request):
+        decoded = decoder.decode(line)
+        record_lines.append(f"{decoded}\n")
+        quotes += decoded.count('"')
+        if quotes % 2 == 0:
+            yield next(csv.reader(record_lines), [])
+            record_lines = []
+            quotes = 0
+    if record_lines:
+        yield next(csv.reader(record_lines), [])
+
+
+async def _read_lines(request: Request) -> AsyncIterator[bytes]:
+    tail = b""
+    async for chunk in request.stream():
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        for line in lines:
+            yield line
+    yield tail
+
+
+def _loads_or_raw(raw: bytes) -> Any:
+    # rows that are not valid JSON are left for the validation to reject
+    try:
+        return ujson.loads(raw)
+    except ValueError:
+        return raw.decode(errors="replace")
+
+
+def _from_csv_row(csv_row: Dict[str, str]) -> Dict[str, Any]:
+    row: Dict[str, Any] = {key: value for key, value in csv_row.items() if value}
+    timelines = row.get("timelines")
+    if timelines is not None:
+        row["timelines"] = _loads_or_raw(timelines.encode())
+    return row
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, validator
 from pydantic.class_validators import partial
@@ -55,3 +55,13 @@ class ApplicationPostMessage(BaseModel):
     )(
         validate_attractiveness_scale,
     )
+
+
+class ImportRowError(BaseModel):
+    row: int
+    errors: List[Dict[str, Any]]
+
+
+class ImportResponse(BaseModel):
+    imported: int
+    errors: List[ImportRowError]
@@ -1,16 +1,25 @@
+from typing import List
+
 from fastapi import APIRouter, Depends, Response, status
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
 
+from interview_tracker.db.data_access_layer.application import copy_applications
 from interview_tracker.db.data_access_layer.application import (
-    save_application,
-    save_timeline,
+    create_application as dal_create_application,
 )
-from interview_tracker.db.data_access_layer.user import get_user_by_sub
-from interview_tracker.db.dependencies import get_db_session
-from interview_tracker.db.models.main_model import Application, Timeline
+from interview_tracker.db.data_access_layer.user import get_user_id_by_sub
+from interview_tracker.db.dependencies import commit, get_db_session
+from interview_tracker.services.cache.applications import ApplicationsCache
+from interview_tracker.services.cache.dependency import get_applications_cache
+from interview_tracker.settings import settings
+from interview_tracker.web.api.applications.post.importers import read_applications
 from interview_tracker.web.api.applications.post.schemas.application import (
     ApplicationPostMessage,
+    ImportResponse,
+    ImportRowError,
 )
 from interview_tracker.web.authorization.dependencies import authorization
 from interview_tracker.web.authorization.json_web_token import JsonWebToken
@@ -20,29 +29,83 @@ router = APIRouter()
 
 
 @router.post("/")
-async def create_application(  # noqa: WPS210
+async def create_application(
     incoming_message: ApplicationPostMessage,
     token: HTTPAuthorizationCredentials = Depends(auth_scheme),
     jwt_token: JsonWebToken = Depends(authorization),
     session: AsyncSession = Depends(get_db_session),
+    cache: ApplicationsCache = Depends(get_applications_cache),
 ) -> Response:
-    user = await get_user_by_sub(session, jwt_token.subject)
+    user_id = await get_user_id_by_sub(session, jwt_token.subject)
 
-    application_data = incoming_message.dict(exclude={"timelines"})
-    application = Application(user_id=user.id, archived=False, **application_data)
-    application = await save_application(
+    await dal_create_application(
         session=session,
-        application=application,
+        user_id=user_id,
+        application_data=incoming_message.dict(exclude={"timelines"}),
+        timelines_data=incoming_message.dict().get("timelines") or [],
     )
-
-    timelines_data = incoming_message.dict().pop("timelines", [])
-    if timelines_data:
-        for timeline_data in timelines_data:
-            timeline = Timeline(
-                user_id=user.id,
-                application_id=application.id,
-                **timeline_data,
-            )
-            await save_timeline(session=session, timeline=timeline)
+    await commit(session)
+    await cache.invalidate(user_id)
 
     return Response(status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/import",
+    response_model=ImportResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def import_applications(
+    request: Request,
+    token: HTTPAuthorizationCredentials = Depends(auth_scheme),
+    jwt_token: JsonWebToken = Depends(authorization),
+    session: AsyncSession = Depends(get_db_session),
+    cache: ApplicationsCache = Depends(get_applications_cache),
+) -> JSONResponse:
+    """
+    Import many applications at once.
+
+    Rows are validated one by one like in ``create_application``.
+    The valid ones are loaded with COPY, a batch at a time, in a single
+    transaction; the invalid ones are skipped and reported by their
+    1-based position.
+
+    :param request: JSON array, NDJSON or CSV of applications.
+    :param token: bearer token, for the OpenAPI schema.
+    :param jwt_token: verified access token of the user.
+    :param session: current session.
+    :param cache: response cache of the user.
+    :return: number of imported applications and the per-row errors,
+        with 422 if no row is valid; 415, 400 or 413 if the body can't
+        be parsed, has too many rows or is a too large JSON array.
+    """
+    user_id = await get_user_id_by_sub(session, jwt_token.subject)
+    errors: List[ImportRowError] = []
+    imported = 0
+    batches = read_applications(
+        request,
+        errors,
+        max_rows=settings.applications_import_max_rows,
+        batch_size=settings.applications_import_batch_size,
+        max_json_bytes=settings.applications_import_max_json_bytes,
+    )
+    async for batch in batches:
+        await copy_applications(
+            session=session,
+            user_id=user_id,
+            applications_data=batch,
+        )
+        imported += len(batch)
+    if not imported:
+        return JSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content=ImportResponse(imported=imported, errors=errors).dict(),
+        )
+
+    await commit(session)
+    await cache.invalidate(user_id)
+
+    return JSONResponse(
+        status_code=status.HTTP_201_CREATED,
+        content=ImportResponse(imported=imported, errors=errors).dict(),
+    )
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, Field, validator
 from pydantic.class_validators import partial
 
 from interview_tracker.db.models.main_model import OnSiteRemoteEnum, StatusCategoryEnum
@@ -25,7 +25,14 @@ class ApplicationPutMessage(BaseModel):
     location: Optional[str] = None
     on_site_remote: Optional[OnSiteRemoteEnum] = None
     notes: Optional[str] = None
-    timelines: Optional[List[Timeline]] = None
+    timelines: Optional[List[Timeline]] = Field(
+        None,
+        description=(
+            "Replaces the whole list. Unchanged timelines keep their ids; "
+            "a timeline inserted before existing ones takes over the id of "
+            "the next one, and so on to the end of the list."
+        ),
+    )
 
     _validate_length = validator(
         "company_name",
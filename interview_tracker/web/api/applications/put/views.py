@@ -1,15 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from interview_tracker.db.data_access_layer.application import (
-    delete_timelines,
-    get_application_by_application_id,
-    save_timeline,
+    bump_version,
+    get_user_application,
+    sync_timelines,
+)
+from interview_tracker.db.data_access_layer.stats import (
+    STATS_DIMENSIONS,
+    update_application_stats,
+)
+from interview_tracker.db.data_access_layer.user import get_user_id_by_sub
+from interview_tracker.db.dependencies import commit, get_db_session
+from interview_tracker.db.models.main_model import Application
+from interview_tracker.services.cache.applications import ApplicationsCache
+from interview_tracker.services.cache.dependency import get_applications_cache
+from interview_tracker.web.api.applications.custom_exceptions import (
+    application_not_accessible,
 )
-from interview_tracker.db.data_access_layer.user import get_user_by_sub
-from interview_tracker.db.dependencies import get_db_session
-from interview_tracker.db.models.main_model import Timeline
 from interview_tracker.web.api.applications.put.schemas.application import (
     ApplicationPutMessage,
 )
@@ -21,55 +32,120 @@ router = APIRouter()
 
 
 @router.put("/{application_id}")
-async def update_application(  # noqa: WPS210, C901
+async def update_application(  # noqa: WPS211
     application_id: int,
     incoming_message: ApplicationPutMessage,
     token: HTTPAuthorizationCredentials = Depends(auth_scheme),
     jwt_token: JsonWebToken = Depends(authorization),
     session: AsyncSession = Depends(get_db_session),
+    cache: ApplicationsCache = Depends(get_applications_cache),
 ) -> Response:
-    user = await get_user_by_sub(session, jwt_token.subject)
-    application = await get_application_by_application_id(
-        session=session,
-        application_id=application_id,
+    """
+    Update an application.
+
+    Only the fields that are sent are changed. ``timelines``, when sent,
+    replaces the whole list: unchanged timelines keep their ids, removed
+    ones are deleted and changed ones are updated in place. Timelines
+    are ordered by id, so new ones get new ids only at the end of the
+    list; a timeline inserted before existing ones takes over the id of
+    the next one, and each of the following timelines the id of the one
+    after it.
+
+    :param application_id: id of the application.
+    :param incoming_message: new values.
+    :param token: bearer token, for the OpenAPI schema.
+    :param jwt_token: verified access token of the user.
+    :param session: current session.
+    :param cache: response cache of the user.
+    :return: empty response.
+    """
+    user_id = await get_user_id_by_sub(session, jwt_token.subject)
+    application = await _get_application(
+        session,
+        user_id,
+        application_id,
+        with_timelines=incoming_message.timelines is not None,
     )
+    if await _apply_update(session, user_id, application, incoming_message):
+        await commit(session)
+        await cache.invalidate(user_id, application_id)
 
+    return Response(status_code=status.HTTP_200_OK)
+
+
+async def _get_application(
+    session: AsyncSession,
+    user_id: int,
+    application_id: int,
+    with_timelines: bool,
+) -> Application:
+    application = await get_user_application(
+        application_id=application_id,
+        user_id=user_id,
+        session=session,
+        with_timelines=with_timelines,
+    )
     if not application:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Application not found",
-        )
-
-    if application.user_id != user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="No access to the application",
-        )
-
-    # updating attributes
-    application_data = incoming_message.dict(exclude_unset=True, exclude={"timelines"})
-    for key, value in application_data.items():
-        setattr(application, key, value)
-    # Changes will be committed right after the method
+        raise await application_not_accessible(application_id, session)
+    return application
+
+
+async def _apply_update(
+    session: AsyncSession,
+    user_id: int,
+    application: Application,
+    incoming_message: ApplicationPutMessage,
+) -> bool:
+    """
+    Update the application, its timelines and the stats of its user.
+
+    :param session: current session.
+    :param user_id: owner of the application.
+    :param application: application to update, with its timelines loaded
+        if they're part of the update.
+    :param incoming_message: new values.
+    :return: whether anything changed.
+    """
+    old_stats_data = {name: getattr(application, name) for name in STATS_DIMENSIONS}
+    changed_data = _update_attributes(application, incoming_message)
 
     # updating timelines
     timelines_data = incoming_message.dict().get("timelines")
-    existing_timelines = []
-    for timeline in application.timelines:
-        existing_timelines.append(
-            {
-                "name": timeline.name,
-                "value": timeline.value,
-            },
-        )
-    if timelines_data is not None and timelines_data != existing_timelines:
-        await delete_timelines(application=application, session=session)
-        for timeline_data in timelines_data:
-            timeline_entry = Timeline(
-                user_id=user.id,
-                application_id=application.id,
-                **timeline_data,
-            )
-            await save_timeline(session=session, timeline=timeline_entry)
+    timelines_changed = timelines_data is not None and await sync_timelines(
+        session=session,
+        application=application,
+        timelines_data=timelines_data,
+    )
 
-    return Response(status_code=status.HTTP_200_OK)
+    if not changed_data and not timelines_changed:
+        return False
+    bump_version(application)
+    await update_application_stats(
+        session,
+        user_id,
+        added=[{**old_stats_data, **changed_data}],
+        removed=[old_stats_data],
+    )
+    return True
+
+
+def _update_attributes(
+    application: Application,
+    incoming_message: ApplicationPutMessage,
+) -> Dict[str, Any]:
+    """
+    Set the attributes of the application to their new values.
+
+    :param application: application to update.
+    :param incoming_message: new values.
+    :return: the attributes that changed, with their new values.
+    """
+    application_data = incoming_message.dict(exclude_unset=True, exclude={"timelines"})
+    changed_data = {
+        key: value
+        for key, value in application_data.items()
+        if getattr(application, key) != value
+    }
+    for key, value in changed_data.items():
+        setattr(application, key, value)
+    return changed_data
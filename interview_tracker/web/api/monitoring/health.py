@@ -0,0 +1,116 @@
+import asyncio
+import time
+from typing import Any, Optional
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from interview_tracker.db.pool import InstrumentedAsyncPool
+from interview_tracker.web.api.monitoring.schema import (
+    DatabaseCheck,
+    JwksCheck,
+    PoolCheck,
+    ReadinessResponse,
+)
+from interview_tracker.web.authorization.jwks import jwks_key_store
+
+
+async def _select_one(engine: AsyncEngine) -> None:
+    async with engine.connect() as connection:
+        await connection.execute(text("SELECT 1"))
+
+
+async def check_database(engine: AsyncEngine, timeout: float) -> DatabaseCheck:
+    """
+    Run ``SELECT 1`` on a connection of the pool.
+
+    :param engine: engine of the primary.
+    :param timeout: seconds to wait for the answer, checkout included.
+    :return: latency, or the kind of error.
+    """
+    started_at = time.perf_counter()
+    try:
+        await asyncio.wait_for(_select_one(engine), timeout)
+    except Exception as exc:
+        logger.warning("Readiness: database check failed: {0!r}", exc)
+        return DatabaseCheck(ok=False, error=type(exc).__name__)
+    return DatabaseCheck(ok=True, latency=time.perf_counter() - started_at)
+
+
+def check_pool(pool: InstrumentedAsyncPool, min_headroom: int) -> PoolCheck:
+    """
+    Check the pool isn't exhausted.
+
+    :param pool: pool of the primary.
+    :param min_headroom: connections the pool must still be able to hand out.
+    :return: headroom of the pool.
+    """
+    headroom = pool.headroom()
+    return PoolCheck(
+        ok=headroom is None or headroom >= min_headroom,
+        headroom=headroom,
+    )
+
+
+async def check_jwks(timeout: float) -> JwksCheck:
+    """
+    Check the signing keys are loaded, fetching them if they aren't.
+
+    :param timeout: seconds to wait for the issuer.
+    :return: number of keys, or the kind of error.
+    """
+    if not jwks_key_store.has_keys:
+        try:
+            await asyncio.wait_for(jwks_key_store.refresh(), timeout)
+        except Exception as exc:
+            logger.warning("Readiness: JWKS check failed: {0!r}", exc)
+            return JwksCheck(ok=False, keys=0, error=type(exc).__name__)
+    return JwksCheck(ok=True, keys=jwks_key_store.key_count)
+
+
+class ReadinessProbe:
+    """
+    Checks the dependencies of the worker, at most once per ``ttl`` seconds.
+
+    Probes arriving while a check runs wait for it, those arriving
+    before it expires get its result: however often the orchestrator
+    probes, postgres sees one ``SELECT 1`` per ``ttl`` and worker.
+    """
+
+    def __init__(self, ttl: float, timeout: float, min_pool_headroom: int) -> None:
+        self.ttl = ttl
+        self.timeout = timeout
+        self.min_pool_headroom = min_pool_headroom
+        self._report: Optional[ReadinessResponse] = None
+        self._checked_at = -float("inf")
+        self._lock = asyncio.Lock()
+
+    async def check(self, state: Any) -> ReadinessResponse:
+        """
+        Get the readiness of the worker.
+
+        :param state: state of the application.
+        :return: result of the latest check.
+        """
+        async with self._lock:
+            if self._report is None or self._is_expired():
+                self._report = await self._run_checks(state)
+                self._checked_at = time.monotonic()
+            return self._report
+
+    def _is_expired(self) -> bool:
+        return time.monotonic() - self._checked_at >= self.ttl
+
+    async def _run_checks(self, state: Any) -> ReadinessResponse:
+        database, jwks = await asyncio.gather(
+            check_database(state.db_engine, self.timeout),
+            check_jwks(self.timeout),
+        )
+        pool = check_pool(state.db_engine.pool, self.min_pool_headroom)
+        return ReadinessResponse(
+            ready=database.ok and pool.ok and jwks.ok,
+            database=database,
+            pool=pool,
+            jwks=jwks,
+        )
@@ -0,0 +1,179 @@
+from typing import Any, List, Tuple
+
+from interview_tracker.db.data_access_layer.user import user_id_cache
+from interview_tracker.db.pool import InstrumentedAsyncPool
+from interview_tracker.db.replicas import ReplicaRouter
+from interview_tracker.services.metrics.exposition import PrometheusWriter
+from interview_tracker.services.metrics.registry import MetricsRegistry, RouteMetrics
+from interview_tracker.web.authorization.jwks import jwks_key_store
+from interview_tracker.web.authorization.token_cache import verified_token_cache
+
+Routes = List[Tuple[Tuple[str, str], RouteMetrics]]
+
+REQUEST_HISTOGRAMS = (
+    ("http_request_duration_seconds", "latency", "Latency of HTTP requests."),
+    ("db_queries_per_request", "queries", "Database queries run by a request."),
+    (
+        "db_query_duration_seconds",
+        "query_time",
+        "Time a request spent waiting for database queries.",
+    ),
+)
+
+
+def write_request_metrics(writer: PrometheusWriter, registry: MetricsRegistry) -> None:
+    """
+    Write the latency, statuses and queries of the requests by route.
+
+    :param writer: page being built.
+    :param registry: request metrics of the worker.
+    """
+    routes = sorted(registry.routes.items())
+    _write_status_counts(writer, routes)
+    _write_n_plus_one_counts(writer, routes)
+    for name, attribute, description in REQUEST_HISTOGRAMS:
+        writer.family(name, "histogram", description)
+        _write_histograms(writer, routes, name, attribute)
+
+
+def _write_status_counts(writer: PrometheusWriter, routes: Routes) -> None:
+    writer.family(
+        "http_requests_total",
+        "counter",
+        "Finished HTTP requests by route and status code.",
+    )
+    for (method, route), route_metrics in routes:
+        for status_code, requests in sorted(route_metrics.statuses.items()):
+            writer.sample(
+                "http_requests_total",
+                requests,
+                {"method": method, "route": route, "status": str(status_code)},
+            )
+
+
+def _write_n_plus_one_counts(writer: PrometheusWriter, routes: Routes) -> None:
+    writer.family(
+        "db_n_plus_one_requests_total",
+        "counter",
+        "Requests that ran the same statement shape too many times.",
+    )
+    for (method, route), route_metrics in routes:
+        writer.sample(
+            "db_n_plus_one_requests_total",
+            route_metrics.n_plus_one,
+            {"method": method, "route": route},
+        )
+
+
+def _write_histograms(
+    writer: PrometheusWriter,
+    routes: Routes,
+    name: str,
+    attribute: str,
+) -> None:
+    for (method, route), route_metrics in routes:
+        writer.histogram(
+            name,
+            getattr(route_metrics, attribute).snapshot(),
+            {"method": method, "route": route},
+        )
+
+
+def write_pool_metrics(writer: PrometheusWriter, pool: InstrumentedAsyncPool) -> None:
+    """
+    Write the state of the database connection pool.
+
+    :param writer: page being built.
+    :param pool: pool of the primary.
+    """
+    stats = pool.stats()
+    gauges = (
+        ("db_pool_size", stats.size, "Connections the pool keeps open."),
+        ("db_pool_checked_in", stats.checked_in, "Idle connections."),
+        ("db_pool_checked_out", stats.checked_out, "Connections in use."),
+        ("db_pool_overflow", stats.overflow, "Connections opened above the size."),
+    )
+    for name, value, description in gauges:
+        writer.family(name, "gauge", description)
+        writer.sample(name, value)
+    writer.family(
+        "db_pool_timeouts_total",
+        "counter",
+        "Checkouts that gave up waiting for a connection.",
+    )
+    writer.sample("db_pool_timeouts_total", stats.timeouts)
+    writer.family(
+        "db_pool_wait_seconds",
+        "histogram",
+        "Time spent waiting for a connection.",
+    )
+    writer.histogram("db_pool_wait_seconds", stats.wait_time)
+
+
+def write_replica_metrics(writer: PrometheusWriter, router: ReplicaRouter) -> None:
+    """
+    Write the last lag measured on every read replica.
+
+    :param writer: page being built.
+    :param router: router of the read-only sessions.
+    """
+    writer.family(
+        "db_replica_lag_seconds",
+        "gauge",
+        "Replay lag of the read replica, +Inf when it doesn't answer.",
+    )
+    for replica in router.replicas:
+        writer.sample("db_replica_lag_seconds", replica.lag, {"replica": replica.name})
+
+
+def write_auth_metrics(writer: PrometheusWriter) -> None:
+    """
+    Write the state of the in-memory authentication caches.
+
+    :param writer: page being built.
+    """
+    _write_token_cache_metrics(writer)
+    writer.family("auth_jwks_keys", "gauge", "Signing keys fetched from the issuer.")
+    writer.sample("auth_jwks_keys", jwks_key_store.key_count)
+    writer.family("auth_user_id_cache_entries", "gauge", "User ids in memory.")
+    writer.sample("auth_user_id_cache_entries", len(user_id_cache))
+
+
+def _write_token_cache_metrics(writer: PrometheusWriter) -> None:
+    token_stats = verified_token_cache.stats
+    writer.family(
+        "auth_token_cache_entries",
+        "gauge",
+        "Verified access tokens in memory.",
+    )
+    writer.sample("auth_token_cache_entries", token_stats["size"])
+    writer.family(
+        "auth_token_cache_lookups_total",
+        "counter",
+        "Lookups of access tokens in the verified token cache.",
+    )
+    writer.sample(
+        "auth_token_cache_lookups_total",
+        token_stats["hits"],
+        {"result": "hit"},
+    )
+    writer.sample(
+        "auth_token_cache_lookups_total",
+        token_stats["misses"],
+        {"result": "miss"},
+    )
+
+
+def render_metrics(state: Any) -> str:
+    """
+    Render all the metrics of the worker.
+
+    :param state: state of the application.
+    :return: page in the Prometheus text format.
+    """
+    writer = PrometheusWriter()
+    write_request_metrics(writer, state.metrics)
+    write_pool_metrics(writer, state.db_engine.pool)
+    write_replica_metrics(writer, state.replica_router)
+    write_auth_metrics(writer)
+    return writer.render()
@@ -0,0 +1,64 @@
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+from interview_tracker.services.metrics.histogram import HistogramSnapshot, format_bound
+
+
+class HistogramResponse(BaseModel):
+    """Cumulative counts by upper bound of the bucket, in seconds."""
+
+    buckets: Dict[str, int]
+    count: int
+    sum: float
+
+    @classmethod
+    def from_snapshot(cls, snapshot: HistogramSnapshot) -> "HistogramResponse":
+        return cls(
+            buckets={format_bound(bound): count for bound, count in snapshot.buckets},
+            count=snapshot.observations,
+            sum=snapshot.sum,
+        )
+
+
+class PoolStatsResponse(BaseModel):
+    """Connection pool of the worker that answered."""
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    timeouts: int
+    wait_time: HistogramResponse
+
+
+class DatabaseCheck(BaseModel):
+    """Round trip of ``SELECT 1`` through the pool."""
+
+    ok: bool
+    latency: Optional[float] = None
+    error: Optional[str] = None
+
+
+class PoolCheck(BaseModel):
+    """Connections the pool can still hand out, None if unlimited."""
+
+    ok: bool
+    headroom: Optional[int]
+
+
+class JwksCheck(BaseModel):
+    """Signing keys of the access tokens."""
+
+    ok: bool
+    keys: int
+    error: Optional[str] = None
+
+
+class ReadinessResponse(BaseModel):
+    """Whether the worker can serve requests, and why not."""
+
+    ready: bool
+    database: DatabaseCheck
+    pool: PoolCheck
+    jwks: JwksCheck
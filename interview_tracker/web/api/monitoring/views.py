@@ -1,4 +1,15 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, status
+from starlette.requests import Request
+from starlette.responses import Response
+
+from interview_tracker.services.metrics.exposition import CONTENT_TYPE
+from interview_tracker.web.api.monitoring.metrics import render_metrics
+from interview_tracker.web.api.monitoring.schema import (
+    HistogramResponse,
+    PoolStatsResponse,
+    ReadinessResponse,
+)
+from interview_tracker.web.authorization.dependencies import monitoring_authorization
 
 router = APIRouter()
 
@@ -9,4 +20,83 @@ def health_check() -> None:
     Checks the health of a project.
 
     It returns 200 if the project is healthy.
+    Same as the liveness probe, kept for existing monitors.
+    """
+
+
+@router.get("/health/live")
+def liveness_check() -> None:
+    """
+    Liveness probe: the worker is up and its event loop answers.
+
+    It checks no dependency, an outage of the database mustn't get
+    the workers restarted.
+    """
+
+
+@router.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ReadinessResponse}},
+)
+async def readiness_check(request: Request, response: Response) -> ReadinessResponse:
+    """
+    Readiness probe: the worker can serve requests.
+
+    It returns 503 when the database doesn't answer, the pool is
+    exhausted or the signing keys can't be loaded. Results are cached
+    for ``health_check_cache_seconds``.
+
+    :param request: current request.
+    :param response: response, to set its status.
+    :return: result of every check.
+    """
+    report = await request.app.state.readiness_probe.check(request.app.state)
+    if not report.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return report
+
+
+@router.get(
+    "/pool",
+    response_model=PoolStatsResponse,
+    dependencies=[Depends(monitoring_authorization)],
+)
+async def pool_stats(request: Request) -> PoolStatsResponse:
+    """
+    Shows the state of the database connection pool.
+
+    Pools are per worker, so are the stats. Only the monitoring token
+    is let in.
+
+    :param request: current request.
+    :return: pool stats.
+    """
+    pool = request.app.state.db_engine.pool
+    stats = pool.stats()
+    return PoolStatsResponse(
+        size=stats.size,
+        checked_in=stats.checked_in,
+        checked_out=stats.checked_out,
+        overflow=stats.overflow,
+        timeouts=stats.timeouts,
+        wait_time=HistogramResponse.from_snapshot(stats.wait_time),
+    )
+
+
+@router.get(
+    "/metrics",
+    response_class=Response,
+    dependencies=[Depends(monitoring_authorization)],
+)
+async def metrics(request: Request) -> Response:
+    """
+    Exposes the metrics of the worker in the Prometheus text format.
+
+    Every worker has its own metrics, scrape each of them. Only the
+    monitoring token is let in.
+
+    :param request: current request.
+    :return: metrics page.
     """
+    return Response(render_metrics(request.app.state), media_type=CONTENT_TYPE)
@@ -1,15 +1,20 @@
 from importlib import metadata
 
 from fastapi import FastAPI
-from fastapi.responses import UJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 
 from interview_tracker.logger import configure_logging
+from interview_tracker.services.metrics.middleware import MetricsMiddleware
+from interview_tracker.services.metrics.registry import MetricsRegistry
+from interview_tracker.settings import settings
+from interview_tracker.web.access_log import AccessLogMiddleware
+from interview_tracker.web.api.monitoring.health import ReadinessProbe
 from interview_tracker.web.api.router import api_router
 from interview_tracker.web.lifetime import (
     register_shutdown_event,
     register_startup_event,
 )
+from interview_tracker.web.responses import TimedUJSONResponse
 
 
 def get_app() -> FastAPI:
@@ -27,7 +32,7 @@ def get_app() -> FastAPI:
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
-        default_response_class=UJSONResponse,
+        default_response_class=TimedUJSONResponse,
     )
 
     # Adds startup and shutdown events.
@@ -41,6 +46,24 @@ def get_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    if settings.access_log:
+        app.add_middleware(
+            AccessLogMiddleware,
+            sample_rate=settings.access_log_sample_rate,
+            slow_seconds=settings.access_log_slow_seconds,
+        )
+    app.state.metrics = MetricsRegistry()
+    app.add_middleware(
+        MetricsMiddleware,
+        registry=app.state.metrics,
+        send_server_timing=settings.server_timing,
+        n_plus_one_threshold=settings.db_n_plus_one_threshold,
+    )
+    app.state.readiness_probe = ReadinessProbe(
+        ttl=settings.health_check_cache_seconds,
+        timeout=settings.health_check_timeout,
+        min_pool_headroom=settings.health_min_pool_headroom,
+    )
 
     # Main router for the API.
     app.include_router(router=api_router, prefix="/api")
@@ -1,10 +1,39 @@
-from fastapi import Depends
+import secrets
 
+from fastapi import Depends, HTTPException, status
+from starlette.requests import Request as StarletteRequest
+
+from interview_tracker.services.metrics.timing import timed
+from interview_tracker.settings import settings
 from interview_tracker.web.authorization.authorization_header_elements import (
     get_bearer_token,
 )
+from interview_tracker.web.authorization.custom_exceptions import (
+    BadCredentialsException,
+)
 from interview_tracker.web.authorization.json_web_token import JsonWebToken
 
 
-def authorization(token: str = Depends(get_bearer_token)) -> JsonWebToken:
-    return JsonWebToken(token)
+async def authorization(token: str = Depends(get_bearer_token)) -> JsonWebToken:
+    jwt_token = JsonWebToken(token)
+    with timed("auth"):
+        await jwt_token.validate()
+    return jwt_token
+
+
+def monitoring_authorization(request: StarletteRequest) -> None:
+    """
+    Let only the monitoring system read the internals of the worker.
+
+    The monitoring endpoints don't exist until ``monitoring_token`` is
+    set, then they answer the requests bearing it.
+
+    :param request: current request.
+    :raises HTTPException: if no monitoring token is set.
+    :raises BadCredentialsException: if the request bears another token.
+    """
+    if not settings.monitoring_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    token = get_bearer_token(request)
+    if not secrets.compare_digest(token.encode(), settings.monitoring_token.encode()):
+        raise BadCredentialsException
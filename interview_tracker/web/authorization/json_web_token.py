@@ -7,6 +7,8 @@ from interview_tracker.web.authorization.custom_exceptions import (
     BadCredentialsException,
     UnableCredentialsException,
 )
+from interview_tracker.web.authorization.jwks import jwks_key_store
+from interview_tracker.web.authorization.token_cache import verified_token_cache
 
 
 class JsonWebToken:  # noqa: WPS230
@@ -15,15 +17,20 @@ class JsonWebToken:  # noqa: WPS230
         self.auth0_issuer_url: str = f"https://{settings.auth0_domain}/"
         self.auth0_audience: str = settings.auth0_audience
         self.algorithm: str = "RS256"
-        self.jwks_uri: str = f"{self.auth0_issuer_url}.well-known/jwks.json"
         self.payload: Dict[str, Any] = {}
-        self.is_valid: bool = self.validate()
+        self.is_valid: bool = False
+
+    async def validate(self) -> bool:
+        cached_payload = verified_token_cache.get(self.jwt_access_token)
+        if cached_payload is not None:
+            self.payload = cached_payload
+            self.is_valid = True
+            return True
 
-    def validate(self) -> bool:
         try:
-            jwks_client = jwt.PyJWKClient(self.jwks_uri)
-            jwt_signing_key = jwks_client.get_signing_key_from_jwt(
-                self.jwt_access_token,
+            unverified_header = jwt.get_unverified_header(self.jwt_access_token)
+            jwt_signing_key = (
+                await jwks_key_store.get_signing_key(unverified_header.get("kid"))
             ).key
             self.payload = jwt.decode(
                 self.jwt_access_token,
@@ -36,6 +43,9 @@ class JsonWebToken:  # noqa: WPS230
             raise UnableCredentialsException
         except jwt.exceptions.InvalidTokenError:  # noqa: WPS329
             raise BadCredentialsException
+
+        verified_token_cache.set(self.jwt_access_token, self.payload)
+        self.is_valid = True
         return True
 
     @property
@@ -0,0 +1,154 @@
+import asyncio
+import math
+import time
+from typing import Dict, Optional
+
+import httpx
+import jwt
+from loguru import logger
+
+from interview_tracker.settings import settings
+
+
+class JwksKeyStore:  # noqa: WPS230
+    """
+    Process-wide cache of the issuer's JSON Web Key Set.
+
+    Keys are indexed by ``kid`` and reused until ``ttl`` seconds have passed.
+    Once expired, the cached keys keep being served while a refresh runs
+    in the background, so the fetch stays off the request path.
+    A token signed with an unknown ``kid`` triggers one forced refresh,
+    at most once per ``min_refresh_interval`` seconds, so key rotation is
+    picked up without letting garbage tokens hammer the issuer.
+    If the issuer is unreachable, the last good keys keep being served.
+
+    Fetching is done with an async HTTP client and is single-flight:
+    concurrent callers that need fresh keys share one in-flight request.
+    """
+
+    def __init__(
+        self,
+        jwks_uri: str,
+        ttl: float,
+        min_refresh_interval: float,
+        timeout: float,
+    ) -> None:
+        self.jwks_uri = jwks_uri
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self._keys: Dict[str, jwt.PyJWK] = {}
+        self._fetched_at: Optional[float] = None
+        self._last_attempt_at = -math.inf
+        self._last_forced_refresh_at = -math.inf
+        self._inflight: "Optional[asyncio.Future[None]]" = None
+
+    @property
+    def has_keys(self) -> bool:
+        return bool(self._keys)
+
+    @property
+    def key_count(self) -> int:
+        return len(self._keys)
+
+    async def get_signing_key(self, kid: Optional[str]) -> jwt.PyJWK:
+        """
+        Get the signing key for the given key id.
+
+        :param kid: ``kid`` header of the token being verified.
+        :raises PyJWKClientError: if no matching key is known.
+        :return: signing key.
+        """
+        if self._is_expired():
+            if self._keys:
+                self._start_refresh()
+            else:
+                await self.refresh()
+
+        key = self._keys.get(kid) if kid else None
+        if key is None and kid and self._can_force_refresh():
+            self._last_forced_refresh_at = time.monotonic()
+            await self.refresh()
+            key = self._keys.get(kid)
+
+        if key is None:
+            raise jwt.exceptions.PyJWKClientError(
+                f'Unable to find a signing key that matches: "{kid}"',
+            )
+        return key
+
+    async def refresh(self) -> None:
+        """
+        Fetch the key set, joining a fetch that is already in flight.
+
+        The fetch fails with PyJWKClientConnectionError when the issuer
+        is unreachable and there are no cached keys to fall back to.
+        """
+        await asyncio.shield(self._start_refresh())
+
+    def clear(self) -> None:
+        """Forget all cached keys."""
+        self._keys = {}
+        self._fetched_at = None
+        self._last_attempt_at = -math.inf
+        self._last_forced_refresh_at = -math.inf
+        self._inflight = None
+
+    def _is_expired(self) -> bool:
+        now = time.monotonic()
+        if self._fetched_at is None:
+            return now - self._last_attempt_at >= self.min_refresh_interval
+        return (
+            now - self._fetched_at >= self.ttl
+            and now - self._last_attempt_at >= self.min_refresh_interval
+        )
+
+    def _can_force_refresh(self) -> bool:
+        since_forced = time.monotonic() - self._last_forced_refresh_at
+        return since_forced >= self.min_refresh_interval
+
+    def _start_refresh(self) -> "asyncio.Future[None]":
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.ensure_future(self._refresh())
+            # background refreshes may have no awaiter left to see the error
+            self._inflight.add_done_callback(
+                lambda future: future.cancelled() or future.exception(),
+            )
+        return self._inflight
+
+    async def _refresh(self) -> None:
+        self._last_attempt_at = time.monotonic()
+        try:
+            keys = await self._fetch_keys()
+        except Exception as exc:
+            if not self._keys:
+                raise jwt.exceptions.PyJWKClientConnectionError(
+                    f"Fail to fetch data from the url, err: {exc}",
+                )
+            logger.warning(
+                "Unable to refresh JWKS from {0}, serving cached keys: {1}",
+                self.jwks_uri,
+                exc,
+            )
+            return
+
+        self._keys = keys
+        self._fetched_at = self._last_attempt_at
+
+    async def _fetch_keys(self) -> Dict[str, jwt.PyJWK]:
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.get(self.jwks_uri)
+            response.raise_for_status()
+        jwk_set = jwt.PyJWKSet.from_dict(response.json())
+        return {key.key_id: key for key in jwk_set.keys if key.key_id}
+
+
+jwks_key_store = JwksKeyStore(
+    jwks_uri=(
+        settings.auth0_jwks_uri
+        or f"https://{settings.auth0_domain}/.well-known/jwks.json"
+    ),
+    ttl=settings.auth0_jwks_cache_ttl,
+    min_refresh_interval=settings.auth0_jwks_min_refresh_interval,
+    timeout=settings.auth0_jwks_timeout,
+)
@@ -1,45 +1,143 @@
 import json
-from typing import Dict
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
 
-import requests
-from loguru._handler import memoize  # noqa: WPS436
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import status
 
 from interview_tracker.settings import settings
 
+# the usual public exponent, and the smallest key size auth0 uses
+RSA_PUBLIC_EXPONENT = 65537
+RSA_KEY_SIZE = 2048
+
 testing_users = {
-    "definition": ("email", "password", "sub"),
-    "user_1": (
-        "ga4la-salts0f@icloud.com",
-        "6JV%Sza+&D6sV@b",
-        "64b71e183dd4fa545798abf4",
-    ),
-    "user_2": ("rkfm-09-jnjn@gmail.com", "UeU4.cKF*^Dn+3u", "64c0f6419df8b5e7de879a8b"),
+    "definition": ("email", "sub"),
+    "user_1": ("ga4la-salts0f@icloud.com", "64b71e183dd4fa545798abf4"),
+    "user_2": ("rkfm-09-jnjn@gmail.com", "64c0f6419df8b5e7de879a8b"),
 }
 
 
-@memoize
-def get_user_token_headers(user_id: str = "user_1") -> Dict[str, str]:
-    user = testing_users[user_id]
-    return {"Authorization": "Bearer " + _get_user_token(user)}  # noqa: WPS336
-
-
-def _get_user_token(user: tuple[str, str, str]) -> str:
-    url = f"https://{settings.auth0_domain}/oauth/token"
-    headers = {"content-type": "application/json"}
-    parameter = {
-        "client_id": settings.client_id,
-        "client_secret": settings.client_secret,
-        "audience": settings.auth0_audience,
-        "grant_type": "password",
-        "username": user[0],
-        "password": user[1],
-        "scope": "openid",
-    }
-
-    response = json.loads(
-        requests.post(url, json=parameter, headers=headers).text,  # noqa: S113
+class TokenIssuer:
+    """
+    Signs access tokens offline, like the auth0 tenant would.
+
+    The RSA key is generated in the process, its public half is
+    published by a StubJwksServer the application is pointed at.
+    """
+
+    def __init__(self, issuer: str, audience: str, kid: str = "local") -> None:
+        self.issuer = issuer
+        self.audience = audience
+        self.kid = kid
+        self._private_key = rsa.generate_private_key(
+            public_exponent=RSA_PUBLIC_EXPONENT,
+            key_size=RSA_KEY_SIZE,
+        )
+
+    @property
+    def jwk(self) -> Dict[str, Any]:
+        """
+        Public key, as published in the JWKS.
+
+        :return: JWK of the key.
+        """
+        jwk = json.loads(
+            jwt.algorithms.RSAAlgorithm.to_jwk(self._private_key.public_key()),
+        )
+        jwk.update(kid=self.kid, alg="RS256", use="sig")
+        return jwk
+
+    def issue(self, sub: str, ttl: int = 3600) -> str:
+        """
+        Sign an access token.
+
+        :param sub: auth0 user id, without the connection prefix.
+        :param ttl: seconds the token is valid for.
+        :return: encoded token.
+        """
+        now = int(time.time())
+        return jwt.encode(
+            {
+                "sub": f"auth0|{sub}",
+                "iss": self.issuer,
+                "aud": self.audience,
+                "iat": now,
+                "exp": now + ttl,
+            },
+            self._private_key,
+            algorithm="RS256",
+            headers={"kid": self.kid},
+        )
+
+
+class StubJwksServer(ThreadingHTTPServer):
+    """Local issuer serving a JWKS document, optionally slowly or with errors."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        super().__init__((host, port), StubJwksHandler)
+        self.host = host
+        self.keys: List[Dict[str, Any]] = []
+        self.delay: float = 0
+        self.is_down = False
+        self.requests = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.server_port}/.well-known/jwks.json"
+
+    def start(self) -> None:
+        """Serve from a daemon thread."""
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class StubJwksHandler(BaseHTTPRequestHandler):
+    server: StubJwksServer
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.server.requests += 1
+        time.sleep(self.server.delay)
+        if self.server.is_down:
+            self.send_error(status.HTTP_503_SERVICE_UNAVAILABLE)
+            return
+        body = json.dumps({"keys": self.server.keys}).encode()
+        self.send_response(status.HTTP_200_OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        """
+        Keep the output clean.
+
+        :param args: format and arguments of the message.
+        """
+
+
+@lru_cache(maxsize=None)
+def get_token_issuer() -> TokenIssuer:
+    """
+    Issuer of the tokens the tests use, it signs like the auth0 tenant.
+
+    :return: token issuer.
+    """
+    return TokenIssuer(
+        issuer=f"https://{settings.auth0_domain}/",
+        audience=settings.auth0_audience,
     )
-    return response["access_token"]
 
 
-print(get_user_token_headers())  # noqa: WPS421
+@lru_cache(maxsize=None)
+def get_user_token_headers(user_id: str = "user_1") -> Dict[str, str]:
+    sub = testing_users[user_id][1]
+    token = get_token_issuer().issue(sub)
+    return {"Authorization": f"Bearer {token}"}
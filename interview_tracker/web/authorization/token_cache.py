@@ -0,0 +1,88 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from interview_tracker.settings import settings
+
+# decoded payload and expiry timestamp
+_Entry = Tuple[Dict[str, Any], float]
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of access tokens whose signature was already verified.
+
+    Entries are keyed by a SHA-256 digest of the raw token, so tokens
+    themselves are never kept in memory, and live until the token's
+    own ``exp`` claim.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the decoded payload of an already verified token.
+
+        :param token: raw bearer token.
+        :return: payload or None if the token is unknown or expired.
+        """
+        key = self._make_key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]  # noqa: WPS420
+            self.misses += 1
+            return None
+
+    def set(self, token: str, payload: Dict[str, Any]) -> None:
+        """
+        Remember a verified token until it expires.
+
+        :param token: raw bearer token.
+        :param payload: decoded and verified claims.
+        """
+        expires_at = payload.get("exp")
+        if self.max_size <= 0 or not isinstance(expires_at, (int, float)):
+            return
+
+        key = self._make_key(token)
+        with self._lock:
+            self._entries[key] = (payload, float(expires_at))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0,
+        }
+
+    @staticmethod
+    def _make_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+
+verified_token_cache = VerifiedTokenCache(max_size=settings.auth_token_cache_size)
@@ -1,11 +1,52 @@
+import asyncio
+import contextlib
 from typing import Awaitable, Callable
 
+import jwt
 from fastapi import FastAPI
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
-
-from interview_tracker.db.meta import meta
-from interview_tracker.db.models import load_all_models
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from yarl import URL
+
+from interview_tracker.db.pool import InstrumentedAsyncPool
+from interview_tracker.db.replicas import ReplicaRouter
+from interview_tracker.db.utils import check_schema_version
+from interview_tracker.logger import stop_log_writers
+from interview_tracker.services.cache.lifetime import (
+    create_backend,
+    init_cache,
+    shutdown_cache,
+)
+from interview_tracker.services.metrics.queries import instrument_engine
 from interview_tracker.settings import settings
+from interview_tracker.web.authorization.jwks import jwks_key_store
+
+
+def _create_engine(db_url: URL) -> AsyncEngine:
+    """
+    Creates an engine with the configured pool and the query metrics.
+
+    :param db_url: database URL.
+    :return: engine.
+    """
+    engine = create_async_engine(
+        str(db_url),
+        echo=settings.db_echo,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args={
+            # asyncpg's own cache and the one of SQLAlchemy's adapter
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+            "server_settings": settings.db_server_settings,
+        },
+    )
+    instrument_engine(engine.sync_engine)
+    return engine
 
 
 def _setup_db(app: FastAPI) -> None:  # pragma: no cover
@@ -14,26 +55,72 @@ def _setup_db(app: FastAPI) -> None:  # pragma: no cover
 
     This function creates SQLAlchemy engine instance,
     session_factory for creating sessions
-    and stores them in the application's state property.
+    and stores them in the application's state property,
+    along with the router of the read-only sessions.
 
     :param app: fastAPI application.
     """
-    engine = create_async_engine(str(settings.db_url), echo=settings.db_echo)
+    engine = _create_engine(settings.db_url)
     session_factory = async_sessionmaker(
         engine,
         expire_on_commit=False,
     )
     app.state.db_engine = engine
     app.state.db_session_factory = session_factory
+    app.state.replica_router = ReplicaRouter(
+        primary=engine,
+        replicas=[_create_engine(url) for url in settings.db_replica_urls],
+        pins=create_backend(max_size=settings.db_replica_pin_max_size),
+        pin_seconds=settings.db_replica_pin_seconds,
+        max_lag=settings.db_replica_max_lag,
+        check_timeout=settings.db_replica_check_timeout,
+    )
+
+
+async def _start_replica_checks(app: FastAPI) -> None:
+    """
+    Measures the lag of the replicas, then keeps measuring it in the background.
+
+    :param app: fastAPI application.
+    """
+    router: ReplicaRouter = app.state.replica_router
+    app.state.replica_checks = None
+    if router.replicas:
+        await router.check_lag()
+        app.state.replica_checks = asyncio.create_task(
+            router.run_lag_checks(settings.db_replica_check_interval),
+        )
+
+
+async def _stop_replica_checks(app: FastAPI) -> None:
+    """
+    Stops measuring the lag and closes the replica connections.
+
+    :param app: fastAPI application.
+    """
+    if app.state.replica_checks is not None:
+        app.state.replica_checks.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await app.state.replica_checks
+    await app.state.replica_router.close()
+
+
+async def _check_schema(app: FastAPI) -> None:
+    """
+    Verifies that the database is migrated.
+
+    :param app: fastAPI application.
+    """
+    if settings.db_check_schema:
+        await check_schema_version(app.state.db_engine)
 
 
-async def _create_tables() -> None:  # pragma: no cover
-    """Populates tables in the database."""
-    load_all_models()
-    engine = create_async_engine(str(settings.db_url))
-    async with engine.begin() as connection:
-        await connection.run_sync(meta.create_all)
-    await engine.dispose()
+async def _warm_up_jwks() -> None:
+    """Fetches signing keys, so the first requests don't wait for the issuer."""
+    try:
+        await jwks_key_store.refresh()
+    except jwt.exceptions.PyJWKClientError as exc:
+        logger.warning("Unable to warm up JWKS cache: {0}", exc)
 
 
 def register_startup_event(
@@ -52,7 +139,10 @@ def register_startup_event(
     @app.on_event("startup")
     async def _startup() -> None:  # noqa: WPS430
         _setup_db(app)
-        await _create_tables()
+        await _check_schema(app)
+        await _start_replica_checks(app)
+        await _warm_up_jwks()
+        init_cache(app)
         pass  # noqa: WPS420
 
     return _startup
@@ -70,7 +160,11 @@ def register_shutdown_event(
 
     @app.on_event("shutdown")
     async def _shutdown() -> None:  # noqa: WPS430
+        await _stop_replica_checks(app)
         await app.state.db_engine.dispose()
+        await shutdown_cache(app)
+        # write the messages still queued for the writer thread
+        stop_log_writers()
 
         pass  # noqa: WPS420
 
@@ -0,0 +1,13 @@
+from typing import Any
+
+from fastapi.responses import UJSONResponse
+
+from interview_tracker.services.metrics.timing import timed
+
+
+class TimedUJSONResponse(UJSONResponse):
+    """UJSONResponse counting its encoding in the serialize phase."""
+
+    def render(self, content: Any) -> bytes:
+        with timed("serialize"):
+            return super().render(content)